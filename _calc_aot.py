@@ -0,0 +1,41 @@
+"""
+_calc_aot.py - Ahead-of-time build of the calculation kernels
+-------------------------------------------------------------
+Compiles the G-J arithmetic from calculations_module into a native
+extension module (claim_calc.pyd / claim_calc.so) with numba.pycc, so the
+app gets compiled kernels without the Numba runtime or JIT warm-up.
+
+Build once (requires numba):
+    python _calc_aot.py
+
+calculations_module picks up claim_calc automatically when it is
+importable and falls back to the JIT / pure-Python kernels otherwise.
+"""
+
+import os
+from numba.pycc import CC
+
+from calculations_module import COUNSELOR_SHARE, GWC_SHARE
+
+cc = CC("claim_calc")
+cc.output_dir = os.path.abspath(os.path.dirname(__file__))
+
+
+@cc.export("calc_one", "UniTuple(f8, 4)(f8, f8, f8)")
+def calc_one(d, e, f):
+    g = d + e + f
+    return g, g * COUNSELOR_SHARE, f - (d + e), g * GWC_SHARE
+
+
+@cc.export("calc_batch", "void(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:])")
+def calc_batch(d, e, f, g, h, i, j):
+    for k in range(d.shape[0]):
+        g[k] = d[k] + e[k] + f[k]
+        h[k] = g[k] * COUNSELOR_SHARE
+        i[k] = f[k] - (d[k] + e[k])
+        j[k] = g[k] * GWC_SHARE
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✅ Built claim_calc in {cc.output_dir}")
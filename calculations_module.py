@@ -16,22 +16,135 @@ IMPORTANT: Provider adjustments (CO codes) are NOT included in patient responsib
 Only PR codes create patient responsibility (copay/deductible).
 """
 
-from typing import Dict, Union, Optional
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, List, Union, Optional
+
+import numpy as np
+
+# Prefer the ahead-of-time compiled kernels (built by _calc_aot.py) when
+# present - Numba is then neither imported nor JIT-compiled
+try:
+    import claim_calc
+    AOT_AVAILABLE = True
+    NUMBA_AVAILABLE = False
+except ImportError:
+    AOT_AVAILABLE = False
+
+    # Numba is optional - the kernels below run as plain Python without it
+    try:
+        from numba import njit, prange
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        NUMBA_AVAILABLE = False
+        prange = range
+
+        def njit(*args, **kwargs):
+            """No-op stand-in for numba.njit when Numba isn't installed."""
+            if len(args) == 1 and callable(args[0]) and not kwargs:
+                return args[0]
+            return lambda func: func
+
+
+# Revenue split of the contracted rate (columns H and J)
+COUNSELOR_SHARE = 0.65
+GWC_SHARE = 0.35
+
+@dataclass(slots=True, frozen=True)
+class ClaimCalc:
+    """Financial results for one claim, as returned by calculate_all()."""
+    contracted_rate: float            # Column G
+    counselor_65_percent: float       # Column H
+    total_payout: float               # Column I
+    gwc_35_percent: float             # Column J
+    client_responsibility: float      # For display
+    calculations_valid: bool
+    missing_fields: tuple = ()
+    warnings: tuple = ()
+    used_fixed_rate: bool = False
+
+    def as_dict(self) -> dict:
+        """Plain-dict form (the pre-ClaimCalc return format of calculate_all)."""
+        result = {f.name: getattr(self, f.name) for f in fields(self)}
+        result["missing_fields"] = list(self.missing_fields)
+        result["warnings"] = list(self.warnings)
+        return result
+
+
+# Characters stripped from currency strings before float() ("$1,234.50")
+_STRIP_TBL = str.maketrans("", "", "$,")
+
+# Values that mean "no amount"
+_SENTINELS = frozenset((None, "", "NOTFOUND", "N/A"))
+
+
+@lru_cache(maxsize=4096)
+def _parse_str(value: str) -> float:
+    """Parse a currency string to float (memoized - the same strings repeat a lot)."""
+    try:
+        return float(value.translate(_STRIP_TBL).strip())
+    except ValueError:
+        return 0.0
 
 
 def safe_float(value: Union[str, float, int]) -> float:
     """Safely convert a value to float. Returns 0.0 if invalid or missing."""
-    if value is None or value in ("", "NOTFOUND", "N/A"):
+    # Exact type checks first - already-parsed numbers are the common case
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if isinstance(value, str):
+        return 0.0 if value in _SENTINELS else _parse_str(value)
+    if value is None:
         return 0.0
     try:
-        if isinstance(value, str):
-            value = value.replace("$", "").replace(",", "").strip()
         return float(value)
     except (ValueError, TypeError):
         return 0.0
 
 
-def calculate_all(data: Dict[str, Union[str, float]]) -> Dict[str, Union[float, str, bool, list]]:
+if AOT_AVAILABLE:
+    _calc_kernel = claim_calc.calc_one
+
+    def _calc_kernel_batch(d, e, f):
+        """Array kernel backed by the AOT-compiled claim_calc.calc_batch."""
+        n = d.shape[0]
+        g, h, i, j = np.empty(n), np.empty(n), np.empty(n), np.empty(n)
+        claim_calc.calc_batch(d, e, f, g, h, i, j)
+        return g, h, i, j
+else:
+    @njit("UniTuple(float64, 4)(float64, float64, float64)", cache=True)
+    def _calc_kernel(d: float, e: float, f: float) -> tuple:
+        """
+        Core arithmetic for one claim: (D, E, F) -> (G, H, I, J).
+        
+        Kept free of strings and dicts so Numba can compile it to machine code.
+        """
+        g = d + e + f            # Contracted rate
+        h = g * COUNSELOR_SHARE  # 65% counselor share
+        i = f - (d + e)          # Amount to counselor
+        j = g * GWC_SHARE        # 35% GWC share
+        return g, h, i, j
+
+    @njit(cache=True, parallel=True)
+    def _calc_kernel_batch(d, e, f):
+        """Array version of _calc_kernel(); loops run in parallel under Numba."""
+        n = d.shape[0]
+        g = np.empty(n)
+        h = np.empty(n)
+        i = np.empty(n)
+        j = np.empty(n)
+        for k in prange(n):
+            g[k] = d[k] + e[k] + f[k]
+            h[k] = g[k] * COUNSELOR_SHARE
+            i[k] = f[k] - (d[k] + e[k])
+            j[k] = g[k] * GWC_SHARE
+        return g, h, i, j
+
+
+def calculate_all(data: Dict[str, Union[str, float]]) -> ClaimCalc:
     """
     Perform all financial calculations for a single claim.
     
@@ -49,7 +162,7 @@ def calculate_all(data: Dict[str, Union[str, float]]) -> Dict[str, Union[float,
             - Insurance Payment: str/float (Column F) - from Paid Amount
     
     Returns:
-        Dictionary with calculated values and validation flags
+        ClaimCalc with calculated values and validation flags
     """
 
     # Extract values with safe conversion
@@ -57,26 +170,45 @@ def calculate_all(data: Dict[str, Union[str, float]]) -> Dict[str, Union[float,
     deductible = safe_float(data.get("Deductible"))
     insurance_payment = safe_float(data.get("Insurance Payment"))
 
-    # === COLUMN G: Contracted Insurance Rate ===
-    # Formula: D + E + F
-    # This is the total allowed amount per insurance contract
-    contracted_rate = copay + deductible + insurance_payment
+    # === COLUMNS G-J ===
+    # G: Contracted Insurance Rate = D + E + F (total allowed per contract)
+    # H: 65% Counselor Contracted Rate = G × 0.65 (for reference)
+    # I: Amount to Counselor = F - (D + E) (ACTUAL payout after patient responsibility)
+    # J: 35% GWC Share = G × 0.35 (GWC's portion)
+    contracted_rate, counselor_65_percent, amount_to_counselor, gwc_35_percent = _calc_kernel(
+        copay, deductible, insurance_payment
+    )
 
-    # === COLUMN H: 65% Counselor Contracted Rate ===
-    # This is 65% of the contracted rate (for reference)
-    counselor_65_percent = contracted_rate * 0.65
+    # === Validation Checks ===
+    missing_fields, warnings = _build_warnings(
+        insurance_payment,
+        copay + deductible,
+        contracted_rate,
+        amount_to_counselor,
+    )
+    
+    # Calculations are valid if we have an insurance payment
+    calculations_valid = insurance_payment > 0
 
-    # === COLUMN I: Amount to Counselor (copay and deductible subtracted) ===
-    # Formula: F - (D + E)
-    # This is the ACTUAL payout after patient responsibility is removed
-    # This is what the counselor actually receives
-    amount_to_counselor = insurance_payment - (copay + deductible)
+    return ClaimCalc(
+        contracted_rate=contracted_rate,              # Column G
+        counselor_65_percent=counselor_65_percent,    # Column H
+        total_payout=amount_to_counselor,             # Column I
+        gwc_35_percent=gwc_35_percent,                # Column J
+        client_responsibility=copay + deductible,     # For display
+        calculations_valid=calculations_valid,
+        missing_fields=missing_fields,
+        warnings=warnings,
+    )
 
-    # === COLUMN J: 35% GWC Share ===
-    # This is 35% of the contracted rate (GWC's portion)
-    gwc_35_percent = contracted_rate * 0.35
 
-    # === Validation Checks ===
+def _build_warnings(
+    insurance_payment: float,
+    patient_responsibility: float,
+    contracted_rate: float,
+    amount_to_counselor: float
+) -> tuple:
+    """Build the missing-field list and warning strings for one claim."""
     missing_fields = []
     warnings = []
     
@@ -89,7 +221,7 @@ def calculate_all(data: Dict[str, Union[str, float]]) -> Dict[str, Union[float,
     if amount_to_counselor < 0:
         warnings.append(
             f"Negative payout: ${amount_to_counselor:.2f} "
-            f"(Insurance ${insurance_payment:.2f} - Patient Responsibility ${copay + deductible:.2f})"
+            f"(Insurance ${insurance_payment:.2f} - Patient Responsibility ${patient_responsibility:.2f})"
         )
     
     # Check if contracted rate seems too low
@@ -99,90 +231,174 @@ def calculate_all(data: Dict[str, Union[str, float]]) -> Dict[str, Union[float,
         )
     
     # Check if copay + deductible exceeds insurance payment (unusual but can happen)
-    if (copay + deductible) > insurance_payment and insurance_payment > 0:
+    if patient_responsibility > insurance_payment and insurance_payment > 0:
         warnings.append(
-            f"Patient responsibility (${copay + deductible:.2f}) exceeds insurance payment (${insurance_payment:.2f})"
+            f"Patient responsibility (${patient_responsibility:.2f}) exceeds insurance payment (${insurance_payment:.2f})"
         )
     
-    # Calculations are valid if we have an insurance payment
-    calculations_valid = insurance_payment > 0
+    return tuple(missing_fields), tuple(warnings)
 
+
+def calculate_all_batch(
+    copays: np.ndarray,
+    deductibles: np.ndarray,
+    insurance_payments: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized version of calculate_all() over whole columns of claims.
+    
+    Takes the D, E and F columns as parallel float64 arrays and computes
+    G, H, I and J as whole-array expressions, plus boolean masks for each
+    warning condition so callers only format text for flagged rows.
+    
+    Args:
+        copays: Column D values (float64 array)
+        deductibles: Column E values (float64 array)
+        insurance_payments: Column F values (float64 array)
+    
+    Returns:
+        Dictionary of arrays, one entry per output column / warning mask
+    """
+    patient_responsibility = copays + deductibles
+    
+    if NUMBA_AVAILABLE or AOT_AVAILABLE:
+        contracted_rate, counselor_65, amount_to_counselor, gwc_35 = _calc_kernel_batch(
+            copays, deductibles, insurance_payments
+        )
+    else:
+        contracted_rate = copays + deductibles + insurance_payments
+        amount_to_counselor = insurance_payments - patient_responsibility
+        counselor_65 = contracted_rate * COUNSELOR_SHARE
+        gwc_35 = contracted_rate * GWC_SHARE
+    
     return {
-        "contracted_rate": contracted_rate,           # Column G
-        "counselor_65_percent": counselor_65_percent, # Column H
-        "total_payout": amount_to_counselor,          # Column I
-        "gwc_35_percent": gwc_35_percent,             # Column J
-        "client_responsibility": copay + deductible,   # For display
-        "calculations_valid": calculations_valid,
-        "missing_fields": missing_fields,
-        "warnings": warnings,
-        "used_fixed_rate": False
+        "contracted_rate": contracted_rate,                    # Column G
+        "counselor_65_percent": counselor_65,                  # Column H
+        "total_payout": amount_to_counselor,                   # Column I
+        "gwc_35_percent": gwc_35,                              # Column J
+        "client_responsibility": patient_responsibility,
+        "calculations_valid": insurance_payments > 0,
+        # Warning masks
+        "missing_payment": insurance_payments == 0,
+        "negative_payout": amount_to_counselor < 0,
+        "low_rate": (contracted_rate < 50) & (contracted_rate > 0),
+        "pr_exceeds": (patient_responsibility > insurance_payments) & (insurance_payments > 0),
     }
 
 
+def calculate_all_many(claims: List[Dict[str, Union[str, float]]]) -> List[ClaimCalc]:
+    """
+    Run calculate_all() for a whole batch of claims in one vectorized pass.
+    
+    Returns one ClaimCalc per claim, identical to what calculate_all()
+    would return for that claim on its own.
+    """
+    n = len(claims)
+    copays = np.fromiter((safe_float(c.get("Copay")) for c in claims), dtype=np.float64, count=n)
+    deductibles = np.fromiter((safe_float(c.get("Deductible")) for c in claims), dtype=np.float64, count=n)
+    insurance = np.fromiter((safe_float(c.get("Insurance Payment")) for c in claims), dtype=np.float64, count=n)
+    
+    cols = calculate_all_batch(copays, deductibles, insurance)
+    
+    # Only rows with at least one warning condition need string formatting
+    flagged = cols["missing_payment"] | cols["negative_payout"] | cols["low_rate"] | cols["pr_exceeds"]
+    
+    contracted = cols["contracted_rate"].tolist()
+    counselor_65 = cols["counselor_65_percent"].tolist()
+    payout = cols["total_payout"].tolist()
+    gwc_35 = cols["gwc_35_percent"].tolist()
+    patient = cols["client_responsibility"].tolist()
+    valid = cols["calculations_valid"].tolist()
+    insurance_list = insurance.tolist()
+    
+    results = []
+    for i, needs_warnings in enumerate(flagged.tolist()):
+        if needs_warnings:
+            missing_fields, warnings = _build_warnings(insurance_list[i], patient[i], contracted[i], payout[i])
+        else:
+            missing_fields, warnings = (), ()
+        
+        results.append(ClaimCalc(
+            contracted_rate=contracted[i],
+            counselor_65_percent=counselor_65[i],
+            total_payout=payout[i],
+            gwc_35_percent=gwc_35[i],
+            client_responsibility=patient[i],
+            calculations_valid=valid[i],
+            missing_fields=missing_fields,
+            warnings=warnings,
+        ))
+    
+    return results
+
+
+# Formatted strings for recently seen amounts (bounded)
+_FMT_CACHE: Dict[float, str] = {0.0: "$0.00"}
+
+
 def format_currency(value: Optional[float]) -> str:
     """Format a numeric value as currency."""
     if value is None:
         return "N/A"
+    cached = _FMT_CACHE.get(value)
+    if cached is not None:
+        return cached
     try:
-        return f"${value:,.2f}"
+        formatted = f"${value:,.2f}"
     except Exception:
         return str(value)
+    if len(_FMT_CACHE) < 1024:
+        _FMT_CACHE[value] = formatted
+    return formatted
 
 
 def get_calculation_report(
     data: Dict[str, Union[str, float]],
-    results: Dict[str, Union[float, str, bool, list]]
+    results: ClaimCalc
 ) -> str:
     """
     Generate a human-readable calculation report for debugging.
     
     Args:
         data: Original claim data dictionary
-        results: Dictionary returned from calculate_all()
+        results: ClaimCalc returned from calculate_all()
     
     Returns:
         Formatted string explaining the calculations
     """
-    lines = ["=== Claim Financial Summary ===", ""]
-    
-    # Input values
-    lines.append("INPUT VALUES:")
-    lines.append(f"  D - Copay (Patient Payment): {data.get('Copay', 'N/A')}")
-    lines.append(f"  E - Deductible (Patient Payment): {data.get('Deductible', 'N/A')}")
-    lines.append(f"  F - Insurance Payment: {data.get('Insurance Payment', 'N/A')}")
-    lines.append("")
-    
-    # Calculation formula
-    lines.append("FORMULAS:")
-    lines.append("  G = D + E + F (Contracted Rate)")
-    lines.append("  H = G × 0.65 (65% Counselor Share)")
-    lines.append("  I = F - (D + E) (Amount to Counselor)")
-    lines.append("  J = G × 0.35 (35% GWC Share)")
-    lines.append("")
-    
-    # Calculated values
-    lines.append("CALCULATED VALUES:")
-    lines.append(f"  G - Contracted Insurance Rate: {format_currency(results['contracted_rate'])}")
-    lines.append(f"  H - 65% Counselor Share: {format_currency(results['counselor_65_percent'])}")
-    lines.append(f"  I - Amount to Counselor: {format_currency(results['total_payout'])}")
-    lines.append(f"  J - 35% to GWC: {format_currency(results['gwc_35_percent'])}")
-    
-    # Warnings
-    if results.get("warnings"):
-        lines.append("")
-        lines.append("⚠️  WARNINGS:")
-        for warning in results["warnings"]:
-            lines.append(f"    • {warning}")
-    
-    # Validation status
-    if not results["calculations_valid"]:
-        lines.append("")
-        lines.append("❌ VALIDATION FAILED")
-        if results["missing_fields"]:
-            lines.append("    Missing: " + ", ".join(results["missing_fields"]))
+    warnings = results.warnings
+    invalid = not results.calculations_valid
+    missing = results.missing_fields if invalid else ()
     
-    return "\n".join(lines)
+    return "\n".join((
+        "=== Claim Financial Summary ===",
+        "",
+        # Input values
+        "INPUT VALUES:",
+        f"  D - Copay (Patient Payment): {data.get('Copay', 'N/A')}",
+        f"  E - Deductible (Patient Payment): {data.get('Deductible', 'N/A')}",
+        f"  F - Insurance Payment: {data.get('Insurance Payment', 'N/A')}",
+        "",
+        # Calculation formula
+        "FORMULAS:",
+        "  G = D + E + F (Contracted Rate)",
+        "  H = G × 0.65 (65% Counselor Share)",
+        "  I = F - (D + E) (Amount to Counselor)",
+        "  J = G × 0.35 (35% GWC Share)",
+        "",
+        # Calculated values
+        "CALCULATED VALUES:",
+        f"  G - Contracted Insurance Rate: {format_currency(results.contracted_rate)}",
+        f"  H - 65% Counselor Share: {format_currency(results.counselor_65_percent)}",
+        f"  I - Amount to Counselor: {format_currency(results.total_payout)}",
+        f"  J - 35% to GWC: {format_currency(results.gwc_35_percent)}",
+        # Warnings
+        *(("", "⚠️  WARNINGS:") if warnings else ()),
+        *(f"    • {warning}" for warning in warnings),
+        # Validation status
+        *(("", "❌ VALIDATION FAILED") if invalid else ()),
+        *(("    Missing: " + ", ".join(missing),) if missing else ()),
+    ))
 
 
 # ============================================================================
@@ -8,16 +8,41 @@ from CO codes (provider write-offs) to prevent double-counting.
 """
 
 import os
-from typing import Dict, List, Optional
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
-# Import all processing modules
-import ocr_module
+# Import the lightweight processing modules. ocr_module (OpenCV/Tesseract),
+# excel_module (openpyxl) and word_module (python-docx) are imported on
+# first use - they dominate startup time.
 import claim_validator
 import calculations_module
-import excel_module
-import word_module
 import remark_code_mapper
 
+logger = logging.getLogger(__name__)
+
+# Winning source in the patient-responsibility cascade
+_PR_NONE = 0
+_PR_COPAY_OVERRIDE = 1
+_PR_DEDUCTIBLE_OVERRIDE = 2
+_PR_COPAY = 3
+_PR_DEDUCTIBLE = 4
+_PR_COINSURANCE = 5
+_PR_PATIENT_AMOUNT = 6
+
+# process_claim() may run on several GUI worker threads at once; exports
+# append to the counselor's Excel/Word files, so only one runs at a time
+_EXPORT_LOCK = threading.Lock()
+
+# Most recent OCR results by image digest, in front of the on-disk cache,
+# so re-dropping a screenshot in the same session is a dict lookup
+_OCR_MEMO: "OrderedDict[str, Dict]" = OrderedDict()
+_OCR_MEMO_SIZE = 64
+_OCR_MEMO_LOCK = threading.Lock()
+
 
 def process_claim(
     image_path: str,
@@ -25,7 +50,8 @@ def process_claim(
     counselor: str = None,
     insurance: str = None,
     copay: str = None,
-    deductible: str = None
+    deductible: str = None,
+    digest: str = None
 ) -> Dict:
     """
     Main processing function that orchestrates the entire claim workflow.
@@ -37,35 +63,27 @@ def process_claim(
         insurance: Insurance company name (optional - can override OCR)
         copay: Manual copay override (optional)
         deductible: Manual deductible override (optional)
+        digest: utils.file_digest() of the image, if the caller already has it
     
     Returns:
         Dictionary with:
             - success: bool
             - message: str (error message if failed)
             - data: dict (extracted claim data)
-            - calculations: dict (financial calculations)
+            - calculations: ClaimCalc (financial calculations)
             - validation: dict (validation results)
     """
     
     try:
         # Validate inputs
-        if not counselor:
-            return {
-                "success": False,
-                "message": "Counselor selection is required"
-            }
+        input_error = _check_inputs(image_path, counselor)
+        if input_error:
+            return input_error
         
-        if not os.path.exists(image_path):
-            return {
-                "success": False,
-                "message": f"Image file not found: {image_path}"
-            }
-        
-        # ═══════════════════════════════════════════════════════════
-        # STEP 1: OCR EXTRACTION
-        # ═══════════════════════════════════════════════════════════
-        print(f"[1/5] Running OCR on {os.path.basename(image_path)}...")
-        ocr_data = ocr_module.extract_claim(image_path)
+        # Steps 1-4: OCR, remark codes, overrides, validation
+        ocr_data, remark_mapping, validation_results = _prepare_claim(
+            image_path, insurance, copay, deductible, digest
+        )
         
         if not ocr_data:
             return {
@@ -74,131 +92,445 @@ def process_claim(
             }
         
         # ═══════════════════════════════════════════════════════════
-        # STEP 2: REMARK CODE PROCESSING (CRITICAL FIX)
-        # ═══════════════════════════════════════════════════════════
-        print("[2/5] Processing remark codes...")
-        
-        remarks = ocr_data.get("Remarks", "")
-        patient_amount = ocr_data.get("Patient Amount", ocr_data.get("Client Responsibility", ""))
-        adjustment_amount = ocr_data.get("Adjustments Amount", ocr_data.get("Adjustments", ""))
-        
-        # Map remark codes to financial categories
-        remark_mapping = remark_code_mapper.map_remark_codes(
-            remarks,
-            patient_amount,
-            adjustment_amount
-        )
-        
-        # ═══════════════════════════════════════════════════════════
-        # CRITICAL FIX: Separate PR codes from CO codes
+        # STEP 5: FINANCIAL CALCULATIONS
         # ═══════════════════════════════════════════════════════════
+        logger.info("💰 Calculating financial breakdown...")
         
-        # Initialize with zeros
-        ocr_data["Copay"] = "0"
-        ocr_data["Deductible"] = "0"
-        
-        # Check for manual overrides FIRST
-        if copay:
-            ocr_data["Copay"] = copay
-            print(f"   ✓ Manual copay override: ${copay}")
-        elif deductible:
-            ocr_data["Deductible"] = deductible
-            print(f"   ✓ Manual deductible override: ${deductible}")
-        else:
-            # Use remark code logic ONLY if no manual overrides
-            if remark_mapping.get("copay"):
-                # PR-3 or PR-2: Patient Amount goes to Copay
-                ocr_data["Copay"] = remark_mapping["copay"]
-                print(f"   → PR-3/PR-2 found: Copay = ${remark_mapping['copay']}")
-            
-            elif remark_mapping.get("deductible"):
-                # PR-1 or PR-140: Patient Amount goes to Deductible
-                ocr_data["Deductible"] = remark_mapping["deductible"]
-                print(f"   → PR-1/PR-140 found: Deductible = ${remark_mapping['deductible']}")
-            
-            elif remark_mapping.get("coinsurance"):
-                # PR-2 (coinsurance): Goes to Copay column
-                ocr_data["Copay"] = remark_mapping["coinsurance"]
-                print(f"   → PR-2 (coinsurance) found: Copay = ${remark_mapping['coinsurance']}")
-            
-            else:
-                # No PR codes found - check if there's a patient amount
-                if patient_amount and patient_amount != "NOTFOUND":
-                    try:
-                        # Clean and parse patient amount
-                        clean_amt = patient_amount.replace('$', '').replace(',', '').replace('(', '').replace(')', '').strip()
-                        patient_amt = float(clean_amt)
-                        
-                        if patient_amt > 0:
-                            # Patient amount exists but no PR code - default to copay
-                            ocr_data["Copay"] = clean_amt
-                            print(f"   ⚠️  Patient Amount ${patient_amt} found but NO PR code - defaulting to Copay")
-                        else:
-                            print(f"   ✓ Patient Amount is $0 - No copay or deductible")
-                    except (ValueError, TypeError):
-                        print(f"   ⚠️  Could not parse Patient Amount: {patient_amount}")
+        # Print the values being used
+        logger.info("   Copay (D): $%s", ocr_data.get('Copay', 0))
+        logger.info("   Deductible (E): $%s", ocr_data.get('Deductible', 0))
+        logger.info("   Insurance Payment (F): $%s", ocr_data.get('Insurance Payment', 0))
         
-        # ═══════════════════════════════════════════════════════════
-        # LOG PROVIDER ADJUSTMENTS (CO codes) - NOT added to patient responsibility
-        # ═══════════════════════════════════════════════════════════
-        if remark_mapping.get("provider_adjustment"):
-            co_amount = remark_mapping["provider_adjustment"]
-            print(f"   → CO code found: Provider write-off = ${co_amount}")
-            print(f"      (This is NOT added to patient responsibility)")
-            
-            # Store for reference but don't use in calculations
-            ocr_data["Provider Adjustment"] = co_amount
-            ocr_data["CO Codes"] = ", ".join([c for c in remark_mapping.get("codes_found", []) if c.startswith("CO-")])
+        calculations = calculations_module.calculate_all(ocr_data)
         
-        # ═══════════════════════════════════════════════════════════
-        # STEP 3: APPLY ADDITIONAL MANUAL OVERRIDES
-        # ═══════════════════════════════════════════════════════════
-        print("[3/5] Applying additional overrides...")
+        _print_calculations(calculations)
         
-        # Override insurance if provided
-        if insurance:
-            ocr_data["Insurance"] = insurance
-            print(f"   → Insurance override: {insurance}")
-        elif "Insurance" not in ocr_data or not ocr_data["Insurance"]:
-            ocr_data["Insurance"] = ""
+        # Steps 6-7: Excel + Word export
+        _export_claim(counselor, ocr_data, calculations, image_path)
         
         # ═══════════════════════════════════════════════════════════
-        # STEP 4: VALIDATION
+        # SUCCESS - RETURN RESULTS
         # ═══════════════════════════════════════════════════════════
-        print("[4/5] Validating claim data...")
+        logger.info("✅ Processing complete!")
         
-        validation_results = claim_validator.validate_claim(ocr_data)
-        
-        # Log validation warnings (non-blocking)
-        if validation_results.get("warnings"):
-            print("\n⚠️  VALIDATION WARNINGS:")
-            for warning in validation_results["warnings"]:
-                print(f"   • {warning}")
-        
-        # ═══════════════════════════════════════════════════════════
-        # STEP 5: FINANCIAL CALCULATIONS
-        # ═══════════════════════════════════════════════════════════
-        print("\n💰 Calculating financial breakdown...")
+        return _success_result(ocr_data, calculations, validation_results, remark_mapping)
         
-        # Print the values being used
-        print(f"   Copay (D): ${ocr_data.get('Copay', 0)}")
-        print(f"   Deductible (E): ${ocr_data.get('Deductible', 0)}")
-        print(f"   Insurance Payment (F): ${ocr_data.get('Insurance Payment', 0)}")
+    except Exception as e:
+        return _failure_result(e)
+
+
+def _check_inputs(image_path: str, counselor: str) -> Optional[Dict]:
+    """Return a failure result if the inputs are unusable, else None."""
+    if not counselor:
+        return {
+            "success": False,
+            "message": "Counselor selection is required"
+        }
+    
+    if not os.path.exists(image_path):
+        return {
+            "success": False,
+            "message": f"Image file not found: {image_path}"
+        }
+    
+    return None
+
+
+def _prepare_claim(
+    image_path: str,
+    insurance: str = None,
+    copay: str = None,
+    deductible: str = None,
+    digest: str = None
+) -> Tuple[Optional[Dict], Optional[Dict], Optional[Dict]]:
+    """
+    Run OCR, remark-code mapping, manual overrides and validation.
+    
+    Returns:
+        Tuple of (ocr_data, remark_mapping, validation_results).
+        ocr_data is None if OCR returned nothing.
+    """
+    ocr_data, remark_mapping = _ocr_and_map(image_path, digest)
+    
+    if not ocr_data:
+        return None, None, None
+    
+    _apply_patient_responsibility(ocr_data, remark_mapping, copay, deductible)
+    
+    validation_results = _finalize_claim(ocr_data, remark_mapping, insurance)
+    
+    return ocr_data, remark_mapping, validation_results
+
+
+def _ocr_and_map(image_path: str, digest: str = None) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Run OCR and remark-code mapping for one claim.
+    
+    Returns:
+        Tuple of (ocr_data, remark_mapping); (None, None) if OCR returned nothing.
+    """
+    # ═══════════════════════════════════════════════════════════
+    # STEP 1: OCR EXTRACTION
+    # ═══════════════════════════════════════════════════════════
+    logger.info("[1/5] Running OCR on %s...", os.path.basename(image_path))
+    ocr_data = _extract_claim_cached(image_path, digest)
+    
+    if not ocr_data:
+        return None, None
+    
+    return ocr_data, _map_remarks(ocr_data)
+
+
+def _map_remarks(ocr_data: Dict) -> Dict:
+    """Map a claim's remark codes to financial categories."""
+    # ═══════════════════════════════════════════════════════════
+    # STEP 2: REMARK CODE PROCESSING (CRITICAL FIX)
+    # ═══════════════════════════════════════════════════════════
+    logger.info("[2/5] Processing remark codes...")
+    
+    remarks = ocr_data.get("Remarks", "")
+    patient_amount = ocr_data.get("Patient Amount", ocr_data.get("Client Responsibility", ""))
+    adjustment_amount = ocr_data.get("Adjustments Amount", ocr_data.get("Adjustments", ""))
+    
+    # Map remark codes to financial categories
+    return remark_code_mapper.map_remark_codes(
+        remarks,
+        patient_amount,
+        adjustment_amount
+    )
+
+
+def _extract_claim_cached(image_path: str, digest: str = None) -> Optional[Dict]:
+    """
+    ocr_module.extract_claim() memoized on the image's content hash.
+    
+    Results are stored as JSON in config.OCR_CACHE_DIR, so re-running a
+    batch over the same screenshots skips OCR entirely, and the last
+    _OCR_MEMO_SIZE results are also kept in memory. Failed reads (no OCR
+    text, nothing parsed, or no patient name - e.g. Tesseract missing or
+    Ollama down) are never cached, so they're retried next time; the key
+    includes config.OCR_CACHE_VERSION and the OCR preprocessing flags, so
+    parser or setting changes aren't masked by stale entries. Callers get
+    their own copy (the pipeline edits it).
+    
+    digest is the image's utils.file_digest(), when the caller already
+    computed it (the GUI hashes files as they're dropped).
+    """
+    key = _ocr_cache_key(image_path, digest)
+    ocr_data = _cached_ocr(key)
+    if ocr_data is None:
+        import ocr_module
+        ocr_data = ocr_module.extract_claim(image_path)
+        _store_ocr(key, ocr_data)
+    return ocr_data
+
+
+def _extract_claims_cached(image_paths: List[str]) -> List[Dict]:
+    """
+    _extract_claim_cached() for several images: the cache misses are OCR'd
+    together by ocr_module.extract_claims_batch().
+    """
+    keys = [_ocr_cache_key(image_path) for image_path in image_paths]
+    found = [_cached_ocr(key) for key in keys]
+    misses = [i for i, ocr_data in enumerate(found) if ocr_data is None]
+    if misses:
+        import ocr_module
+        extracted = ocr_module.extract_claims_batch([image_paths[i] for i in misses])
+        for i, ocr_data in zip(misses, extracted):
+            _store_ocr(keys[i], ocr_data)
+            found[i] = ocr_data
+    return found
+
+
+def _ocr_cache_key(image_path: str, digest: str = None) -> str:
+    """OCR cache key: content hash, cache version and preprocessing flags."""
+    import config
+    import utils
+    
+    return (
+        f"{digest or utils.file_digest(image_path)}-v{config.OCR_CACHE_VERSION}"
+        f"-d{int(config.OCR_AGGRESSIVE_DENOISE)}m{int(config.OCR_MORPH_CLEANUP)}"
+    )
+
+
+def _cached_ocr(key: str) -> Optional[Dict]:
+    """The cached OCR result for key (memory, then disk), or None on a miss."""
+    import config
+    
+    with _OCR_MEMO_LOCK:
+        cached = _OCR_MEMO.get(key)
+        if cached is not None:
+            _OCR_MEMO.move_to_end(key)
+    if cached is not None:
+        logger.info("   ✓ OCR memory cache hit (%s)", key)
+        return dict(cached)
+    
+    cache_path = os.path.join(config.OCR_CACHE_DIR, f"{key}.json")
+    
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                logger.info("   ✓ OCR cache hit (%s)", key)
+                ocr_data = json.load(f)
+            _remember_ocr(key, ocr_data)
+            return ocr_data
+        except (OSError, ValueError) as e:
+            logger.warning("   ⚠️  Ignoring unreadable OCR cache entry %s: %s", key, e)
+    return None
+
+
+def _store_ocr(key: str, ocr_data: Dict) -> None:
+    """Cache a fresh OCR result in memory and on disk, if it's worth keeping."""
+    import config
+    
+    if not _is_cacheable(ocr_data):
+        return
+    _remember_ocr(key, ocr_data)
+    cache_path = os.path.join(config.OCR_CACHE_DIR, f"{key}.json")
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(ocr_data, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("   ⚠️  Could not write OCR cache entry: %s", e)
+
+
+def _is_cacheable(ocr_data: Optional[Dict]) -> bool:
+    """
+    True if an OCR result is worth keeping: extract_claim() never returns
+    an empty dict - a failure is an all-NOTFOUND claim, often with no text.
+    """
+    if not ocr_data or not ocr_data.get("RawText", "").strip():
+        return False
+    if ocr_data.get("Client", "NOTFOUND") == "NOTFOUND":
+        return False
+    return any(
+        value not in ("NOTFOUND", "", "0")
+        for field, value in ocr_data.items()
+        if field not in ("RawText", "Client")
+    )
+
+
+def _remember_ocr(key: str, ocr_data: Dict) -> None:
+    """Keep a copy of an OCR result in the in-memory LRU (evicting the oldest)."""
+    with _OCR_MEMO_LOCK:
+        _OCR_MEMO[key] = dict(ocr_data)
+        _OCR_MEMO.move_to_end(key)
+        if len(_OCR_MEMO) > _OCR_MEMO_SIZE:
+            _OCR_MEMO.popitem(last=False)
+
+
+def _apply_patient_responsibility(
+    ocr_data: Dict,
+    remark_mapping: Dict,
+    copay: str = None,
+    deductible: str = None
+) -> None:
+    """Fill Copay/Deductible from manual overrides, PR codes or Patient Amount."""
+    patient_amount = ocr_data.get("Patient Amount", ocr_data.get("Client Responsibility", ""))
+    
+    # ═══════════════════════════════════════════════════════════
+    # CRITICAL FIX: Separate PR codes from CO codes
+    # ═══════════════════════════════════════════════════════════
+    
+    # Initialize with zeros
+    ocr_data["Copay"] = "0"
+    ocr_data["Deductible"] = "0"
+    
+    # Check for manual overrides FIRST
+    if copay:
+        ocr_data["Copay"] = copay
+        logger.info("   ✓ Manual copay override: $%s", copay)
+    elif deductible:
+        ocr_data["Deductible"] = deductible
+        logger.info("   ✓ Manual deductible override: $%s", deductible)
+    else:
+        # Use remark code logic ONLY if no manual overrides
+        if remark_mapping.get("copay"):
+            # PR-3 or PR-2: Patient Amount goes to Copay
+            ocr_data["Copay"] = remark_mapping["copay"]
+            logger.info("   → PR-3/PR-2 found: Copay = $%s", remark_mapping['copay'])
         
-        calculations = calculations_module.calculate_all(ocr_data)
+        elif remark_mapping.get("deductible"):
+            # PR-1 or PR-140: Patient Amount goes to Deductible
+            ocr_data["Deductible"] = remark_mapping["deductible"]
+            logger.info("   → PR-1/PR-140 found: Deductible = $%s", remark_mapping['deductible'])
         
-        # Print calculation results
-        print(f"\n   RESULTS:")
-        print(f"   Contracted Rate (G) = D + E + F = ${calculations['contracted_rate']:.2f}")
-        print(f"   65% Counselor Share (H) = ${calculations['counselor_65_percent']:.2f}")
-        print(f"   Amount to Counselor (I) = F - (D + E) = ${calculations['total_payout']:.2f}")
-        print(f"   35% GWC Share (J) = ${calculations['gwc_35_percent']:.2f}")
+        elif remark_mapping.get("coinsurance"):
+            # PR-2 (coinsurance): Goes to Copay column
+            ocr_data["Copay"] = remark_mapping["coinsurance"]
+            logger.info("   → PR-2 (coinsurance) found: Copay = $%s", remark_mapping['coinsurance'])
         
-        # ═══════════════════════════════════════════════════════════
-        # STEP 6: EXPORT TO EXCEL
-        # ═══════════════════════════════════════════════════════════
-        print(f"\n📊 Exporting to Excel: {counselor}.xlsx")
+        else:
+            # No PR codes found - check if there's a patient amount
+            if patient_amount and patient_amount != "NOTFOUND":
+                try:
+                    # Clean and parse patient amount
+                    clean_amt = patient_amount.replace('$', '').replace(',', '').replace('(', '').replace(')', '').strip()
+                    patient_amt = float(clean_amt)
+                    
+                    if patient_amt > 0:
+                        # Patient amount exists but no PR code - default to copay
+                        ocr_data["Copay"] = clean_amt
+                        logger.warning("   ⚠️  Patient Amount $%s found but NO PR code - defaulting to Copay", patient_amt)
+                    else:
+                        logger.info("   ✓ Patient Amount is $0 - No copay or deductible")
+                except (ValueError, TypeError):
+                    logger.warning("   ⚠️  Could not parse Patient Amount: %s", patient_amount)
+
+
+def _apply_patient_responsibility_batch(
+    claims: List[Dict],
+    remark_mappings: List[Dict],
+    copay: str = None,
+    deductible: str = None
+) -> None:
+    """
+    Batch version of _apply_patient_responsibility().
+    
+    The override/PR-code cascade is evaluated for the whole batch at once
+    with np.select, which picks the winning source for every claim; the
+    original strings are then copied into Copay/Deductible so the output
+    is identical to the per-claim version.
+    """
+    import numpy as np
+    
+    n = len(claims)
+    if not n:
+        return
+    
+    patient_amounts = [
+        _parse_patient_amount(c.get("Patient Amount", c.get("Client Responsibility", "")))
+        for c in claims
+    ]
+    
+    has_copay = np.fromiter((bool(m.get("copay")) for m in remark_mappings), dtype=bool, count=n)
+    has_deductible = np.fromiter((bool(m.get("deductible")) for m in remark_mappings), dtype=bool, count=n)
+    has_coinsurance = np.fromiter((bool(m.get("coinsurance")) for m in remark_mappings), dtype=bool, count=n)
+    patient_amt = np.fromiter((amt for _, amt in patient_amounts), dtype=np.float64, count=n)
+    
+    # Same priority order as the per-claim cascade (NaN > 0 is False)
+    source = np.select(
+        [
+            np.full(n, bool(copay)),
+            np.full(n, bool(deductible)),
+            has_copay,
+            has_deductible,
+            has_coinsurance,
+            patient_amt > 0,
+        ],
+        [
+            _PR_COPAY_OVERRIDE,
+            _PR_DEDUCTIBLE_OVERRIDE,
+            _PR_COPAY,
+            _PR_DEDUCTIBLE,
+            _PR_COINSURANCE,
+            _PR_PATIENT_AMOUNT,
+        ],
+        default=_PR_NONE,
+    )
+    
+    for ocr_data, mapping, (clean_amt, _), src in zip(claims, remark_mappings, patient_amounts, source.tolist()):
+        ocr_data["Copay"] = "0"
+        ocr_data["Deductible"] = "0"
+        if src == _PR_COPAY_OVERRIDE:
+            ocr_data["Copay"] = copay
+        elif src == _PR_DEDUCTIBLE_OVERRIDE:
+            ocr_data["Deductible"] = deductible
+        elif src == _PR_COPAY:
+            ocr_data["Copay"] = mapping["copay"]
+        elif src == _PR_DEDUCTIBLE:
+            ocr_data["Deductible"] = mapping["deductible"]
+        elif src == _PR_COINSURANCE:
+            ocr_data["Copay"] = mapping["coinsurance"]
+        elif src == _PR_PATIENT_AMOUNT:
+            ocr_data["Copay"] = clean_amt
+    
+    logger.info("   → Patient responsibility assigned for %d claims (%d defaulted from Patient Amount)",
+                n, int((source == _PR_PATIENT_AMOUNT).sum()))
+
+
+def _parse_patient_amount(patient_amount: str) -> Tuple[str, float]:
+    """Return (cleaned string, value) for a Patient Amount; value is NaN if unusable."""
+    if patient_amount and patient_amount != "NOTFOUND":
+        clean_amt = patient_amount.replace('$', '').replace(',', '').replace('(', '').replace(')', '').strip()
+        try:
+            return clean_amt, float(clean_amt)
+        except (ValueError, TypeError):
+            pass
+    return "", float("nan")
+
+
+def _finalize_claim(ocr_data: Dict, remark_mapping: Dict, insurance: str = None) -> Dict:
+    """Record CO adjustments, apply the insurance override and validate the claim."""
+    _apply_adjustments(ocr_data, remark_mapping, insurance)
+    
+    # ═══════════════════════════════════════════════════════════
+    # STEP 4: VALIDATION
+    # ═══════════════════════════════════════════════════════════
+    logger.info("[4/5] Validating claim data...")
+    
+    validation_results = claim_validator.validate_claim(ocr_data)
+    
+    _log_validation(validation_results)
+    
+    return validation_results
+
+
+def _apply_adjustments(ocr_data: Dict, remark_mapping: Dict, insurance: str = None) -> None:
+    """Record CO adjustments and apply the insurance override."""
+    # ═══════════════════════════════════════════════════════════
+    # LOG PROVIDER ADJUSTMENTS (CO codes) - NOT added to patient responsibility
+    # ═══════════════════════════════════════════════════════════
+    if remark_mapping.get("provider_adjustment"):
+        co_amount = remark_mapping["provider_adjustment"]
+        logger.info("   → CO code found: Provider write-off = $%s", co_amount)
+        logger.info("      (This is NOT added to patient responsibility)")
         
+        # Store for reference but don't use in calculations
+        ocr_data["Provider Adjustment"] = co_amount
+        ocr_data["CO Codes"] = ", ".join([c for c in remark_mapping.get("codes_found", []) if c.startswith("CO-")])
+    
+    # ═══════════════════════════════════════════════════════════
+    # STEP 3: APPLY ADDITIONAL MANUAL OVERRIDES
+    # ═══════════════════════════════════════════════════════════
+    logger.info("[3/5] Applying additional overrides...")
+    
+    # Override insurance if provided
+    if insurance:
+        ocr_data["Insurance"] = insurance
+        logger.info("   → Insurance override: %s", insurance)
+    elif "Insurance" not in ocr_data or not ocr_data["Insurance"]:
+        ocr_data["Insurance"] = ""
+
+
+def _log_validation(validation_results: Dict) -> None:
+    """Log validation warnings (non-blocking)."""
+    if validation_results.get("warnings"):
+        logger.warning("⚠️  VALIDATION WARNINGS:")
+        for warning in validation_results["warnings"]:
+            logger.warning("   • %s", warning)
+
+
+def _print_calculations(calculations: calculations_module.ClaimCalc) -> None:
+    """Print the calculated G-J columns for one claim."""
+    logger.info("   RESULTS:")
+    logger.info("   Contracted Rate (G) = D + E + F = $%.2f", calculations.contracted_rate)
+    logger.info("   65%% Counselor Share (H) = $%.2f", calculations.counselor_65_percent)
+    logger.info("   Amount to Counselor (I) = F - (D + E) = $%.2f", calculations.total_payout)
+    logger.info("   35%% GWC Share (J) = $%.2f", calculations.gwc_35_percent)
+
+
+def _export_claim(counselor: str, ocr_data: Dict, calculations: calculations_module.ClaimCalc, image_path: str) -> None:
+    """Append one processed claim to the counselor's Excel and Word files."""
+    # ═══════════════════════════════════════════════════════════
+    # STEP 6: EXPORT TO EXCEL
+    # ═══════════════════════════════════════════════════════════
+    logger.info("📊 Exporting to Excel: %s.xlsx", counselor)
+    
+    import excel_module
+    with _EXPORT_LOCK:
         excel_module.append_to_excel(
             counselor=counselor,
             data=ocr_data,
@@ -208,38 +540,151 @@ def process_claim(
         # ═══════════════════════════════════════════════════════════
         # STEP 7: EXPORT TO WORD
         # ═══════════════════════════════════════════════════════════
-        print(f"📄 Exporting to Word: {counselor}.docx")
-        
-        word_module.append_to_word(
-            counselor=counselor,
-            data=ocr_data,
-            image_path=image_path
-        )
-        
-        # ═══════════════════════════════════════════════════════════
-        # SUCCESS - RETURN RESULTS
-        # ═══════════════════════════════════════════════════════════
-        print("✅ Processing complete!\n")
-        
+        _export_word(counselor, ocr_data, image_path)
+
+
+def _export_word(counselor: str, ocr_data: Dict, image_path: str, save: bool = True) -> None:
+    """
+    Append one processed claim (with its screenshot) to the counselor's Word file.
+    
+    save=False only queues the entry, for a later word_module.flush().
+    """
+    logger.info("📄 Exporting to Word: %s.docx", counselor)
+    
+    import word_module
+    word_module.append_to_word(
+        counselor=counselor,
+        data=ocr_data,
+        image_path=image_path,
+        save=save
+    )
+
+
+def _success_result(ocr_data: Dict, calculations: calculations_module.ClaimCalc, validation_results: Dict, remark_mapping: Dict) -> Dict:
+    """Build the result dictionary for a successfully processed claim."""
+    return {
+        "success": True,
+        "message": "Claim processed successfully",
+        "data": ocr_data,
+        "calculations": calculations,
+        "validation": validation_results,
+        "remark_mapping": remark_mapping
+    }
+
+
+def _failure_result(e: Exception) -> Dict:
+    """Build the result dictionary for a claim that raised an exception."""
+    # Full traceback only when debugging - formatting it is costly in
+    # batches where many claims fail the same way
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.exception("Claim processing failed")
+    else:
+        logger.error("❌ Claim processing failed: %s", e)
+    
+    return {
+        "success": False,
+        "message": f"Processing failed: {e}"
+    }
+
+
+def _init_batch_worker(workers: int) -> None:
+    """
+    ProcessPoolExecutor initializer: start from the saved LLM name cache,
+    with this worker's share of the Ollama server's parallel slots.
+    """
+    import config
+    import llm_validator
+    
+    # Every worker sends its chunk's name fixes concurrently; split the
+    # slots so all of them together don't queue past the server's limit
+    llm_validator.OLLAMA_NUM_PARALLEL = max(1, llm_validator.OLLAMA_NUM_PARALLEL // workers)
+    
+    llm_validator.load_name_cache(config.LLM_CACHE_JSON)
+    # A forked worker inherits the parent's unsaved names too - those are
+    # the parent's to save, not ours to hand back
+    llm_validator.take_new_names()
+
+
+def _prepare_claims_job(image_paths: List[str], counselor: str) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    Worker-process entry point for batch_process_claims(): one chunk of
+    the batch, OCR'd together by ocr_module.extract_claims_batch().
+    
+    Returns one result per path - a failure result, or {"success": True,
+    "prepared": (ocr_data, remark_mapping)} ready for the batch-wide
+    override/validation step - and the LLM names this job learned, for
+    the parent to merge into its cache.
+    """
+    import llm_validator
+    
+    results = [_check_inputs(image_path, counselor) for image_path in image_paths]
+    todo = [i for i, result in enumerate(results) if result is None]
+    try:
+        extracted = _extract_claims_cached([image_paths[i] for i in todo])
+    except Exception as e:
+        # Redo the chunk claim by claim, so one bad image only fails itself
+        logger.warning("   ⚠️  Batch OCR failed (%s) - retrying per claim", e)
+        for i in todo:
+            results[i] = _prepare_claim_result(image_paths[i], counselor)
+    else:
+        for i, ocr_data in zip(todo, extracted):
+            results[i] = _prepared_result(ocr_data)
+    
+    return results, llm_validator.take_new_names()
+
+
+def _prepared_result(ocr_data: Optional[Dict]) -> Dict:
+    """_prepare_claims_job()'s result for one claim's OCR data."""
+    if not ocr_data:
+        return {
+            "success": False,
+            "message": "OCR extraction failed - no data returned"
+        }
+    try:
         return {
             "success": True,
-            "message": "Claim processed successfully",
-            "data": ocr_data,
-            "calculations": calculations,
-            "validation": validation_results,
-            "remark_mapping": remark_mapping
+            "prepared": (ocr_data, _map_remarks(ocr_data))
         }
-        
     except Exception as e:
-        # Catch any unexpected errors
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"\n❌ FATAL ERROR:\n{error_details}")
+        return _failure_result(e)
+
+
+def _prepare_claim_result(image_path: str, counselor: str) -> Dict:
+    """_prepare_claims_job()'s result for one claim, OCR'd on its own."""
+    try:
+        input_error = _check_inputs(image_path, counselor)
+        if input_error:
+            return input_error
+        
+        ocr_data, remark_mapping = _ocr_and_map(image_path)
+        
+        if not ocr_data:
+            return {
+                "success": False,
+                "message": "OCR extraction failed - no data returned"
+            }
         
         return {
-            "success": False,
-            "message": f"Processing failed: {str(e)}\n\nDetails:\n{error_details}"
+            "success": True,
+            "prepared": (ocr_data, remark_mapping)
         }
+    except Exception as e:
+        return _failure_result(e)
+
+
+def _per_claim(items: List[Tuple], step, results: List[Optional[Dict]]) -> List[Tuple]:
+    """
+    Fallback for a batch-wide step that raised: run step(item) for each
+    claim instead. Returns (item, step result) for the claims that worked;
+    the others get a _failure_result in results (item[0] is the claim index).
+    """
+    done = []
+    for item in items:
+        try:
+            done.append((item, step(item)))
+        except Exception as e:
+            results[item[0]] = _failure_result(e)
+    return done
 
 
 def batch_process_claims(
@@ -253,6 +698,11 @@ def batch_process_claims(
     """
     Process multiple claims in batch.
     
+    OCR and remark mapping run in parallel worker processes (one chunk
+    of the batch per worker, OCR'd together). Copay/Deductible assignment and the financial calculations
+    are then done for the whole batch in vectorized passes, and the
+    results exported sequentially.
+    
     Args:
         image_paths: List of image file paths
         counselors_list: List of valid counselor names
@@ -265,35 +715,135 @@ def batch_process_claims(
         List of result dictionaries (one per claim)
     """
     
-    results = []
+    # Pre-warm the heavy modules once so workers/exports don't pay for them per claim
+    import ocr_module, excel_module, word_module  # noqa: F401
     
-    print(f"\n{'═' * 80}")
-    print(f"BATCH PROCESSING: {len(image_paths)} claims")
-    print(f"{'═' * 80}\n")
+    # Load the LLM model while phase 1 OCRs, so the first name fix doesn't
+    # wait on a cold start (a no-op round trip when it's already loaded)
+    import config
+    import llm_validator
+    threading.Thread(target=llm_validator.warm_up, name="llm-warm-up", daemon=True).start()
     
-    for i, image_path in enumerate(image_paths, 1):
-        print(f"\n[CLAIM {i}/{len(image_paths)}] {os.path.basename(image_path)}")
-        print("─" * 80)
-        
-        result = process_claim(
-            image_path=image_path,
-            counselors_list=counselors_list,
-            counselor=counselor,
-            insurance=insurance,
-            copay=copay,
-            deductible=deductible
+    # The workers' LLM names are merged into this process's cache and
+    # saved with it (loaded first, so saving doesn't drop older names)
+    llm_validator.load_name_cache(config.LLM_CACHE_JSON)
+    
+    total = len(image_paths)
+    results: List[Optional[Dict]] = [None] * total
+    
+    logger.info("═" * 80)
+    logger.info("BATCH PROCESSING: %d claims", total)
+    logger.info("═" * 80)
+    
+    # Phase 1: OCR + remark mapping, one chunk of the batch per worker
+    # process (each chunk's OCR passes run over all its images at once).
+    # Exports stay in this process (phase 3) so only one writer ever
+    # touches the counselor's Excel/Word files.
+    workers = max(1, min(os.cpu_count() or 1, total))
+    chunk_size = -(-total // workers)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_batch_worker, initargs=(workers,)
+    ) as executor:
+        futures = {
+            executor.submit(_prepare_claims_job, image_paths[start:start + chunk_size], counselor): start
+            for start in range(0, total, chunk_size)
+        }
+        for future in as_completed(futures):
+            start = futures[future]
+            indices = range(start, min(start + chunk_size, total))
+            try:
+                chunk_results, names = future.result()
+                llm_validator.merge_names(names)
+            except Exception as e:
+                failure = _failure_result(e)
+                chunk_results = [dict(failure) for _ in indices]
+            for i, result in zip(indices, chunk_results):
+                logger.info("[CLAIM %d/%d] %s extracted", i + 1, total, os.path.basename(image_paths[i]))
+                results[i] = result
+    llm_validator.save_name_cache(config.LLM_CACHE_JSON)
+    
+    extracted = [
+        (i, image_paths[i]) + results[i].pop("prepared")
+        for i in range(total)
+        if results[i].get("success")
+    ]
+    
+    # Copay/Deductible for the whole batch in one vectorized pass. If a
+    # batch-wide step raises, it's redone claim by claim so only the
+    # claims that fail on their own are lost (same below)
+    try:
+        _apply_patient_responsibility_batch(
+            [e[2] for e in extracted], [e[3] for e in extracted], copay, deductible
         )
-        
-        results.append(result)
-        
+    except Exception as e:
+        logger.warning("   ⚠️  Batch patient-responsibility pass failed (%s) - retrying per claim", e)
+        done = _per_claim(
+            extracted, lambda e_: _apply_patient_responsibility(e_[2], e_[3], copay, deductible), results
+        )
+        extracted = [item for item, _ in done]
+    
+    adjusted = []
+    for i, image_path, ocr_data, remark_mapping in extracted:
+        try:
+            _apply_adjustments(ocr_data, remark_mapping, insurance)
+            adjusted.append((i, image_path, ocr_data, remark_mapping))
+        except Exception as e:
+            results[i] = _failure_result(e)
+    
+    # Validation for the whole batch (column-wise numeric checks)
+    try:
+        all_validation = claim_validator.validate_claims([a[2] for a in adjusted])
+    except Exception as e:
+        logger.warning("   ⚠️  Batch validation failed (%s) - retrying per claim", e)
+        done = _per_claim(adjusted, lambda a: claim_validator.validate_claim(a[2]), results)
+        adjusted = [item for item, _ in done]
+        all_validation = [validation for _, validation in done]
+    
+    prepared = []
+    for (i, image_path, ocr_data, remark_mapping), validation_results in zip(adjusted, all_validation):
+        _log_validation(validation_results)
+        prepared.append((i, image_path, ocr_data, remark_mapping, validation_results))
+    
+    # Phase 2: one vectorized calculation pass over all extracted claims
+    # (column arrays are built inside calculate_all_many)
+    try:
+        all_calculations = calculations_module.calculate_all_many([p[2] for p in prepared])
+    except Exception as e:
+        logger.warning("   ⚠️  Batch calculation failed (%s) - retrying per claim", e)
+        done = _per_claim(prepared, lambda p: calculations_module.calculate_all(p[2]), results)
+        prepared = [item for item, _ in done]
+        all_calculations = [calculations for _, calculations in done]
+    claim_rows = [p[2] for p in prepared]
+    
+    # Phase 3: export - one workbook load/save for the whole batch,
+    # then the Word entries (each carries its own screenshot), also
+    # saved once at the end
+    try:
+        logger.info("📊 Exporting %d rows to Excel: %s.xlsx", len(claim_rows), counselor)
+        excel_module.append_rows(counselor, claim_rows, all_calculations)
+    except Exception as e:
+        failure = _failure_result(e)
+        for p in prepared:
+            results[p[0]] = failure
+        prepared = []
+    
+    for (i, image_path, ocr_data, remark_mapping, validation_results), calculations in zip(prepared, all_calculations):
+        try:
+            _export_word(counselor, ocr_data, image_path, save=False)
+            results[i] = _success_result(ocr_data, calculations, validation_results, remark_mapping)
+        except Exception as e:
+            results[i] = _failure_result(e)
+    word_module.flush(counselor)
+    
+    for i, result in enumerate(results, 1):
         if result["success"]:
-            print(f"✅ Claim {i} completed successfully")
+            logger.info("✅ Claim %d completed successfully", i)
         else:
-            print(f"❌ Claim {i} failed: {result['message']}")
+            logger.error("❌ Claim %d failed: %s", i, result['message'])
     
-    print(f"\n{'═' * 80}")
-    print(f"BATCH COMPLETE: {sum(1 for r in results if r['success'])}/{len(results)} successful")
-    print(f"{'═' * 80}\n")
+    logger.info("═" * 80)
+    logger.info("BATCH COMPLETE: %d/%d successful", sum(1 for r in results if r['success']), len(results))
+    logger.info("═" * 80)
     
     return results
 
@@ -305,12 +855,20 @@ def batch_process_claims(
 if __name__ == "__main__":
     import sys
     
+    # --verbose shows the per-step progress log; otherwise only warnings/errors
+    verbose = "--verbose" in sys.argv
+    sys.argv = [arg for arg in sys.argv if arg != "--verbose"]
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format="%(message)s"
+    )
+    
     print("╔" + "═" * 78 + "╗")
     print("║" + " " * 24 + "CLAIM PROCESSOR TEST MODE" + " " * 29 + "║")
     print("╚" + "═" * 78 + "╝\n")
     
     if len(sys.argv) < 2:
-        print("Usage: python claim_processor.py <image_path> [counselor] [insurance]")
+        print("Usage: python claim_processor.py <image_path> [counselor] [insurance] [--verbose]")
         print("\nExample:")
         print("  python claim_processor.py claim_screenshot.png DrSmith Aetna")
         sys.exit(1)
@@ -3,23 +3,135 @@
 Insurance Claim Validator - Standalone OCR Data Rules Checker
 ==============================================================
 Validates OCR-extracted claim data against insurance billing rules.
-Standard library only. No auto-filling - only flags issues.
+Standard library only for single claims; the *_batch helpers use NumPy
+and validate_claims_df() needs pandas.
+No auto-filling - only flags issues.
 
 Author: Insurance Biller Automation Team
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+import re
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple, Optional, Any
+
+# Numba is optional - _finance_kernel runs as plain Python without it
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba isn't installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # Tolerance for floating-point comparison
 EPS = 0.01
 
+# OCR placeholders that mean "no value" (not a parse error)
+_PLACEHOLDERS = frozenset({"", "NOTFOUND", "N/A", "n/a", "notfound", "None"})
+
+# Currency formatting removed before parsing: $ , ( )
+_CURRENCY_TABLE = str.maketrans("", "", "$,()")
+
+# Plain decimal amount after currency cleanup ("-12", "12.", ".50", "+3.25")
+_NUM_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)")
+
+# Required numeric fields
+_REQUIRED_FIELDS = (
+    "Copay",
+    "Deductible",
+    "Insurance Payment",
+    "Contracted Rate",
+    "Paid Amount",
+)
+
+# Optional numeric fields
+_OPTIONAL_FIELDS = (
+    "Patient Amount",
+    "Adjustments Amount",
+)
+
+# (display name, normalized key, required) for every numeric field
+_FIELD_MAP = tuple(
+    (field, field.lower().replace(" ", "_"), field in _REQUIRED_FIELDS)
+    for field in _REQUIRED_FIELDS + _OPTIONAL_FIELDS
+)
+
+
+class NormalizedClaim(NamedTuple):
+    """Parsed numeric fields, in _FIELD_MAP order (None = missing/invalid)."""
+    copay: Optional[float]
+    deductible: Optional[float]
+    insurance_payment: Optional[float]
+    contracted_rate: Optional[float]
+    paid_amount: Optional[float]
+    patient_amount: Optional[float]
+    adjustments_amount: Optional[float]
+
+
+# Remark code categories, as bits (see _scan_remarks)
+_RM_PR1 = 1 << 0        # "PR-1" / "PR-01" anywhere in the remark
+_RM_PR2 = 1 << 1        # "PR-2" / "PR-02"
+_RM_PR3 = 1 << 2        # "PR-3" / "PR-03"
+_RM_PR = 1 << 3         # starts with PR-
+_RM_CO = 1 << 4         # starts with CO-
+_RM_OA_PI = 1 << 5      # starts with OA- or PI-
+
+# PR-1/2/3 codes (searched anywhere in the remark)
+_REMARK_PR_CODE_RE = re.compile(r"PR-0?([123])")
+_PR_CODE_BITS = {"1": _RM_PR1, "2": _RM_PR2, "3": _RM_PR3}
+
+# A warning as structured data; render_warnings() turns it into text.
+# Aggregators (e.g. counting codes across a batch) can skip formatting.
+WarningRecord = namedtuple("WarningRecord", "code values")
+
+_TEMPLATES = {
+    # normalize_numeric_fields
+    "FIELD_PARSE": "{}: {}",
+    # check_financial_logic
+    "PAID_MISMATCH": "Insurance Payment (${:.2f}) does not match Paid Amount (${:.2f})",
+    "COPAY_NEGATIVE": "Copay is negative: ${:.2f}",
+    "DEDUCTIBLE_NEGATIVE": "Deductible is negative: ${:.2f}",
+    "INSURANCE_NEGATIVE": "Insurance Payment is negative: ${:.2f}",
+    "CONTRACTED_MISMATCH": "Contracted Rate (${:.2f}) does not equal Copay + Deductible + Insurance Payment (${:.2f})",
+    "CONTRACTED_MISSING": "Contracted Rate is missing",
+    "PAYOUT_NEGATIVE": "Counselor Payout is negative: ${:.2f} (Insurance Payment ${:.2f} - Patient Responsibility ${:.2f})",
+    "PAYOUT_UNAVAILABLE": "Cannot calculate Counselor Payout: Insurance Payment missing",
+    # check_remarks_logic
+    "PR1_NO_DEDUCTIBLE": "PR-1 (Deductible) present but Deductible is missing or zero",
+    "PR2_NO_PATIENT_AMOUNT": "PR-2 (Coinsurance) present but both Copay and Deductible are zero",
+    "PR3_NO_COPAY": "PR-3 (Copay) present but Copay is missing or zero",
+    "PR_NO_PATIENT_AMOUNT": "Patient Responsibility (PR) codes present but both Copay and Deductible are zero",
+    "CO_ONLY_PATIENT_CHARGED": (
+        "Only CO (Contractual Obligation) codes present, "
+        "but patient responsibility amounts are nonzero. "
+        "Patient should not be charged for contractual adjustments."
+    ),
+    "OA_PI_UNCLEAR": (
+        "OA/PI codes present with patient amounts but no PR codes. "
+        "Patient responsibility is unclear - verify if patient should be charged."
+    ),
+}
+
+# Bits set by _finance_kernel, one per check_financial_logic() warning
+_FIN_PAID_MISMATCH = 1 << 0
+_FIN_COPAY_NEGATIVE = 1 << 1
+_FIN_DEDUCTIBLE_NEGATIVE = 1 << 2
+_FIN_INSURANCE_NEGATIVE = 1 << 3
+_FIN_CONTRACTED_MISMATCH = 1 << 4
+_FIN_PAYOUT_NEGATIVE = 1 << 5
+_FIN_CONTRACTED_MISSING = 1 << 6
+
 
 def safe_float(value: Any) -> Tuple[Optional[float], Optional[str]]:
     """
     Safely parse a value to float, handling common OCR formats.
     
     Accepts: numbers, "$1,234.56", "1234.56", etc.
-    Rejects: "NOTFOUND", None, empty strings, non-numeric text
+    Rejects: placeholders ("NOTFOUND", "N/A", ...), None, empty strings, non-numeric text
     
     Args:
         value: Any value from OCR data (str, int, float, None)
@@ -32,32 +144,42 @@ def safe_float(value: Any) -> Tuple[Optional[float], Optional[str]]:
         safe_float("NOTFOUND") -> (None, "Invalid value: NOTFOUND")
         safe_float(125.0) -> (125.0, None)
     """
-    # Handle None, empty, or placeholder values
-    if value is None or value == "" or value == "NOTFOUND" or value == "N/A":
+    # String conversion (memoized - OCR repeats the same tokens a lot)
+    if isinstance(value, str):
+        return _parse_str_cached(value)
+    
+    # Handle None
+    if value is None:
         return None, None
     
     # Already a number
     if isinstance(value, (int, float)):
         return float(value), None
     
-    # String conversion
-    if isinstance(value, str):
-        # Remove common currency formatting
-        cleaned = value.strip().replace("$", "").replace(",", "").replace("(", "").replace(")", "")
-        
-        if not cleaned:
-            return None, None
-        
-        try:
-            return float(cleaned), None
-        except ValueError:
-            return None, f"Invalid numeric value: {value}"
-    
     # Unexpected type
     return None, f"Unexpected value type: {type(value).__name__}"
 
 
-def normalize_numeric_fields(data: Dict[str, Any]) -> Tuple[Dict[str, Optional[float]], List[str]]:
+@lru_cache(maxsize=4096)
+def _parse_str_cached(value: str) -> Tuple[Optional[float], Optional[str]]:
+    """String branch of safe_float(); results are immutable tuples, safe to share."""
+    # Handle empty or placeholder values
+    if value in _PLACEHOLDERS:
+        return None, None
+    
+    # Remove common currency formatting (then the spaces it leaves: "$ 25.00")
+    cleaned = value.translate(_CURRENCY_TABLE).strip()
+    
+    if not cleaned:
+        return None, None
+    
+    # Pre-test instead of try/except: junk OCR text is common here
+    if _NUM_RE.fullmatch(cleaned):
+        return float(cleaned), None
+    return None, f"Invalid numeric value: {value}"
+
+
+def normalize_numeric_fields(data: Dict[str, Any]) -> Tuple[NormalizedClaim, List[WarningRecord]]:
     """
     Extract and normalize all numeric fields from OCR data.
     
@@ -68,47 +190,96 @@ def normalize_numeric_fields(data: Dict[str, Any]) -> Tuple[Dict[str, Optional[f
         data: Dictionary with OCR-extracted claim data
     
     Returns:
-        Tuple of (normalized_dict, warnings_list)
-        - normalized_dict: Keys are field names, values are floats or None
-        - warnings_list: Human-readable warnings for parsing issues
+        Tuple of (normalized, warnings_list)
+        - normalized: NormalizedClaim of floats or None
+        - warnings_list: WarningRecords for parsing issues
     """
     warnings = []
-    normalized = {}
-    
-    # Required numeric fields
-    required_fields = [
-        "Copay",
-        "Deductible", 
-        "Insurance Payment",
-        "Contracted Rate",
-        "Paid Amount"
-    ]
-    
-    # Optional numeric fields
-    optional_fields = [
-        "Patient Amount",
-        "Adjustments Amount"
-    ]
-    
-    all_fields = required_fields + optional_fields
-    
-    for field in all_fields:
+    values = []
+    
+    for field, key, required in _FIELD_MAP:
         value = data.get(field)
         parsed, warning = safe_float(value)
         
         # Store normalized value (may be None)
-        normalized[field.lower().replace(" ", "_")] = parsed
+        values.append(parsed)
         
         # Flag parsing errors (but not missing values for optional fields)
-        if warning and field in required_fields:
-            warnings.append(f"{field}: {warning}")
-        elif warning and field in optional_fields and value is not None:
-            warnings.append(f"{field}: {warning}")
+        if warning and (required or value is not None):
+            warnings.append(WarningRecord("FIELD_PARSE", (field, warning)))
     
-    return normalized, warnings
+    return NormalizedClaim._make(values), warnings
 
 
-def check_financial_logic(nums: Dict[str, Optional[float]]) -> Tuple[Optional[float], List[str], Optional[bool]]:
+def normalize_numeric_fields_batch(records: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[List[WarningRecord]]]:
+    """
+    Batch version of normalize_numeric_fields() for many claims at once.
+    
+    Each field is handled as one column: currency characters are stripped
+    with NumPy's vectorized string ops and the whole column is parsed in a
+    single astype(float64). Only if some cell isn't a plain number does
+    the column fall back to per-value safe_float() to find the bad
+    cells and build their warnings.
+    
+    Args:
+        records: List of OCR-extracted claim data dictionaries
+    
+    Returns:
+        Tuple of (columns, warnings_per_record)
+        - columns: normalized field name -> float64 array (NaN = missing)
+        - warnings_per_record: one warnings list per input record, in the
+          same order normalize_numeric_fields() would produce them
+    """
+    import numpy as np
+    
+    n = len(records)
+    columns = {}
+    warnings = [[] for _ in range(n)]
+    
+    for field, key, _ in _FIELD_MAP:
+        column = np.full(n, np.nan)
+        text_rows = []
+        text_values = []
+        
+        for i, record in enumerate(records):
+            value = record.get(field)
+            if value is None or (isinstance(value, str) and value in _PLACEHOLDERS):
+                continue
+            if isinstance(value, (int, float)):
+                column[i] = value
+            elif isinstance(value, str):
+                text_rows.append(i)
+                text_values.append(value)
+            else:
+                # Unexpected type - let the scalar parser produce the warning
+                warnings[i].append(WarningRecord("FIELD_PARSE", (field, safe_float(value)[1])))
+        
+        if text_values:
+            # Same cleanup as safe_float(): drop $ , ( ), then strip
+            cleaned = np.array(text_values, dtype=str)
+            for char in "$,()":
+                cleaned = np.char.replace(cleaned, char, "")
+            cleaned = np.char.strip(cleaned)
+            
+            rows = np.array(text_rows)
+            present = cleaned != ""
+            # Same _NUM_RE gate as safe_float(), so astype never sees junk
+            if all(map(_NUM_RE.fullmatch, cleaned[present].tolist())):
+                column[rows[present]] = cleaned[present].astype(np.float64)
+            else:
+                for i, value in zip(text_rows, text_values):
+                    parsed, warning = safe_float(value)
+                    if parsed is not None:
+                        column[i] = parsed
+                    elif warning:
+                        warnings[i].append(WarningRecord("FIELD_PARSE", (field, warning)))
+        
+        columns[key] = column
+    
+    return columns, warnings
+
+
+def check_financial_logic(nums: NormalizedClaim) -> Tuple[Optional[float], List[WarningRecord], Optional[bool]]:
     """
     Validate financial calculations per insurance billing rules.
     
@@ -126,47 +297,41 @@ def check_financial_logic(nums: Dict[str, Optional[float]]) -> Tuple[Optional[fl
     
     Returns:
         Tuple of (counselor_payout, warnings, contracted_rate_ok)
+        (warnings are WarningRecords)
     """
     warnings = []
     counselor_payout = None
     contracted_rate_ok = None
     
     # Extract values (may be None)
-    copay = nums.get("copay", 0) or 0
-    deductible = nums.get("deductible", 0) or 0
-    insurance_payment = nums.get("insurance_payment", 0) or 0
-    contracted_rate = nums.get("contracted_rate")
-    paid_amount = nums.get("paid_amount")
+    copay, deductible, insurance_payment, contracted_rate, paid_amount, _, _ = nums
+    copay = copay or 0
+    deductible = deductible or 0
+    insurance_payment = insurance_payment or 0
     
     # Rule: Insurance Payment should equal Paid Amount (if both present)
     if insurance_payment and paid_amount and abs(insurance_payment - paid_amount) > EPS:
-        warnings.append(
-            f"Insurance Payment (${insurance_payment:.2f}) does not match "
-            f"Paid Amount (${paid_amount:.2f})"
-        )
+        warnings.append(WarningRecord("PAID_MISMATCH", (insurance_payment, paid_amount)))
     
     # Rule: Negative amounts are suspicious (except on denials)
     if copay < 0:
-        warnings.append(f"Copay is negative: ${copay:.2f}")
+        warnings.append(WarningRecord("COPAY_NEGATIVE", (copay,)))
     if deductible < 0:
-        warnings.append(f"Deductible is negative: ${deductible:.2f}")
+        warnings.append(WarningRecord("DEDUCTIBLE_NEGATIVE", (deductible,)))
     if insurance_payment < 0:
-        warnings.append(f"Insurance Payment is negative: ${insurance_payment:.2f}")
+        warnings.append(WarningRecord("INSURANCE_NEGATIVE", (insurance_payment,)))
     
     # Rule: Contracted Rate must equal Copay + Deductible + Insurance Payment
     if contracted_rate is not None:
         expected_contracted = copay + deductible + insurance_payment
         
         if abs(contracted_rate - expected_contracted) > EPS:
-            warnings.append(
-                f"Contracted Rate (${contracted_rate:.2f}) does not equal "
-                f"Copay + Deductible + Insurance Payment (${expected_contracted:.2f})"
-            )
+            warnings.append(WarningRecord("CONTRACTED_MISMATCH", (contracted_rate, expected_contracted)))
             contracted_rate_ok = False
         else:
             contracted_rate_ok = True
     else:
-        warnings.append("Contracted Rate is missing")
+        warnings.append(WarningRecord("CONTRACTED_MISSING", ()))
         contracted_rate_ok = None
     
     # Rule: Calculate counselor payout
@@ -176,18 +341,152 @@ def check_financial_logic(nums: Dict[str, Optional[float]]) -> Tuple[Optional[fl
         
         # Flag negative payouts (may be legitimate on denials, but worth reviewing)
         if counselor_payout < -EPS:
-            warnings.append(
-                f"Counselor Payout is negative: ${counselor_payout:.2f} "
-                f"(Insurance Payment ${insurance_payment:.2f} - "
-                f"Patient Responsibility ${copay + deductible:.2f})"
-            )
+            warnings.append(WarningRecord(
+                "PAYOUT_NEGATIVE", (counselor_payout, insurance_payment, copay + deductible)
+            ))
     else:
-        warnings.append("Cannot calculate Counselor Payout: Insurance Payment missing")
+        warnings.append(WarningRecord("PAYOUT_UNAVAILABLE", ()))
     
     return counselor_payout, warnings, contracted_rate_ok
 
 
-def check_remarks_logic(data: Dict[str, Any], nums: Dict[str, Optional[float]]) -> List[str]:
+@njit(cache=True, parallel=True)
+def _finance_kernel(copay, deductible, insurance, contracted, paid, eps, payout, contracted_ok, flags):
+    """
+    check_financial_logic() rules over whole columns of claims.
+    
+    Inputs are float64 arrays (copay/deductible/insurance already have
+    missing values as 0; contracted/paid use NaN for missing). Results are
+    written into the payout, contracted_ok (1/0/-1 for True/False/None)
+    and flags (warning bitmask) output arrays.
+    """
+    for k in prange(copay.shape[0]):
+        c = copay[k]
+        d = deductible[k]
+        ins = insurance[k]
+        cr = contracted[k]
+        pa = paid[k]
+        bits = 0
+        
+        if ins != 0.0 and pa == pa and pa != 0.0 and abs(ins - pa) > eps:
+            bits |= 1       # _FIN_PAID_MISMATCH
+        if c < 0.0:
+            bits |= 2       # _FIN_COPAY_NEGATIVE
+        if d < 0.0:
+            bits |= 4       # _FIN_DEDUCTIBLE_NEGATIVE
+        if ins < 0.0:
+            bits |= 8       # _FIN_INSURANCE_NEGATIVE
+        
+        if cr == cr:
+            if abs(cr - (c + d + ins)) > eps:
+                bits |= 16  # _FIN_CONTRACTED_MISMATCH
+                contracted_ok[k] = 0
+            else:
+                contracted_ok[k] = 1
+        else:
+            bits |= 64      # _FIN_CONTRACTED_MISSING
+            contracted_ok[k] = -1
+        
+        p = ins - (c + d)
+        payout[k] = p
+        if p < -eps:
+            bits |= 32      # _FIN_PAYOUT_NEGATIVE
+        
+        flags[k] = bits
+
+
+def check_financial_logic_batch(columns: Dict[str, Any]) -> Tuple[List[float], List[List[WarningRecord]], List[Optional[bool]]]:
+    """
+    Batch version of check_financial_logic() over normalized columns.
+    
+    The arithmetic and comparisons run in _finance_kernel (compiled by
+    Numba when available); warning records are only built for rows whose
+    flag bits are set.
+    
+    Args:
+        columns: Output of normalize_numeric_fields_batch()
+    
+    Returns:
+        Tuple of (counselor_payouts, warnings_per_record, contracted_rate_oks)
+    """
+    import numpy as np
+    
+    copay = np.nan_to_num(columns["copay"], nan=0.0)
+    deductible = np.nan_to_num(columns["deductible"], nan=0.0)
+    insurance = np.nan_to_num(columns["insurance_payment"], nan=0.0)
+    contracted = columns["contracted_rate"]
+    paid = columns["paid_amount"]
+    
+    n = copay.shape[0]
+    payout = np.empty(n)
+    contracted_ok = np.empty(n, dtype=np.int8)
+    flags = np.empty(n, dtype=np.uint8)
+    _finance_kernel(copay, deductible, insurance, contracted, paid, EPS, payout, contracted_ok, flags)
+    
+    warnings = [[] for _ in range(n)]
+    for k in np.flatnonzero(flags).tolist():
+        bits = int(flags[k])
+        c, d, ins = float(copay[k]), float(deductible[k]), float(insurance[k])
+        row = warnings[k]
+        
+        if bits & _FIN_PAID_MISMATCH:
+            row.append(WarningRecord("PAID_MISMATCH", (ins, float(paid[k]))))
+        if bits & _FIN_COPAY_NEGATIVE:
+            row.append(WarningRecord("COPAY_NEGATIVE", (c,)))
+        if bits & _FIN_DEDUCTIBLE_NEGATIVE:
+            row.append(WarningRecord("DEDUCTIBLE_NEGATIVE", (d,)))
+        if bits & _FIN_INSURANCE_NEGATIVE:
+            row.append(WarningRecord("INSURANCE_NEGATIVE", (ins,)))
+        if bits & _FIN_CONTRACTED_MISMATCH:
+            row.append(WarningRecord("CONTRACTED_MISMATCH", (float(contracted[k]), c + d + ins)))
+        if bits & _FIN_CONTRACTED_MISSING:
+            row.append(WarningRecord("CONTRACTED_MISSING", ()))
+        if bits & _FIN_PAYOUT_NEGATIVE:
+            row.append(WarningRecord("PAYOUT_NEGATIVE", (float(payout[k]), ins, c + d)))
+    
+    ok_lookup = {1: True, 0: False, -1: None}
+    return payout.tolist(), warnings, [ok_lookup[v] for v in contracted_ok.tolist()]
+
+
+def _remarks_upper(data: Dict[str, Any]) -> List[str]:
+    """Remarks field as a list of uppercased, stripped codes."""
+    # Extract remarks (may be list or string)
+    remarks = data.get("Remarks", [])
+    if isinstance(remarks, str):
+        remarks = [remarks]
+    elif not isinstance(remarks, list):
+        remarks = []
+    
+    # Normalize remarks to uppercase for comparison
+    return [str(r).upper().strip() for r in remarks]
+
+
+def _scan_remarks(remarks_upper: List[str]) -> Tuple[int, int]:
+    """
+    Classify uppercased remark codes in a single pass.
+    
+    Returns:
+        Tuple of (_RM_* bitmask of categories seen, number of CO- remarks)
+    """
+    flags = 0
+    co_count = 0
+    for remark in remarks_upper:
+        if remark.startswith("PR-"):
+            flags |= _RM_PR
+        elif remark.startswith("CO-"):
+            flags |= _RM_CO
+            co_count += 1
+        elif remark.startswith(("OA-", "PI-")):
+            flags |= _RM_OA_PI
+        
+        # Only run the code regex when a PR- code can be present at all
+        if "PR-" in remark:
+            for code in _REMARK_PR_CODE_RE.finditer(remark):
+                flags |= _PR_CODE_BITS[code.group(1)]
+    return flags, co_count
+
+
+def check_remarks_logic(data: Dict[str, Any], nums: NormalizedClaim) -> List[WarningRecord]:
     """
     Validate remark codes against patient responsibility amounts.
     
@@ -203,81 +502,123 @@ def check_remarks_logic(data: Dict[str, Any], nums: Dict[str, Optional[float]])
     
     Args:
         data: Original OCR data (for Remarks field)
-        nums: Normalized numeric fields
+        nums: NormalizedClaim from normalize_numeric_fields()
     
     Returns:
-        List of warning strings
+        List of WarningRecords
     """
     warnings = []
     
-    # Extract remarks (may be list or string)
-    remarks = data.get("Remarks", [])
-    if isinstance(remarks, str):
-        remarks = [remarks]
-    elif not isinstance(remarks, list):
-        remarks = []
-    
-    # Normalize remarks to uppercase for comparison
-    remarks_upper = [str(r).upper().strip() for r in remarks]
+    remarks_upper = _remarks_upper(data)
     
     # Extract patient responsibility amounts
-    copay = nums.get("copay", 0) or 0
-    deductible = nums.get("deductible", 0) or 0
-    
-    # Detect code types
-    has_pr1 = any("PR-1" in r or "PR-01" in r for r in remarks_upper)
-    has_pr2 = any("PR-2" in r or "PR-02" in r for r in remarks_upper)
-    has_pr3 = any("PR-3" in r or "PR-03" in r for r in remarks_upper)
-    has_any_pr = any(r.startswith("PR-") for r in remarks_upper)
-    has_only_co = all(r.startswith("CO-") for r in remarks_upper) and len(remarks_upper) > 0
-    has_any_co = any(r.startswith("CO-") for r in remarks_upper)
+    copay = nums.copay or 0
+    deductible = nums.deductible or 0
+    
+    # Detect code types (one pass over the remarks)
+    flags, co_count = _scan_remarks(remarks_upper)
+    has_pr1 = flags & _RM_PR1
+    has_pr2 = flags & _RM_PR2
+    has_pr3 = flags & _RM_PR3
+    has_any_pr = flags & _RM_PR
+    has_only_co = co_count == len(remarks_upper) > 0
+    has_oa_or_pi = flags & _RM_OA_PI
     
     # Rule: PR-1 requires nonzero deductible
     if has_pr1 and abs(deductible) < EPS:
-        warnings.append(
-            "PR-1 (Deductible) present but Deductible is missing or zero"
-        )
+        warnings.append(WarningRecord("PR1_NO_DEDUCTIBLE", ()))
     
     # Rule: PR-2 (coinsurance) requires some patient responsibility
     if has_pr2 and abs(copay) < EPS and abs(deductible) < EPS:
-        warnings.append(
-            "PR-2 (Coinsurance) present but both Copay and Deductible are zero"
-        )
+        warnings.append(WarningRecord("PR2_NO_PATIENT_AMOUNT", ()))
     
     # Rule: PR-3 requires nonzero copay
     if has_pr3 and abs(copay) < EPS:
-        warnings.append(
-            "PR-3 (Copay) present but Copay is missing or zero"
-        )
+        warnings.append(WarningRecord("PR3_NO_COPAY", ()))
     
     # Rule: Any PR code should have corresponding patient responsibility
     if has_any_pr and abs(copay) < EPS and abs(deductible) < EPS:
-        warnings.append(
-            "Patient Responsibility (PR) codes present but both Copay and Deductible are zero"
-        )
+        warnings.append(WarningRecord("PR_NO_PATIENT_AMOUNT", ()))
     
     # Rule: Only CO codes means patient should owe nothing
     # CO codes are contractual adjustments - provider writes off, not patient responsibility
     if has_only_co:
         if abs(copay) > EPS or abs(deductible) > EPS:
-            warnings.append(
-                "Only CO (Contractual Obligation) codes present, "
-                "but patient responsibility amounts are nonzero. "
-                "Patient should not be charged for contractual adjustments."
-            )
+            warnings.append(WarningRecord("CO_ONLY_PATIENT_CHARGED", ()))
     
     # Rule: OA/PI codes with patient amounts but no PR codes is unclear
-    has_oa_or_pi = any(r.startswith("OA-") or r.startswith("PI-") for r in remarks_upper)
     if has_oa_or_pi and not has_any_pr and (abs(copay) > EPS or abs(deductible) > EPS):
-        warnings.append(
-            "OA/PI codes present with patient amounts but no PR codes. "
-            "Patient responsibility is unclear - verify if patient should be charged."
-        )
+        warnings.append(WarningRecord("OA_PI_UNCLEAR", ()))
+    
+    return warnings
+
+
+def check_remarks_logic_batch(records: List[Dict[str, Any]], columns: Dict[str, Any]) -> List[List[WarningRecord]]:
+    """
+    Batch version of check_remarks_logic().
+    
+    Each claim's remarks are classified once into a flag bitmask; the
+    zero/nonzero amount tests are computed once per column and every rule
+    becomes a bitwise combination of boolean arrays.
+    
+    Args:
+        records: Original OCR data dictionaries (for the Remarks field)
+        columns: Output of normalize_numeric_fields_batch()
+    
+    Returns:
+        One list of WarningRecords per record
+    """
+    import numpy as np
+    
+    n = len(records)
+    flags = np.zeros(n, dtype=np.int64)
+    only_co = np.zeros(n, dtype=bool)
+    for i, data in enumerate(records):
+        remarks_upper = _remarks_upper(data)
+        flags[i], co_count = _scan_remarks(remarks_upper)
+        only_co[i] = co_count == len(remarks_upper) > 0
+    
+    copay = np.abs(np.nan_to_num(columns["copay"], nan=0.0))
+    deductible = np.abs(np.nan_to_num(columns["deductible"], nan=0.0))
+    zero_copay = copay < EPS
+    zero_deductible = deductible < EPS
+    patient_owes = (copay > EPS) | (deductible > EPS)
+    
+    pr1 = (flags & _RM_PR1) != 0
+    pr2 = (flags & _RM_PR2) != 0
+    pr3 = (flags & _RM_PR3) != 0
+    any_pr = (flags & _RM_PR) != 0
+    oa_pi = (flags & _RM_OA_PI) != 0
+    
+    # Same rules, same order as check_remarks_logic()
+    rules = (
+        ("PR1_NO_DEDUCTIBLE", pr1 & zero_deductible),
+        ("PR2_NO_PATIENT_AMOUNT", pr2 & zero_copay & zero_deductible),
+        ("PR3_NO_COPAY", pr3 & zero_copay),
+        ("PR_NO_PATIENT_AMOUNT", any_pr & zero_copay & zero_deductible),
+        ("CO_ONLY_PATIENT_CHARGED", only_co & patient_owes),
+        ("OA_PI_UNCLEAR", oa_pi & ~any_pr & patient_owes),
+    )
+    
+    warnings = [[] for _ in range(n)]
+    for code, mask in rules:
+        record = WarningRecord(code, ())
+        for i in np.flatnonzero(mask).tolist():
+            warnings[i].append(record)
     
     return warnings
 
 
-def validate_claim(data: Dict[str, Any]) -> Dict[str, Any]:
+def render_warnings(records: List[WarningRecord]) -> List[str]:
+    """Format WarningRecords into human-readable warning strings."""
+    return [_TEMPLATES[record.code].format(*record.values) for record in records]
+
+
+def validate_claim(data: Dict[str, Any], render: bool = True, *,
+                   _normalize=normalize_numeric_fields,
+                   _finance=check_financial_logic,
+                   _remarks=check_remarks_logic,
+                   _render=render_warnings) -> Dict[str, Any]:
     """
     Main validator: orchestrates all checks and returns structured results.
     
@@ -285,6 +626,10 @@ def validate_claim(data: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         data: OCR-extracted claim data dictionary
+        render: Format warnings as strings (False keeps the WarningRecords)
+    
+    The underscore keyword arguments only pre-bind the step functions as
+    locals (saves global lookups per call); callers never pass them.
     
     Returns:
         Dictionary with structure:
@@ -297,30 +642,93 @@ def validate_claim(data: Dict[str, Any]) -> Dict[str, Any]:
             }
         }
     """
-    all_warnings = []
-    
-    # Step 1: Normalize numeric fields
-    normalized, norm_warnings = normalize_numeric_fields(data)
-    all_warnings.extend(norm_warnings)
+    # Step 1: Normalize numeric fields (its fresh warnings list collects the rest)
+    normalized, all_warnings = _normalize(data)
     
     # Step 2: Check financial logic
-    counselor_payout, finance_warnings, contracted_ok = check_financial_logic(normalized)
+    counselor_payout, finance_warnings, contracted_ok = _finance(normalized)
     all_warnings.extend(finance_warnings)
     
     # Step 3: Check remark code logic
-    remark_warnings = check_remarks_logic(data, normalized)
-    all_warnings.extend(remark_warnings)
+    all_warnings.extend(_remarks(data, normalized))
     
     return {
-        "warnings": all_warnings,
+        "warnings": _render(all_warnings) if render else all_warnings,
         "computed": {
             "contracted_rate_check": contracted_ok,
             "counselor_payout": counselor_payout,
-            "normalized": normalized
+            "normalized": normalized._asdict()
         }
     }
 
 
+def validate_claims(records: List[Dict[str, Any]], render: bool = True) -> List[Dict[str, Any]]:
+    """
+    Validate a batch of claims; same output as validate_claim() per record.
+    
+    Numeric normalization, the financial checks and the remark rules all
+    run column-wise over the whole batch.
+    """
+    columns, norm_warnings = normalize_numeric_fields_batch(records)
+    payouts, finance_warnings, contracted_oks = check_financial_logic_batch(columns)
+    remark_warnings = check_remarks_logic_batch(records, columns)
+    
+    keys = list(columns)
+    column_lists = [columns[key].tolist() for key in keys]
+    
+    results = []
+    for i, data in enumerate(records):
+        normalized = {
+            key: (None if values[i] != values[i] else values[i])
+            for key, values in zip(keys, column_lists)
+        }
+        warnings = norm_warnings[i]
+        warnings.extend(finance_warnings[i])
+        warnings.extend(remark_warnings[i])
+        results.append({
+            "warnings": render_warnings(warnings) if render else warnings,
+            "computed": {
+                "contracted_rate_check": contracted_oks[i],
+                "counselor_payout": payouts[i],
+                "normalized": normalized
+            }
+        })
+    
+    return results
+
+
+def validate_claims_df(df, render: bool = True):
+    """
+    DataFrame entry point: one OCR claim per row, columns named like the
+    OCR fields ("Copay", "Deductible", "Remarks", ...).
+    
+    Runs the same batched path as validate_claims(); pandas is imported
+    lazily so the rest of the module doesn't depend on it.
+    
+    Args:
+        df: pandas DataFrame of OCR-extracted claims
+        render: Format warnings as strings (False keeps the WarningRecords)
+    
+    Returns:
+        DataFrame with the same index and columns
+        warnings, counselor_payout, contracted_rate_check
+    """
+    import pandas as pd
+    
+    # Missing cells (NaN/NaT) mean "field not extracted", same as None
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    results = validate_claims(records, render=render)
+    
+    return pd.DataFrame(
+        {
+            "warnings": [r["warnings"] for r in results],
+            "counselor_payout": [r["computed"]["counselor_payout"] for r in results],
+            "contracted_rate_check": [r["computed"]["contracted_rate_check"] for r in results],
+        },
+        index=df.index,
+    )
+
+
 # ============================================================================
 # DEMONSTRATION / TEST CASES
 # ============================================================================
@@ -445,6 +853,28 @@ if __name__ == "__main__":
     print(f"Normalized Values: {result6['computed']['normalized']}")
     print()
     
+    # Test Case 7: Currency Symbol Separated by a Space
+    print("TEST CASE 7: Spaced Currency Symbols ('$ 25.00', '25.00 $')")
+    print("-" * 80)
+    test7 = {
+        "Copay": "$ 25.00",
+        "Deductible": "50.00 $",
+        "Insurance Payment": "$ 1,250.00",
+        "Contracted Rate": " $ 1,325.00 ",
+        "Paid Amount": "1250.00",
+        "Remarks": ["PR-3"]
+    }
+    result7 = validate_claim(test7)
+    batch7 = validate_claims([test7])[0]
+    assert safe_float("$ 25.00") == (25.0, None)
+    assert safe_float("25.00 $") == (25.0, None)
+    assert result7['computed']['normalized'] == batch7['computed']['normalized']
+    assert result7['computed']['normalized']['contracted_rate'] == 1325.0
+    print(f"Input: {test7}")
+    print(f"\nWarnings: {result7['warnings'] if result7['warnings'] else 'None ✓'}")
+    print(f"Normalized Values: {result7['computed']['normalized']}")
+    print()
+    
     print("=" * 80)
     print("END OF TEST CASES")
     print("=" * 80)
@@ -6,8 +6,26 @@ Manages directories, counselor/insurer lists, and Tesseract OCR path.
 
 import os
 import json
+import bisect
+from functools import lru_cache
 import pytesseract
 
+# orjson is optional - same files, just a faster (de)serializer
+try:
+    import orjson
+    
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _loads(raw: bytes):
+        return json.loads(raw)
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # ═══════════════════════════════════════════════════════════════
 # DIRECTORY PATHS
 # ═══════════════════════════════════════════════════════════════
@@ -18,9 +36,22 @@ EXCEL_DIR = os.path.join(BASE_DIR, "ExcelFiles")
 COUNSELORS_JSON = os.path.join(BASE_DIR, "counselors.json")
 INSURERS_JSON = os.path.join(BASE_DIR, "insurers.json")
 
+# OCR results keyed by image content hash (safe to delete at any time)
+OCR_CACHE_DIR = os.path.join(BASE_DIR, ".ocr_cache")
+
+# Part of every OCR cache key - bump it whenever ocr_module's parsing or
+# llm_validator's name prompt changes, so results from the old code are
+# ignored instead of returned forever (the OCR PREPROCESSING flags below
+# are part of the key too)
+OCR_CACHE_VERSION = 2
+
+# Patient names the LLM extracted, keyed by OCR text hash (same rules)
+LLM_CACHE_JSON = os.path.join(OCR_CACHE_DIR, "llm_names.json")
+
 # Create directories if they don't exist
 os.makedirs(WORD_DIR, exist_ok=True)
 os.makedirs(EXCEL_DIR, exist_ok=True)
+os.makedirs(OCR_CACHE_DIR, exist_ok=True)
 
 # ═══════════════════════════════════════════════════════════════
 # TESSERACT OCR PATH CONFIGURATION
@@ -29,32 +60,48 @@ os.makedirs(EXCEL_DIR, exist_ok=True)
 # Default Tesseract installation path for Windows
 TESSERACT_PATH = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 
-# Check if Tesseract exists at default path
-if os.path.exists(TESSERACT_PATH):
-    pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
-    print(f"✅ Tesseract found at: {TESSERACT_PATH}")
+# Default path first, then other common install locations
+_CANDIDATES = (
+    TESSERACT_PATH,
+    r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+    r"C:\Tesseract-OCR\tesseract.exe",
+    os.path.expandvars(r"%LOCALAPPDATA%\Programs\Tesseract-OCR\tesseract.exe"),
+)
+
+_found = next((p for p in _CANDIDATES if os.path.exists(p)), None)
+
+if _found:
+    pytesseract.pytesseract.tesseract_cmd = _found
+    print(f"✅ Tesseract found at: {_found}")
 else:
-    # Try alternative common paths
-    alternative_paths = [
-        r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-        r"C:\Tesseract-OCR\tesseract.exe",
-        r"C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe".format(os.getenv('USERNAME'))
-    ]
-    
-    tesseract_found = False
-    for alt_path in alternative_paths:
-        if os.path.exists(alt_path):
-            pytesseract.pytesseract.tesseract_cmd = alt_path
-            print(f"✅ Tesseract found at: {alt_path}")
-            tesseract_found = True
-            break
-    
-    if not tesseract_found:
-        print("⚠️  WARNING: Tesseract not found at default locations!")
-        print("   Please install Tesseract OCR from:")
-        print("   https://github.com/UB-Mannheim/tesseract/wiki")
-        print("\n   Or manually set the path in config.py:")
-        print("   TESSERACT_PATH = r'C:\\Your\\Custom\\Path\\tesseract.exe'")
+    print("⚠️  WARNING: Tesseract not found at default locations!")
+    print("   Please install Tesseract OCR from:")
+    print("   https://github.com/UB-Mannheim/tesseract/wiki")
+    print("\n   Or manually set the path in config.py:")
+    print("   TESSERACT_PATH = r'C:\\Your\\Custom\\Path\\tesseract.exe'")
+
+# ═══════════════════════════════════════════════════════════════
+# OCR PREPROCESSING
+# ═══════════════════════════════════════════════════════════════
+
+# Denoising in OCR pass 2. False: a light edge-preserving (bilateral)
+# filter, plenty for ERA screenshots. True: non-local-means - far slower,
+# but better on scanned paperwork
+OCR_AGGRESSIVE_DENOISE = False
+
+# Morphological opening after OCR pass 3's threshold - removes specks from
+# noisy scans; not needed for screenshots
+OCR_MORPH_CLEANUP = False
+
+# ═══════════════════════════════════════════════════════════════
+# WORD EXPORT
+# ═══════════════════════════════════════════════════════════════
+
+# False: each claim is written into the counselor's .docx as it's processed.
+# True: claims are only appended (fsync'd) to WordFiles/<counselor>.pending.jsonl
+# and the .docx files are brought up to date when the Word folder is opened
+# or the app exits - one document save for any number of claims
+WORD_RENDER_ON_DEMAND = False
 
 # ═══════════════════════════════════════════════════════════════
 # COUNSELOR MANAGEMENT
@@ -72,14 +119,21 @@ def get_counselors():
         save_counselors(["DrSmith"])
     
     try:
-        with open(COUNSELORS_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
+        # Copy - callers (e.g. the GUI) modify the list they get back
+        return list(_load_counselors())
     except Exception as e:
         print(f"⚠️  Could not load counselors: {e}")
         return []
 
 
+@lru_cache(maxsize=1)
+def _load_counselors():
+    """Read counselors.json once; the cache is cleared by save_counselors()."""
+    with open(COUNSELORS_JSON, "rb") as f:
+        data = _loads(f.read())
+        return tuple(data) if isinstance(data, list) else ()
+
+
 def save_counselors(names):
     """
     Save counselor names to JSON file.
@@ -89,13 +143,10 @@ def save_counselors(names):
         names (list): List of counselor names to save
     """
     try:
-        # Remove duplicates while preserving order, then sort
-        unique_names = sorted(list(dict.fromkeys(names)))
-        
-        with open(COUNSELORS_JSON, "w", encoding="utf-8") as f:
-            json.dump(unique_names, f, indent=2, ensure_ascii=False)
-        
-        print(f"✅ Saved {len(unique_names)} counselor(s)")
+        unique_names, changed = _save_names(COUNSELORS_JSON, names)
+        if changed:
+            _load_counselors.cache_clear()
+            print(f"✅ Saved {len(unique_names)} counselor(s)")
     except Exception as e:
         print(f"❌ Could not save counselors: {e}")
 
@@ -116,14 +167,20 @@ def get_insurers():
         save_insurers(["Blue Cross", "Aetna", "Cigna", "UnitedHealthcare", "Medicare"])
     
     try:
-        with open(INSURERS_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
+        return list(_load_insurers())
     except Exception as e:
         print(f"⚠️  Could not load insurers: {e}")
         return []
 
 
+@lru_cache(maxsize=1)
+def _load_insurers():
+    """Read insurers.json once; the cache is cleared by save_insurers()."""
+    with open(INSURERS_JSON, "rb") as f:
+        data = _loads(f.read())
+        return tuple(data) if isinstance(data, list) else ()
+
+
 def save_insurers(names):
     """
     Save insurance company names to JSON file.
@@ -133,17 +190,50 @@ def save_insurers(names):
         names (list): List of insurance company names to save
     """
     try:
-        # Remove duplicates while preserving order, then sort
-        unique_names = sorted(list(dict.fromkeys(names)))
-        
-        with open(INSURERS_JSON, "w", encoding="utf-8") as f:
-            json.dump(unique_names, f, indent=2, ensure_ascii=False)
-        
-        print(f"✅ Saved {len(unique_names)} insurer(s)")
+        unique_names, changed = _save_names(INSURERS_JSON, names)
+        if changed:
+            _load_insurers.cache_clear()
+            print(f"✅ Saved {len(unique_names)} insurer(s)")
     except Exception as e:
         print(f"❌ Could not save insurers: {e}")
 
 
+# Last saved sorted name list per JSON file (see _save_names)
+_saved_names = {}
+
+
+def _save_names(path, names):
+    """
+    Write a de-duplicated, alphabetically sorted name list to JSON.
+    
+    Keeps the last saved list in memory: when names are only added, they
+    are bisect-inserted instead of re-sorting everything, and nothing is
+    written if the set of names hasn't changed.
+    
+    Returns:
+        tuple: (sorted names, whether the file was written)
+    """
+    wanted = set(names)
+    current = _saved_names.get(path)
+    
+    if current is not None and wanted.issuperset(current):
+        added = wanted.difference(current)
+        if not added and os.path.exists(path):
+            return current, False
+        current = list(current)
+        for name in added:
+            bisect.insort(current, name)
+    else:
+        # First save, or names were removed - rebuild
+        current = sorted(wanted)
+    
+    with open(path, "wb") as f:
+        f.write(_dumps(current))
+    
+    _saved_names[path] = current
+    return current, True
+
+
 # ═══════════════════════════════════════════════════════════════
 # INSURANCE RATES (Optional Override)
 # ═══════════════════════════════════════════════════════════════
@@ -161,26 +251,33 @@ def get_insurance_rate(insurance_name: str) -> float:
     Returns:
         float: Contracted rate if found, None otherwise
     """
-    if not os.path.exists(INSURANCE_RATES_FILE):
-        return None
-    
     try:
-        with open(INSURANCE_RATES_FILE, "r", encoding="utf-8") as f:
-            rates = json.load(f)
-            
         # Case-insensitive lookup
-        insurance_lower = insurance_name.lower().strip()
-        
-        for key, value in rates.items():
-            if key.lower().strip() == insurance_lower:
-                return float(value)
-        
-        return None
+        value = _load_insurance_rates().get(insurance_name.lower().strip())
+        return float(value) if value is not None else None
     except Exception as e:
         print(f"⚠️  Could not load insurance rates: {e}")
         return None
 
 
+@lru_cache(maxsize=1)
+def _load_insurance_rates() -> dict:
+    """
+    Read insurance_rates.json once, keyed by lowercased/stripped name.
+    The cache is cleared by save_insurance_rate().
+    """
+    if not os.path.exists(INSURANCE_RATES_FILE):
+        return {}
+    
+    with open(INSURANCE_RATES_FILE, "rb") as f:
+        rates = _loads(f.read())
+    
+    lookup = {}
+    for key, value in rates.items():
+        lookup.setdefault(key.lower().strip(), value)
+    return lookup
+
+
 def save_insurance_rate(insurance_name: str, rate: float):
     """
     Save contracted rate for specific insurance company.
@@ -192,8 +289,8 @@ def save_insurance_rate(insurance_name: str, rate: float):
     try:
         # Load existing rates
         if os.path.exists(INSURANCE_RATES_FILE):
-            with open(INSURANCE_RATES_FILE, "r", encoding="utf-8") as f:
-                rates = json.load(f)
+            with open(INSURANCE_RATES_FILE, "rb") as f:
+                rates = _loads(f.read())
         else:
             rates = {}
         
@@ -201,8 +298,9 @@ def save_insurance_rate(insurance_name: str, rate: float):
         rates[insurance_name.lower().strip()] = float(rate)
         
         # Save back to file
-        with open(INSURANCE_RATES_FILE, "w", encoding="utf-8") as f:
-            json.dump(rates, f, indent=2)
+        with open(INSURANCE_RATES_FILE, "wb") as f:
+            f.write(_dumps(rates))
+        _load_insurance_rates.cache_clear()
         
         print(f"✅ Saved rate for {insurance_name}: ${rate:.2f}")
     except Exception as e:
@@ -1,17 +1,29 @@
-import logging, sys, traceback, os
+import logging, sys, traceback, os, queue, atexit
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
 def setup_debugger():
     os.makedirs("logs", exist_ok=True)
     log_file = os.path.join("logs", f"error_log_{datetime.now():%Y-%m-%d}.txt")
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+
+    # File/console I/O runs on the listener's thread; callers only enqueue.
+    # The final layout is applied by the target handlers, so the queue
+    # handler formats just the message (plus any traceback) when enqueuing.
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)  # drain the queue on shutdown
+
+    logging.basicConfig(level=logging.DEBUG, handlers=[queue_handler])
 
     def handle_exception(exc_type, exc_value, exc_traceback):
         if issubclass(exc_type, KeyboardInterrupt):
@@ -7,40 +7,220 @@ Optimized for reliability, especially with batch OCR runs.
 
 import os
 import logging
+from functools import lru_cache
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.comments import Comment
+from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
 import config
 
+# xlsxwriter is optional - much faster than openpyxl for writing, but it can
+# only create files, so it's used for brand-new sheets and openpyxl does
+# every append to an existing sheet
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Writer for new counselor sheets: "xlsxwriter" (when installed) or "openpyxl"
+# (write-only mode). Existing sheets are always appended to with openpyxl.
+ENGINE = "xlsxwriter"
+
+# Column headers (A-L) and widths, shared by both writers
+_HEADERS = (
+    "Client Name",           # A
+    "Client Insurance",      # B
+    "Date of Service",       # C
+    "Client Copay",          # D - Client payment
+    "Deductible being met",  # E - Client payment
+    "Insurance Paid",        # F
+    "Insurance Contract Amount",  # G = D + E + F
+    "65% Counselor Contracted rate", # H = G × 0.65
+    "Amount to Counselor (copay and deductible subtracted)", # I = F - (D + E)
+    "35% Amount Paid to GWC per claim", # J = G × 0.35
+    "Total payout to Counselor",  # K = Running sum of I
+    "Remarks",               # L - Remark codes
+)
+
+# (first column, last column, width) - adjacent columns with the same width
+# share one entry, i.e. one <col> element in the sheet XML
+_COL_WIDTHS = (
+    (1, 1, 20),    # A: Client Name
+    (2, 2, 18),    # B: Insurance
+    (3, 3, 15),    # C: Date
+    (4, 5, 12),    # D-E: Copay, Deductible
+    (6, 6, 14),    # F: Insurance Paid
+    (7, 8, 18),    # G-H: Contract Amount, 65% Counselor
+    (9, 9, 20),    # I: Amount to Counselor
+    (10, 11, 18),  # J-K: 35% GWC, Total Payout
+    (12, 12, 40),  # L: Remarks
+)
+
+# Shared style objects - reused for every cell so openpyxl registers each
+# style once instead of building new Font/Border/Fill objects per row
+_HEADER_FONT = Font(bold=True, size=11, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+_THIN_GREY = Side(style="thin", color="D0D0D0")
+_ROW_BORDER = Border(left=_THIN_GREY, right=_THIN_GREY, top=_THIN_GREY, bottom=_THIN_GREY)
+_ROW_ALIGN = Alignment(vertical="center")
+_YELLOW_FILL = PatternFill(start_color="FFF9C4", end_color="FFF9C4", fill_type="solid")
+
+# OCR placeholders that mean "no amount", and characters dropped from amounts
+_NA_SENTINELS = frozenset({"NOTFOUND", "N/A", ""})
+_MONEY_TABLE = str.maketrans("", "", "$,")
+
+# Warning comments on column A
+_COMMENT_AUTHOR = "ClaimAutomation"
+_COMMENT_WIDTH = 300
+_COMMENT_HEIGHT = 100
 
-def append_to_excel(counselor: str, data: dict, calculations: dict):
+
+class ExcelBatch:
+    """
+    Appends claims to one counselor's Excel sheet with a single load and
+    (by default) a single save, however many rows are added:
+    
+        with ExcelBatch(counselor) as batch:
+            for data, calculations in claims:
+                batch.add(data, calculations)
+    
+    Rows are buffered in memory and written when the block exits without an
+    exception, plus every flush_every rows for very large batches (rows
+    already flushed stay written if a later row fails). Saves go to a temp
+    file that replaces the sheet atomically, so an interrupted save never
+    leaves a truncated .xlsx behind.
+    (openpyxl uses lxml for faster XML (de)serialization when it's installed.)
+    
+    Column K (running total of column I) is written as a number: the batch
+    keeps the total in memory, seeded from the rows already in the sheet.
+    
+    New sheets are streamed with xlsxwriter when it's installed (see ENGINE),
+    otherwise with an openpyxl write-only workbook. Neither can re-save a
+    partial file, so new sheets are written once, on exit.
+    """
+    
+    def __init__(self, counselor: str, flush_every: int = 100):
+        self.counselor = counselor
+        self.excel_path = get_counselor_excel_path(counselor)
+        self.flush_every = flush_every
+        self.wb = None
+        self.ws = None
+        self._stream = None
+        self.rows_added = 0
+        self._pending = 0
+        self._next_row = 2
+        self._running_total = 0.0
+    
+    def __enter__(self):
+        if not os.path.exists(self.excel_path):
+            tmp_path = self.excel_path + ".tmp"
+            if ENGINE == "xlsxwriter" and xlsxwriter is not None:
+                self._stream = _XlsxNewSheet(tmp_path)
+            else:
+                self._stream = _WriteOnlyNewSheet(tmp_path)
+            self._next_row = 2
+            self._running_total = 0.0
+            return self
+        
+        self.wb, self.ws = _load_or_create_excel(self.excel_path)
+        # Probe the sheet size once; add() then just counts rows
+        self._next_row = self.ws.max_row + 1
+        self._running_total = _sum_column_i(self.ws)
+        return self
+    
+    def add(self, data: dict, calculations):
+        """Write one claim row (data from OCR, ClaimCalc from calculations_module)."""
+        self._running_total += calculations.total_payout
+        if self._stream is not None:
+            values, comment_text = _claim_row(data, calculations, self._running_total)
+            self._stream.write_claim(self._next_row, values, comment_text)
+        else:
+            _write_claim_row(self.ws, self._next_row, data, calculations, self._running_total)
+        self._next_row += 1
+        self.rows_added += 1
+        self._pending += 1
+        if self._pending >= self.flush_every and self._stream is None:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered rows to disk (temp file + atomic replace)."""
+        if not self._pending:
+            return
+        tmp_path = self.excel_path + ".tmp"
+        try:
+            self.wb.save(tmp_path)
+            os.replace(tmp_path, self.excel_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            invalidate_file_cache()  # the sheet may have just been created
+        self._pending = 0
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        save = exc_type is None and self.rows_added
+        try:
+            if self._stream is not None:
+                self._close_stream(save)
+            elif save:
+                self.flush()
+            if save:
+                logger.info(f"✅ Excel updated successfully: {os.path.basename(self.excel_path)} ({self.rows_added} rows)")
+        finally:
+            self.wb = self.ws = self._stream = None
+        return False
+    
+    def _close_stream(self, save):
+        """Finish the new sheet's temp file and move it into place (or discard it)."""
+        tmp_path = self.excel_path + ".tmp"
+        try:
+            self._stream.close(save)
+            if save:
+                os.replace(tmp_path, self.excel_path)
+                invalidate_file_cache()
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def append_to_excel(counselor: str, data: dict, calculations):
     """
     Appends claim data and calculation results to the counselor's Excel sheet.
     
+    For more than one claim, use ExcelBatch (or append_rows) so the
+    workbook is loaded and saved once instead of once per claim.
+    
     Args:
         counselor (str): Counselor name (used for filename)
         data (dict): Claim data from OCR extraction
-        calculations (dict): Financial calculations from calculations_module
+        calculations (ClaimCalc): Financial calculations from calculations_module
     """
+    append_rows(counselor, [data], [calculations])
+
+
+def append_rows(counselor: str, data_rows: list, calculations_rows: list):
+    """
+    Appends a whole batch of claims to the counselor's Excel sheet.
+    
+    Args:
+        counselor (str): Counselor name (used for filename)
+        data_rows (list): Claim data dicts, one per claim
+        calculations_rows (list): ClaimCalc results, parallel to data_rows
+    """
+    if not data_rows:
+        return
+    
     try:
-        # Build path to counselor's Excel file
-        excel_path = os.path.join(config.EXCEL_DIR, f"{counselor}.xlsx")
-        
-        # Load or create workbook
-        wb, ws = _load_or_create_excel(excel_path)
-        
-        # Get next empty row
-        next_row = ws.max_row + 1
-        
-        # Write claim data
-        _write_claim_row(ws, next_row, data, calculations)
-        
-        # Save workbook
-        wb.save(excel_path)
-        logger.info(f"✅ Excel updated successfully: {os.path.basename(excel_path)}")
+        with ExcelBatch(counselor) as batch:
+            for data, calculations in zip(data_rows, calculations_rows):
+                batch.add(data, calculations)
         
     except Exception as e:
         logger.exception(f"❌ Excel write error: {e}")
@@ -59,169 +239,249 @@ def _load_or_create_excel(excel_path):
     return wb, ws
 
 
+def _sum_column_i(ws) -> float:
+    """
+    Sum of column I over the existing data rows - the current running total.
+    
+    Summing I (rather than reading the last K) also works for sheets written
+    by older versions, where K holds =K{n-1}+I{n} formulas openpyxl can't evaluate.
+    """
+    return sum(
+        value
+        for (value,) in ws.iter_rows(min_row=2, min_col=9, max_col=9, values_only=True)
+        if isinstance(value, (int, float))
+    )
+
+
 def _write_headers(ws):
     """Writes column headers if file is new."""
-    headers = [
-        "Client Name",           # A
-        "Client Insurance",      # B
-        "Date of Service",       # C
-        "Client Copay",          # D - Client payment
-        "Deductible being met",  # E - Client payment
-        "Insurance Paid",        # F
-        "Insurance Contract Amount",  # G = D + E + F
-        "65% Counselor Contracted rate", # H = G × 0.65
-        "Amount to Counselor (copay and deductible subtracted)", # I = F - (D + E)
-        "35% Amount Paid to GWC per claim", # J = G × 0.35
-        "Total payout to Counselor",  # K = Running sum of I
-        "Remarks"                # L - Remark codes
-    ]
-    ws.append(headers)
+    ws.append(_HEADERS)
 
     # Style headers
-    header_font = Font(bold=True, size=11)
-    fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-    for col in range(1, len(headers) + 1):
-        cell = ws.cell(row=1, column=col)
-        cell.font = header_font
-        cell.alignment = header_alignment
-        cell.fill = fill
-        cell.font = Font(bold=True, size=11, color="FFFFFF")
-    
-    # Set column widths
-    ws.column_dimensions['A'].width = 20  # Client Name
-    ws.column_dimensions['B'].width = 18  # Insurance
-    ws.column_dimensions['C'].width = 15  # Date
-    ws.column_dimensions['D'].width = 12  # Copay
-    ws.column_dimensions['E'].width = 12  # Deductible
-    ws.column_dimensions['F'].width = 14  # Insurance Paid
-    ws.column_dimensions['G'].width = 18  # Contract Amount
-    ws.column_dimensions['H'].width = 18  # 65% Counselor
-    ws.column_dimensions['I'].width = 20  # Amount to Counselor
-    ws.column_dimensions['J'].width = 18  # 35% GWC
-    ws.column_dimensions['K'].width = 18  # Total Payout
-    ws.column_dimensions['L'].width = 40  # Remarks
-
-
-def _write_claim_row(ws, row, data, calculations):
-    """Writes claim data + calculations to Excel."""
+    for cell in ws[1]:
+        cell.font = _HEADER_FONT
+        cell.alignment = _HEADER_ALIGN
+        cell.fill = _HEADER_FILL
+    
+    # Set column widths (one ColumnDimension per run of equal widths)
+    for first, last, width in _COL_WIDTHS:
+        dimension = ws.column_dimensions[get_column_letter(first)]
+        dimension.min = first
+        dimension.max = last
+        dimension.width = width
+
+
+def _write_claim_row(ws, row, data, calculations, running_total):
+    """Writes claim data + calculations to Excel (running_total goes in column K)."""
     try:
-        # Column A: Client Name
-        ws.cell(row=row, column=1, value=data.get("Client", "NOTFOUND"))
-        
-        # Column B: Insurance
-        ws.cell(row=row, column=2, value=data.get("Insurance", "NOTFOUND"))
-        
-        # Column C: Date of Service
-        ws.cell(row=row, column=3, value=data.get("Date", "NOTFOUND"))
-        
-        # Column D: Client Copay (client payment)
-        copay_val = _safe_float(data.get("Copay", 0))
-        ws.cell(row=row, column=4, value=copay_val)
-        
-        # Column E: Deductible being met (client payment)
-        deductible_val = _safe_float(data.get("Deductible", 0))
-        ws.cell(row=row, column=5, value=deductible_val)
-        
-        # Column F: Insurance Paid
-        insurance_payment = _safe_float(data.get("Insurance Payment", 0))
-        ws.cell(row=row, column=6, value=insurance_payment)
-        
-        # Column G: Insurance Contract Amount (D + E + F)
-        contracted_rate = calculations.get("contracted_rate", 0)
-        ws.cell(row=row, column=7, value=contracted_rate)
-        
-        # Column H: 65% Keisha Contracted rate
-        counselor_65 = calculations.get("counselor_65_percent", 0)
-        ws.cell(row=row, column=8, value=counselor_65)
+        values, comment_text = _claim_row(data, calculations, running_total)
         
-        # Column I: Amount to Keisha (copay and deductible subtracted)
-        # This is F - (D + E)
-        total_payout = calculations.get("total_payout", 0)
-        ws.cell(row=row, column=9, value=total_payout)
-        
-        # Column J: 35% Amount Paid to GWC per claim
-        gwc_35 = calculations.get("gwc_35_percent", 0)
-        ws.cell(row=row, column=10, value=gwc_35)
-        
-        # Column K: Total payout to Keisha (running sum)
-        # Calculate running sum of column I
-        if row == 2:  # First data row
-            ws.cell(row=row, column=11, value=total_payout)
-        else:
-            # Formula: Previous K + Current I
-            ws.cell(row=row, column=11, value=f"=K{row-1}+I{row}")
-        
-        # Column L: Remarks
-        remarks = data.get("Remarks", "")
-        ws.cell(row=row, column=12, value=remarks)
+        # One append per row instead of twelve ws.cell() calls.
+        # ExcelBatch tracks row as ws.max_row + 1, which is where append() writes.
+        ws.append(values)
         
         # Apply formatting and validation comments
-        _format_row(ws, row, calculations, data)
+        _format_row(ws, row, comment_text)
         
     except Exception as e:
         logger.error(f"Failed to write row {row}: {e}")
         raise
 
 
-def _format_row(ws, row, calculations, data):
-    """Applies basic formatting and optional validation comments."""
-    # Get warnings from calculations and validation
-    warnings = []
+def _claim_row(data, calculations, running_total):
+    """Column A-L values for one claim, plus its warning comment text ("" if none)."""
+    # Column D/E/F: Client Copay, Deductible being met (client payments), Insurance Paid
+    copay_val = _safe_float(data.get("Copay", 0))
+    deductible_val = _safe_float(data.get("Deductible", 0))
+    insurance_raw = data.get("Insurance Payment")
+    insurance_payment = _safe_float(insurance_raw)
+    
+    # Column A: Client Name
+    client = data.get("Client", "NOTFOUND")
+    
+    # Column I: Amount to Keisha (copay and deductible subtracted)
+    # This is F - (D + E)
+    total_payout = calculations.total_payout
     
-    if calculations.get("warnings"):
-        warnings.extend(calculations["warnings"])
+    values = (
+        client,                              # A
+        data.get("Insurance", "NOTFOUND"),   # B: Insurance
+        data.get("Date", "NOTFOUND"),        # C: Date of Service
+        copay_val,                           # D
+        deductible_val,                      # E
+        insurance_payment,                   # F
+        calculations.contracted_rate,        # G: Insurance Contract Amount (D + E + F)
+        calculations.counselor_65_percent,   # H: 65% Keisha Contracted rate
+        total_payout,                        # I
+        calculations.gwc_35_percent,         # J: 35% Amount Paid to GWC per claim
+        running_total,                       # K: Total payout to Keisha (running sum of column I)
+        data.get("Remarks", ""),             # L: Remarks
+    )
+    
+    comment_text = _comment_text(calculations,
+                                 client_missing=client == "NOTFOUND",
+                                 insurance_missing=insurance_raw == "NOTFOUND")
+    return values, comment_text
+
+
+def _comment_text(calculations, client_missing: bool, insurance_missing: bool) -> str:
+    """Warning lines for a row's column A comment ("" if there's nothing to flag)."""
+    existing = calculations.warnings
+    valid = calculations.calculations_valid
+    
+    # Clean row (the common case): nothing to build
+    if not existing and valid and not client_missing and not insurance_missing:
+        return ""
+    
+    # Get warnings from calculations and validation
+    warnings = list(existing) if existing else []
     
-    if not calculations.get("calculations_valid", True):
+    if not valid:
         warnings.append("Calculations may be incomplete - check values")
     
     # Check for missing critical data
-    if data.get("Client") == "NOTFOUND":
+    if client_missing:
         warnings.append("Client name not found")
-    if data.get("Insurance Payment") == "NOTFOUND":
+    if insurance_missing:
         warnings.append("Insurance payment not found")
     
-    # Apply borders
-    border = Border(
-        left=Side(style="thin", color="D0D0D0"),
-        right=Side(style="thin", color="D0D0D0"),
-        top=Side(style="thin", color="D0D0D0"),
-        bottom=Side(style="thin", color="D0D0D0"),
-    )
+    return "\n".join(warnings).strip()
+
+
+def _format_row(ws, row, comment_text: str):
+    """Applies basic formatting and the optional validation comment."""
+    # Columns A-L of this row in one lookup (ws[row] would also pick up
+    # any extra columns a user added to the sheet)
+    row_cells = next(ws.iter_rows(min_row=row, max_row=row, max_col=12))
     
     # Apply formatting to all cells in row
-    for col in range(1, 13):
-        cell = ws.cell(row=row, column=col)
-        cell.border = border
-        cell.alignment = Alignment(vertical="center")
-        
-        # Format currency columns (D, E, F, G, H, I, J, K)
-        if col in [4, 5, 6, 7, 8, 9, 10, 11]:
-            cell.number_format = '$#,##0.00'
+    for cell in row_cells:
+        cell.border = _ROW_BORDER
+        cell.alignment = _ROW_ALIGN
+    
+    # Format currency columns (D, E, F, G, H, I, J, K)
+    for cell in row_cells[3:11]:
+        cell.number_format = '$#,##0.00'
     
     # Add comment if there are warnings
-    if warnings:
-        comment_text = "\n".join(warnings).strip()
+    if comment_text:
+        row_cells[0].comment = Comment(comment_text, _COMMENT_AUTHOR,
+                                       width=_COMMENT_WIDTH, height=_COMMENT_HEIGHT)
+        
+        # Highlight row with light yellow if there are issues
+        for cell in row_cells:
+            cell.fill = _YELLOW_FILL
+
+
+class _XlsxNewSheet:
+    """
+    A brand-new counselor sheet written with xlsxwriter: same headers,
+    widths, formats and comments as the openpyxl path.
+    """
+    
+    def __init__(self, path: str):
+        # constant_memory streams each row to disk as soon as it's complete;
+        # strings_to_urls off so remark text is never turned into a hyperlink
+        self.wb = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+        self.ws = self.wb.add_worksheet()
+        
+        header = self.wb.add_format({
+            "bold": True, "font_size": 11, "font_color": "#FFFFFF", "bg_color": "#4472C4",
+            "align": "center", "valign": "vcenter", "text_wrap": True,
+        })
+        cell = {"border": 1, "border_color": "#D0D0D0", "valign": "vcenter"}
+        currency = dict(cell, num_format="$#,##0.00")
+        yellow = {"bg_color": "#FFF9C4", "pattern": 1}
+        
+        # Per column (A-L): (normal format, highlighted format)
+        plain_formats = (self.wb.add_format(cell), self.wb.add_format(dict(cell, **yellow)))
+        money_formats = (self.wb.add_format(currency), self.wb.add_format(dict(currency, **yellow)))
+        self._formats = tuple(money_formats if 3 <= col <= 10 else plain_formats for col in range(12))
+        
+        for first, last, width in _COL_WIDTHS:
+            self.ws.set_column(first - 1, last - 1, width)
+        self.ws.write_row(0, 0, _HEADERS, header)
+    
+    def write_claim(self, row: int, values: tuple, comment_text: str):
+        """Write one claim at 1-based Excel row `row`."""
+        highlight = 1 if comment_text else 0
+        for col, value in enumerate(values):
+            self.ws.write(row - 1, col, value, self._formats[col][highlight])
+        if comment_text:
+            self.ws.write_comment(row - 1, 0, comment_text, {
+                "author": _COMMENT_AUTHOR, "width": _COMMENT_WIDTH, "height": _COMMENT_HEIGHT,
+            })
+    
+    def close(self, save: bool = True):
+        # xlsxwriter always writes the file; ExcelBatch discards it if not saving
+        self.wb.close()
+
+
+class _WriteOnlyNewSheet:
+    """
+    A brand-new counselor sheet written with openpyxl in write-only mode
+    (used when xlsxwriter isn't available or ENGINE is "openpyxl").
+    
+    Write-only worksheets can't be indexed after a row is appended, so each
+    row is built from WriteOnlyCells with the style and comment already set.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.wb = Workbook(write_only=True)
+        self.ws = self.wb.create_sheet()
+        
+        # Column widths must be set before the first row is written
+        for first, last, width in _COL_WIDTHS:
+            dimension = self.ws.column_dimensions[get_column_letter(first)]
+            dimension.min = first
+            dimension.max = last
+            dimension.width = width
+        
+        header_cells = []
+        for title in _HEADERS:
+            cell = WriteOnlyCell(self.ws, value=title)
+            cell.font = _HEADER_FONT
+            cell.alignment = _HEADER_ALIGN
+            cell.fill = _HEADER_FILL
+            header_cells.append(cell)
+        self.ws.append(header_cells)
+    
+    def write_claim(self, row: int, values: tuple, comment_text: str):
+        """Append one claim (rows are written in order, so `row` is informational)."""
+        cells = []
+        for col, value in enumerate(values):
+            cell = WriteOnlyCell(self.ws, value=value)
+            cell.border = _ROW_BORDER
+            cell.alignment = _ROW_ALIGN
+            if 3 <= col <= 10:
+                cell.number_format = '$#,##0.00'
+            if comment_text:
+                cell.fill = _YELLOW_FILL
+            cells.append(cell)
+        
+        # The comment has to be on the client cell before it's appended
         if comment_text:
-            comment = Comment(comment_text, "ClaimAutomation")
-            comment.width = 300
-            comment.height = 100
-            ws.cell(row=row, column=1).comment = comment
-            
-            # Highlight row with light yellow if there are issues
-            yellow_fill = PatternFill(start_color="FFF9C4", end_color="FFF9C4", fill_type="solid")
-            for col in range(1, 13):
-                ws.cell(row=row, column=col).fill = yellow_fill
+            cells[0].comment = Comment(comment_text, _COMMENT_AUTHOR,
+                                       width=_COMMENT_WIDTH, height=_COMMENT_HEIGHT)
+        self.ws.append(cells)
+    
+    def close(self, save: bool = True):
+        # A write-only workbook is only serialized on save
+        if save:
+            self.wb.save(self.path)
 
 
 def _safe_float(value) -> float:
     """Safely convert value to float, return 0 if invalid."""
-    if value is None or value in ("NOTFOUND", "N/A", ""):
+    if value is None:
         return 0.0
+    if isinstance(value, str):
+        # Set lookup only for strings (other values may be unhashable)
+        if value in _NA_SENTINELS:
+            return 0.0
+        value = value.translate(_MONEY_TABLE).strip()
     try:
-        if isinstance(value, str):
-            value = value.replace("$", "").replace(",", "").strip()
         return float(value)
     except (ValueError, TypeError):
         return 0.0
@@ -237,8 +497,29 @@ def get_counselor_excel_path(counselor: str) -> str:
 
 
 def counselor_file_exists(counselor: str) -> bool:
-    """Check if a counselor's Excel file exists."""
-    return os.path.exists(get_counselor_excel_path(counselor))
+    """
+    Check if a counselor's Excel file exists.
+    
+    Answered from a cached listing of EXCEL_DIR (one directory read instead
+    of a stat per call). ExcelBatch refreshes it after saving; call
+    invalidate_file_cache() if files are added or removed some other way.
+    """
+    name = os.path.normcase(f"{counselor}.xlsx")
+    return name in _list_excel_dir(config.EXCEL_DIR)
+
+
+@lru_cache(maxsize=1)
+def _list_excel_dir(excel_dir: str) -> frozenset:
+    """File names in excel_dir (normcase'd, so lookups match os.path.exists on Windows)."""
+    try:
+        return frozenset(os.path.normcase(name) for name in os.listdir(excel_dir))
+    except FileNotFoundError:
+        return frozenset()
+
+
+def invalidate_file_cache():
+    """Forget the cached EXCEL_DIR listing used by counselor_file_exists()."""
+    _list_excel_dir.cache_clear()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -246,6 +527,8 @@ def counselor_file_exists(counselor: str) -> bool:
 # ═══════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    from calculations_module import ClaimCalc
+    
     print("Testing excel_module.py...")
     
     # Fake test data
@@ -259,14 +542,14 @@ if __name__ == "__main__":
         "Remarks": "PR-3 Copay; PR-1 Deductible"
     }
     
-    fake_calc = {
-        "contracted_rate": 200.00,
-        "counselor_65_percent": 130.00,
-        "total_payout": 50.00,  # 125 - (25 + 50)
-        "gwc_35_percent": 70.00,
-        "calculations_valid": True,
-        "warnings": []
-    }
+    fake_calc = ClaimCalc(
+        contracted_rate=200.00,
+        counselor_65_percent=130.00,
+        total_payout=50.00,  # 125 - (25 + 50)
+        gwc_35_percent=70.00,
+        client_responsibility=75.00,
+        calculations_valid=True,
+    )
     
     # Test writing
     try:
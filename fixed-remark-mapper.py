@@ -13,8 +13,92 @@ References:
 """
 
 from typing import Dict, Tuple, Optional
+from collections import defaultdict, namedtuple
 import re
 
+# Remark codes like "PR-3", "CO45", "OA-23" (family, number)
+_CODE_RE = re.compile(r'\b(PR|CO|OA|PI)-?(\d+)\b')
+
+# Characters dropped from ERA dollar amounts: "($1,015.00)" -> "1015.00"
+_STRIP_TABLE = str.maketrans("", "", "$,()")
+
+# How one remark code is applied:
+#   slot           - result field that receives the amount
+#   guard          - the amount is only set if all of these fields are still empty
+#   source         - "patient" (Patient Amount) or "adjustment" (Adjustments, else Patient Amount)
+#   classification - text added to the classification string
+#   reason         - text added to adjustment_reason ({num} = code number as written)
+#   owes           - whether the code makes the patient responsible
+_Handler = namedtuple("_Handler", "slot guard source classification reason owes")
+
+# Keyed by code number without leading zeros ("03" and "3" are the same code)
+_HANDLERS = {
+    # PR - Patient Responsibility
+    ("PR", "3"): _Handler("copay", ("copay",), "patient", "Copay",
+                          "Patient copayment per insurance plan", True),
+    ("PR", "1"): _Handler("deductible", ("deductible",), "patient", "Deductible",
+                          "Patient deductible not met", True),
+    ("PR", "2"): _Handler("coinsurance", ("coinsurance",), "patient", "Coinsurance",
+                          "Patient coinsurance per plan percentage", True),
+    ("PR", "140"): _Handler("deductible", ("deductible",), "patient", "Denial - Patient ID Mismatch",
+                            "Claim denied: Patient identification does not match insurance records", True),
+    
+    # CO - Contractual Obligation (provider write-off)
+    ("CO", "38"): _Handler("provider_adjustment", ("provider_adjustment",), "adjustment",
+                           "Contractual Adjustment - Out of Network",
+                           "Provider contractual write-off: Out of network services", False),
+    ("CO", "11"): _Handler("provider_adjustment", ("provider_adjustment",), "adjustment",
+                           "Contractual Adjustment - Not Covered",
+                           "Provider write-off: Service not covered under plan", False),
+    ("CO", "16"): _Handler("provider_adjustment", ("provider_adjustment",), "adjustment",
+                           "Contractual Adjustment - Incomplete Info",
+                           "Provider write-off: Claim lacks required information", False),
+    ("CO", "97"): _Handler("provider_adjustment", ("provider_adjustment",), "adjustment",
+                           "Contractual Adjustment - Bundled",
+                           "Provider write-off: Service bundled with another procedure", False),
+    
+    # OA - Other Adjustments
+    ("OA", "18"): _Handler("provider_adjustment", ("provider_adjustment",), "adjustment",
+                           "Administrative Adjustment - Duplicate",
+                           "Administrative adjustment: Duplicate claim", False),
+    ("OA", "23"): _Handler("provider_adjustment", ("provider_adjustment",), "adjustment",
+                           "Administrative Adjustment - Error",
+                           "Administrative adjustment: Payer error correction", False),
+    
+    # PI - Payer-Initiated
+    ("PI", "204"): _Handler("copay", ("copay", "deductible"), "patient", "Payer-Initiated - Not Covered",
+                            "Service not covered: Patient may be responsible or provider may write off", True),
+    ("PI", "119"): _Handler("copay", ("copay", "deductible"), "patient", "Payer-Initiated - Benefit Max Exceeded",
+                            "Benefit maximum reached: Patient may be responsible", True),
+}
+
+# Codes without a specific entry
+_DEFAULT_BY_FAMILY = {
+    "PR": _Handler("copay", ("copay", "deductible"), "patient", "Patient Responsibility (Other)",
+                   "Patient responsibility per insurance determination (PR-{num})", True),
+    "CO": _Handler("provider_adjustment", ("provider_adjustment",), "adjustment", "Contractual Adjustment",
+                   "Provider contractual write-off per insurance agreement (CO-{num})", False),
+    "OA": _Handler("provider_adjustment", ("provider_adjustment",), "adjustment", "Administrative Adjustment",
+                   "Administrative adjustment by payer (OA-{num})", False),
+    "PI": _Handler("copay", ("copay", "deductible"), "patient", "Payer-Initiated Reduction",
+                   "Payer-initiated adjustment: Review required (PI-{num})", True),
+}
+
+# Families are applied in this order (PR amounts take precedence over PI)
+_FAMILY_ORDER = ("PR", "CO", "OA", "PI")
+
+# Result for a claim with no remark codes and no patient amount (the common
+# clean claim); copied per call, with a fresh codes_found list
+_EMPTY_RESULT = {
+    "copay": "",
+    "deductible": "",
+    "coinsurance": "",
+    "provider_adjustment": "",
+    "classification": "Unknown",
+    "adjustment_reason": "",
+    "patient_owes": False,
+}
+
 
 def map_remark_codes(remarks: str, patient_amount: str, adjustment_amount: str = "") -> Dict[str, any]:
     """
@@ -40,172 +124,57 @@ def map_remark_codes(remarks: str, patient_amount: str, adjustment_amount: str =
             - codes_found: list (all remark codes detected)
     """
     
+    # Nothing to classify
+    if not remarks and not patient_amount and not adjustment_amount:
+        return dict(_EMPTY_RESULT, codes_found=[])
+    
     # Normalize inputs
     remarks = (remarks or "").upper().strip()
     patient_amount_clean = _clean_amount(patient_amount)
     adjustment_amount_clean = _clean_amount(adjustment_amount)
     
-    # Initialize return values
-    copay = ""
-    deductible = ""
-    coinsurance = ""
-    provider_adjustment = ""
-    classification_parts = []
-    adjustment_reasons = []
-    patient_owes = False
-    codes_found = []
-    
     # Extract all remark codes from text
-    all_codes = re.findall(r'\b(PR|CO|OA|PI)-?(\d+)\b', remarks)
-    codes_found = [f"{code}-{num}" for code, num in all_codes]
+    all_codes = _CODE_RE.findall(remarks)
     
-    # === PROCESS PR CODES (Patient Responsibility) ===
-    pr_codes = [num for code, num in all_codes if code == "PR"]
+    # No codes and no patient amount: nothing below would change the result
+    if not all_codes and not patient_amount_clean:
+        return dict(_EMPTY_RESULT, codes_found=[])
     
-    for pr_num in pr_codes:
-        if pr_num in ["3", "03"]:
-            # PR-3: Copayment Amount
-            if not copay:  # Only set if not already set
-                copay = patient_amount_clean
-            classification_parts.append("Copay")
-            adjustment_reasons.append("Patient copayment per insurance plan")
-            patient_owes = True
-        
-        elif pr_num in ["1", "01"]:
-            # PR-1: Deductible Amount
-            if not deductible:
-                deductible = patient_amount_clean
-            classification_parts.append("Deductible")
-            adjustment_reasons.append("Patient deductible not met")
-            patient_owes = True
-        
-        elif pr_num in ["2", "02"]:
-            # PR-2: Coinsurance Amount
-            if not coinsurance:
-                coinsurance = patient_amount_clean
-            classification_parts.append("Coinsurance")
-            adjustment_reasons.append("Patient coinsurance per plan percentage")
-            patient_owes = True
-        
-        elif pr_num == "140":
-            # PR-140: Patient/Insured health identification mismatch (DENIAL)
-            if not deductible:
-                deductible = patient_amount_clean
-            classification_parts.append("Denial - Patient ID Mismatch")
-            adjustment_reasons.append("Claim denied: Patient identification does not match insurance records")
-            patient_owes = True
-        
-        else:
-            # Other PR codes: Generic patient responsibility
-            if not copay and not deductible:
-                copay = patient_amount_clean
-            classification_parts.append("Patient Responsibility (Other)")
-            adjustment_reasons.append(f"Patient responsibility per insurance determination (PR-{pr_num})")
-            patient_owes = True
+    codes_found = [f"{code}-{num}" for code, num in all_codes]
     
-    # === PROCESS CO CODES (Contractual Obligation - Provider Write-Off) ===
-    co_codes = [num for code, num in all_codes if code == "CO"]
+    # Initialize return values
+    amounts = {"copay": "", "deductible": "", "coinsurance": "", "provider_adjustment": ""}
+    classification_parts = []
+    adjustment_reasons = []
+    patient_owes = False
     
-    if co_codes:
-        # Use adjustment_amount if provided, otherwise fall back to patient_amount
-        adj_amount = adjustment_amount_clean if adjustment_amount_clean else patient_amount_clean
-        
-        for co_num in co_codes:
-            if co_num == "38":
-                # CO-38: Out of network services
-                if not provider_adjustment:
-                    provider_adjustment = adj_amount
-                classification_parts.append("Contractual Adjustment - Out of Network")
-                adjustment_reasons.append("Provider contractual write-off: Out of network services")
-            
-            elif co_num == "11":
-                # CO-11: Service not covered
-                if not provider_adjustment:
-                    provider_adjustment = adj_amount
-                classification_parts.append("Contractual Adjustment - Not Covered")
-                adjustment_reasons.append("Provider write-off: Service not covered under plan")
-            
-            elif co_num == "16":
-                # CO-16: Incomplete information
-                if not provider_adjustment:
-                    provider_adjustment = adj_amount
-                classification_parts.append("Contractual Adjustment - Incomplete Info")
-                adjustment_reasons.append("Provider write-off: Claim lacks required information")
-            
-            elif co_num == "97":
-                # CO-97: Bundled service
-                if not provider_adjustment:
-                    provider_adjustment = adj_amount
-                classification_parts.append("Contractual Adjustment - Bundled")
-                adjustment_reasons.append("Provider write-off: Service bundled with another procedure")
-            
-            else:
-                # Other CO codes
-                if not provider_adjustment:
-                    provider_adjustment = adj_amount
-                classification_parts.append("Contractual Adjustment")
-                adjustment_reasons.append(f"Provider contractual write-off per insurance agreement (CO-{co_num})")
+    # Adjustment codes use adjustment_amount if provided, otherwise fall back to patient_amount
+    sources = {
+        "patient": patient_amount_clean,
+        "adjustment": adjustment_amount_clean if adjustment_amount_clean else patient_amount_clean,
+    }
     
-    # === PROCESS OA CODES (Other Adjustments) ===
-    oa_codes = [num for code, num in all_codes if code == "OA"]
+    # Bucket codes by family in one pass (text order kept within a family)
+    buckets = defaultdict(list)
+    for family, num in all_codes:
+        buckets[family].append(num)
     
-    if oa_codes:
-        adj_amount = adjustment_amount_clean if adjustment_amount_clean else patient_amount_clean
-        
-        for oa_num in oa_codes:
-            if oa_num == "18":
-                # OA-18: Duplicate claim
-                if not provider_adjustment:
-                    provider_adjustment = adj_amount
-                classification_parts.append("Administrative Adjustment - Duplicate")
-                adjustment_reasons.append("Administrative adjustment: Duplicate claim")
+    for family in _FAMILY_ORDER:
+        default = _DEFAULT_BY_FAMILY[family]
+        for num in buckets[family]:
+            handler = _HANDLERS.get((family, num.lstrip("0") or "0")) or default
             
-            elif oa_num == "23":
-                # OA-23: Administrative error
-                if not provider_adjustment:
-                    provider_adjustment = adj_amount
-                classification_parts.append("Administrative Adjustment - Error")
-                adjustment_reasons.append("Administrative adjustment: Payer error correction")
-            
-            else:
-                # Other OA codes
-                if not provider_adjustment:
-                    provider_adjustment = adj_amount
-                classification_parts.append("Administrative Adjustment")
-                adjustment_reasons.append(f"Administrative adjustment by payer (OA-{oa_num})")
-    
-    # === PROCESS PI CODES (Payer-Initiated Reductions) ===
-    pi_codes = [num for code, num in all_codes if code == "PI"]
-    
-    for pi_num in pi_codes:
-        if pi_num == "204":
-            # PI-204: Service not covered
-            if not copay and not deductible:
-                copay = patient_amount_clean
-            classification_parts.append("Payer-Initiated - Not Covered")
-            adjustment_reasons.append("Service not covered: Patient may be responsible or provider may write off")
-            patient_owes = True
-        
-        elif pi_num == "119":
-            # PI-119: Benefit maximum exceeded
-            if not copay and not deductible:
-                copay = patient_amount_clean
-            classification_parts.append("Payer-Initiated - Benefit Max Exceeded")
-            adjustment_reasons.append("Benefit maximum reached: Patient may be responsible")
-            patient_owes = True
-        
-        else:
-            # Other PI codes
-            if not copay and not deductible:
-                copay = patient_amount_clean
-            classification_parts.append("Payer-Initiated Reduction")
-            adjustment_reasons.append(f"Payer-initiated adjustment: Review required (PI-{pi_num})")
-            patient_owes = True
+            if not any(amounts[field] for field in handler.guard):
+                amounts[handler.slot] = sources[handler.source]
+            classification_parts.append(handler.classification)
+            adjustment_reasons.append(handler.reason.format(num=num))
+            if handler.owes:
+                patient_owes = True
     
     # === HANDLE NO CODES FOUND ===
     if not codes_found:
         if patient_amount_clean:
-            copay = patient_amount_clean
+            amounts["copay"] = patient_amount_clean
             classification_parts.append("Unclassified Patient Amount")
             adjustment_reasons.append("No remark code found - manual review recommended")
             patient_owes = True
@@ -219,10 +188,10 @@ def map_remark_codes(remarks: str, patient_amount: str, adjustment_amount: str =
     adjustment_reason = " | ".join(adjustment_reasons) if adjustment_reasons else ""
     
     return {
-        "copay": copay,
-        "deductible": deductible,
-        "coinsurance": coinsurance,
-        "provider_adjustment": provider_adjustment,
+        "copay": amounts["copay"],
+        "deductible": amounts["deductible"],
+        "coinsurance": amounts["coinsurance"],
+        "provider_adjustment": amounts["provider_adjustment"],
         "classification": classification,
         "adjustment_reason": adjustment_reason,
         "patient_owes": patient_owes,
@@ -246,7 +215,7 @@ def _clean_amount(amount: str) -> str:
         return ""
     
     # Remove $, commas, parentheses, and whitespace
-    cleaned = amount.replace("$", "").replace(",", "").replace("(", "").replace(")", "").strip()
+    cleaned = amount.translate(_STRIP_TABLE).strip()
     
     # Validate it's a number
     try:
@@ -1,75 +1,143 @@
 # gui.py - Modern PyQt6 interface for Claim Processor (Simplified & Styled)
 import sys
 import os
+import bisect
+import threading
+from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QTextEdit, QLineEdit,
     QFileDialog, QMessageBox, QGroupBox, QGridLayout, QFrame,
-    QDialog, QListWidget, QDialogButtonBox, QInputDialog
+    QDialog, QListView, QDialogButtonBox, QInputDialog
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QColor, QPalette
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, QUrl, QStringListModel, QSignalBlocker,
+    QLocale, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QPalette, QTextCursor, QDesktopServices
 
 import config
-import claim_processor
+import utils
+
+
+@lru_cache(maxsize=1)
+def app_stylesheet() -> str:
+    """The application stylesheet (app.qss next to this file), read once."""
+    try:
+        return Path(__file__).with_name("app.qss").read_text(encoding="utf-8")
+    except OSError as e:
+        print(f"⚠️  Could not load app.qss: {e}")
+        return ""
+
+
+@lru_cache(maxsize=None)
+def _font(family: str, size: int, weight: int = QFont.Weight.Normal.value) -> QFont:
+    """Shared QFont per (family, size, weight), so each font is matched once."""
+    return QFont(family, size, QFont.Weight(weight))
+
+
+# Processing log history limit, in lines (one QTextDocument block each)
+_LOG_MAX_BLOCKS = 2000
+
+# Welcome banner for the processing log, built once (one setHtml per show)
+_WELCOME_HTML = "<br>".join([
+    "<span style='color: #4a90e2; font-weight: bold;'>╔" + "═" * 78 + "╗</span>",
+    "<span style='color: #4a90e2; font-weight: bold;'>║" + " " * 22 + "🎯 CLAIM PROCESSOR READY" + " " * 33 + "║</span>",
+    "<span style='color: #4a90e2; font-weight: bold;'>╚" + "═" * 78 + "╝</span>\n",
+    "<span style='color: #28a745;'>📌 STEPS:</span>",
+    "<span style='color: #d4d4d4;'>   1️⃣  Select counselor</span>",
+    "<span style='color: #d4d4d4;'>   2️⃣  Drop or browse ERA screenshot</span>",
+    "<span style='color: #d4d4d4;'>   3️⃣  Click Process Claim</span>",
+    "<span style='color: #d4d4d4;'>   4️⃣  Review results & open Excel\n</span>",
+    "<span style='color: #6c757d;'>" + "─" * 80 + "</span>\n",
+])
+
 
+# A dropped/browsed file, stat'ed and hashed once when it's picked up.
+# digest is utils.file_digest() - the OCR cache key - so it isn't re-read later.
+FileEntry = namedtuple("FileEntry", "path basename ext size digest")
 
-class ProcessingThread(QThread):
-    """Background thread for claim processing to prevent GUI freezing."""
+
+def make_file_entry(path: str) -> FileEntry:
+    """Build the FileEntry for an existing file."""
+    return FileEntry(
+        path=path,
+        basename=os.path.basename(path),
+        ext=os.path.splitext(path)[1].lower(),
+        size=os.path.getsize(path),
+        digest=utils.file_digest(path),
+    )
+
+
+# claim_processor (NumPy, OpenCV, the validators and their Numba kernels)
+# isn't imported at module level, so the window paints before it loads
+def _preload_processor():
+    """Import claim_processor ahead of the first claim."""
+    import claim_processor  # noqa: F401
+
+
+class WorkerSignals(QObject):
+    """Signals for ProcessingTask (a QRunnable can't define signals itself)."""
     finished = pyqtSignal(dict)
     log_message = pyqtSignal(str)
+
+
+class ProcessingTask(QRunnable):
+    """
+    One claim, processed on a QThreadPool worker to keep the GUI responsive.
     
-    def __init__(self, image_path, counselor, counselors_list):
+    Pool threads stay alive between claims, so dropping many files doesn't
+    start a thread per file, and claims are OCR'd in parallel.
+    """
+    
+    def __init__(self, entry, counselor, counselors_list):
         super().__init__()
-        self.image_path = image_path
+        self.setAutoDelete(True)
+        self.signals = WorkerSignals()
+        self.entry = entry
         self.counselor = counselor
+        # Shared with the window (not copied per task)
         self.counselors_list = counselors_list
     
     def run(self):
+        import claim_processor
+        
+        signals = self.signals
         try:
-            self.log_message.emit(f"\n{'─' * 80}")
-            self.log_message.emit(f"⏳ Processing: {os.path.basename(self.image_path)}")
-            self.log_message.emit(f"   └─ Counselor: {self.counselor}")
+            signals.log_message.emit(f"\n{'─' * 80}")
+            signals.log_message.emit(f"⏳ Processing: {self.entry.basename}")
+            signals.log_message.emit(f"   └─ Counselor: {self.counselor}")
             
             result = claim_processor.process_claim(
-                self.image_path, 
+                self.entry.path, 
                 self.counselors_list,
                 counselor=self.counselor,
                 insurance="",
                 copay="",
-                deductible=""
+                deductible="",
+                digest=self.entry.digest
             )
             
-            self.finished.emit(result)
+            signals.finished.emit(result)
             
         except Exception as e:
-            self.log_message.emit(f"\n❌ ERROR: {str(e)}")
-            self.finished.emit({"success": False, "message": str(e)})
+            signals.log_message.emit(f"\n❌ ERROR: {str(e)}")
+            signals.finished.emit({"success": False, "message": str(e)})
 
 
 class DropZone(QFrame):
-    """Custom drag-and-drop widget for file uploads."""
+    """Custom drag-and-drop widget for file uploads (emits a list of paths)."""
     files_dropped = pyqtSignal(list)
     
+    # Accepted image types - also used for the Browse dialog filter
+    _ALLOWED_EXT = frozenset({".png", ".jpg", ".jpeg"})
+    
     def __init__(self):
         super().__init__()
         self.setAcceptDrops(True)
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
-        self.setStyleSheet("""
-            DropZone {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f8f9fa, stop:1 #e9ecef);
-                border: 3px dashed #4a90e2;
-                border-radius: 12px;
-                min-height: 200px;
-            }
-            DropZone:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e3f2fd, stop:1 #bbdefb);
-                border-color: #2196F3;
-            }
-        """)
         
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -77,22 +145,22 @@ class DropZone(QFrame):
         
         icon_label = QLabel("📁")
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_label.setFont(QFont("Segoe UI", 48))
+        icon_label.setFont(_font("Segoe UI", 48))
         
         text_label = QLabel("Drop ERA screenshots here")
         text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        text_label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        text_label.setStyleSheet("color: #2c3e50;")
+        text_label.setFont(_font("Segoe UI", 14, QFont.Weight.Bold.value))
+        text_label.setObjectName("dropTitle")
         
         subtitle = QLabel("or click Browse below")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setFont(QFont("Segoe UI", 11))
-        subtitle.setStyleSheet("color: #7f8c8d;")
+        subtitle.setFont(_font("Segoe UI", 11))
+        subtitle.setObjectName("dropSubtitle")
         
         format_label = QLabel("Supported: PNG, JPG, JPEG")
         format_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        format_label.setFont(QFont("Segoe UI", 9))
-        format_label.setStyleSheet("color: #95a5a6;")
+        format_label.setFont(_font("Segoe UI", 9))
+        format_label.setObjectName("dropFormats")
         
         layout.addWidget(icon_label)
         layout.addWidget(text_label)
@@ -109,11 +177,10 @@ class DropZone(QFrame):
     def dropEvent(self, event):
         files = []
         for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if os.path.isfile(file_path):
-                ext = os.path.splitext(file_path)[1].lower()
-                if ext in ['.png', '.jpg', '.jpeg']:
-                    files.append(file_path)
+            path = Path(url.toLocalFile())
+            # Cheap suffix check first; only matching names hit the disk
+            if path.suffix.lower() in DropZone._ALLOWED_EXT and path.is_file():
+                files.append(str(path))
         
         if files:
             self.files_dropped.emit(files)
@@ -122,67 +189,47 @@ class DropZone(QFrame):
 
 
 class CounselorDialog(QDialog):
-    """Dialog for managing counselors."""
+    """Dialog for managing counselors (edits the sorted `counselors` list in place)."""
     
     def __init__(self, counselors, parent=None):
         super().__init__(parent)
         self.counselors = counselors
+        self._counselor_set = set(counselors)
+        
+        # Edits are saved 500 ms after the last one (and when the dialog
+        # closes), so a burst of adds/deletes writes counselors.json once
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_counselors)
         self.setWindowTitle("Manage Counselors")
         self.setModal(True)
         self.resize(450, 500)
         
-        # Modern styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fa;
-            }
-            QListWidget {
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                padding: 5px;
-                background-color: white;
-                font-size: 11pt;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QListWidget::item:selected {
-                background-color: #4a90e2;
-                color: white;
-            }
-            QListWidget::item:hover {
-                background-color: #e3f2fd;
-            }
-            QPushButton {
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 10pt;
-            }
-        """)
-        
         layout = QVBoxLayout()
         layout.setSpacing(15)
         
         # Title
         title = QLabel("👥 Counselor Management")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; padding: 10px;")
+        title.setFont(_font("Segoe UI", 14, QFont.Weight.Bold.value))
+        title.setObjectName("titleLabel")
         layout.addWidget(title)
         
         # List
-        self.list_widget = QListWidget()
-        self.list_widget.addItems(self.counselors)
-        layout.addWidget(self.list_widget)
+        # One model reset fills the list; rows mirror self.counselors
+        self.model = QStringListModel(self.counselors, self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.list_view)
         
         # Buttons
         btn_layout = QHBoxLayout()
         add_btn = QPushButton("➕ Add Counselor")
         delete_btn = QPushButton("🗑️ Delete Selected")
         
-        add_btn.setStyleSheet("background-color: #28a745; color: white;")
-        delete_btn.setStyleSheet("background-color: #dc3545; color: white;")
+        add_btn.setObjectName("addBtn")
+        delete_btn.setObjectName("deleteBtn")
         
         add_btn.clicked.connect(self.add_counselor)
         delete_btn.clicked.connect(self.delete_counselor)
@@ -192,7 +239,7 @@ class CounselorDialog(QDialog):
         
         # Close button
         close_btn = QPushButton("✓ Done")
-        close_btn.setStyleSheet("background-color: #6c757d; color: white;")
+        close_btn.setObjectName("closeBtn")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
         
@@ -202,23 +249,26 @@ class CounselorDialog(QDialog):
         name, ok = QInputDialog.getText(self, "Add Counselor", "Enter counselor name:")
         if ok and name.strip():
             name = name.strip()
-            if name in self.counselors:
+            if name in self._counselor_set:
                 QMessageBox.information(self, "Duplicate", f"'{name}' already exists.")
                 return
             
-            self.counselors.append(name)
-            self.counselors.sort()
-            config.save_counselors(self.counselors)
-            self.list_widget.clear()
-            self.list_widget.addItems(self.counselors)
+            # Insert at the sorted position in both the list and the widget
+            self._counselor_set.add(name)
+            row = bisect.bisect_left(self.counselors, name)
+            self.counselors.insert(row, name)
+            self.model.insertRows(row, 1)
+            self.model.setData(self.model.index(row), name)
+            self._save_timer.start()
     
     def delete_counselor(self):
-        current = self.list_widget.currentItem()
-        if not current:
+        current = self.list_view.currentIndex()
+        if not current.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a counselor to delete.")
             return
         
-        name = current.text()
+        row = current.row()
+        name = self.counselors[row]
         reply = QMessageBox.question(
             self, "Confirm Delete",
             f"Delete counselor '{name}'?\n\nNote: This will NOT delete their Excel/Word files.",
@@ -226,10 +276,20 @@ class CounselorDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.counselors.remove(name)
-            config.save_counselors(self.counselors)
-            self.list_widget.clear()
-            self.list_widget.addItems(self.counselors)
+            self.model.removeRows(row, 1)
+            self.counselors.pop(row)
+            self._counselor_set.discard(name)
+            self._save_timer.start()
+    
+    def _save_counselors(self):
+        config.save_counselors(self.counselors)
+    
+    def done(self, result):
+        # Every way of closing the dialog ends here: write any pending edit
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_counselors()
+        super().done(result)
 
 
 class ClaimGUI(QMainWindow):
@@ -240,84 +300,45 @@ class ClaimGUI(QMainWindow):
         self.setWindowTitle("💼 Insurance Claim Processor")
         self.resize(1100, 850)
         
-        # Load data
-        self.counselors = config.get_counselors()
-        
-        # Processing state
-        self.processing_thread = None
+        # Load data (kept sorted, the order save_counselors() writes).
+        # The combo shows it through a QStringListModel.
+        self.counselors = sorted(config.get_counselors())
+        self.counselor_model = QStringListModel(self.counselors)
+        self._counselor_index = {name: i for i, name in enumerate(self.counselors)}
+        
+        # Processing state: claims run on a shared pool (OCR is the slow
+        # part and parallelizes; exports are serialized in claim_processor)
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(min(4, os.cpu_count() or 1))
+        self.pending_files = []
+        self._active_tasks = set()
+        self._jobs_total = 0
+        self._jobs_succeeded = 0
+        self._batch_counselor = ""
+        
+        # Currency formatting for the summary fields
+        self._locale = QLocale(QLocale.Language.English, QLocale.Country.UnitedStates)
+        
+        # Log lines waiting for the next _flush_log() (one layout pass per batch)
+        self._log_buffer = []
+        self._log_flush_pending = False
         
         # Apply modern theme
         self.apply_modern_theme()
         self.init_ui()
         self.log_welcome()
+        
+        # Load the processing modules in the background while the user reads
+        # the welcome text - on the GUI thread the import (and the Numba
+        # compile it triggers) would freeze the window that was just shown.
+        # A claim dropped before it finishes just waits on the import lock.
+        threading.Thread(target=_preload_processor, name="preload", daemon=True).start()
     
     def apply_modern_theme(self):
-        """Apply a professional modern theme."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f2f5;
-            }
-            QGroupBox {
-                background-color: white;
-                border: 2px solid #e1e4e8;
-                border-radius: 10px;
-                margin-top: 12px;
-                padding: 15px;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-                color: #2c3e50;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                background-color: white;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border-color: #4a90e2;
-            }
-            QLineEdit:read-only {
-                background-color: #f8f9fa;
-                color: #495057;
-            }
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                background-color: white;
-                font-size: 10pt;
-            }
-            QComboBox:focus {
-                border-color: #4a90e2;
-            }
-            QTextEdit {
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                padding: 10px;
-                background-color: white;
-                font-family: 'Consolas', monospace;
-                font-size: 9pt;
-            }
-            QPushButton {
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 10pt;
-                border: none;
-            }
-            QPushButton:hover {
-                opacity: 0.9;
-            }
-            QPushButton:pressed {
-                padding: 11px 19px 9px 21px;
-            }
-        """)
+        """Apply a professional modern theme (app.qss, once for the whole app)."""
+        app = QApplication.instance()
+        if app.styleSheet() != app_stylesheet():
+            app.setStyleSheet(app_stylesheet())
     
     def init_ui(self):
         # Central widget
@@ -331,13 +352,13 @@ class ClaimGUI(QMainWindow):
         # Header
         header_layout = QVBoxLayout()
         header = QLabel("💼 Insurance Claim Processor")
-        header.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
-        header.setStyleSheet("color: #2c3e50; padding: 10px;")
+        header.setFont(_font("Segoe UI", 24, QFont.Weight.Bold.value))
+        header.setObjectName("titleLabel")
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         subtitle = QLabel("Automated OCR • Financial Calculations • Excel & Word Export")
-        subtitle.setFont(QFont("Segoe UI", 11))
-        subtitle.setStyleSheet("color: #7f8c8d; padding-bottom: 10px;")
+        subtitle.setFont(_font("Segoe UI", 11))
+        subtitle.setObjectName("headerSubtitle")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         header_layout.addWidget(header)
@@ -357,13 +378,13 @@ class ClaimGUI(QMainWindow):
         
         counselor_input_layout = QHBoxLayout()
         self.counselor_combo = QComboBox()
-        self.counselor_combo.addItems(self.counselors)
+        self.counselor_combo.setModel(self.counselor_model)
         self.counselor_combo.setMinimumHeight(40)
         counselor_input_layout.addWidget(self.counselor_combo, 3)
         
         manage_btn = QPushButton("⚙️")
         manage_btn.setMaximumWidth(45)
-        manage_btn.setStyleSheet("background-color: #6c757d; color: white;")
+        manage_btn.setObjectName("manageBtn")
         manage_btn.setToolTip("Manage Counselors")
         manage_btn.clicked.connect(self.manage_counselors)
         counselor_input_layout.addWidget(manage_btn)
@@ -382,7 +403,7 @@ class ClaimGUI(QMainWindow):
         
         browse_btn = QPushButton("📂 Browse Files")
         browse_btn.setMinimumHeight(45)
-        browse_btn.setStyleSheet("background-color: #17a2b8; color: white; font-size: 11pt;")
+        browse_btn.setObjectName("browseBtn")
         browse_btn.clicked.connect(self.browse_files)
         upload_layout.addWidget(browse_btn)
         
@@ -415,20 +436,7 @@ class ClaimGUI(QMainWindow):
         # Process button
         self.process_btn = QPushButton("▶️ Process Claim")
         self.process_btn.setMinimumHeight(55)
-        self.process_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                font-size: 13pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:disabled {
-                background-color: #adb5bd;
-            }
-        """)
+        self.process_btn.setObjectName("processBtn")
         self.process_btn.clicked.connect(self.process_current_file)
         self.process_btn.setEnabled(False)
         left_column.addWidget(self.process_btn)
@@ -472,6 +480,10 @@ class ClaimGUI(QMainWindow):
         log_layout = QVBoxLayout()
         
         self.log_text = QTextEdit()
+        self.log_text.setObjectName("logText")
+        # Oldest entries drop off past this many blocks (one per log line),
+        # so long sessions don't slow the log down
+        self.log_text.document().setMaximumBlockCount(_LOG_MAX_BLOCKS)
         self.log_text.setReadOnly(True)
         log_layout.addWidget(self.log_text)
         
@@ -492,10 +504,10 @@ class ClaimGUI(QMainWindow):
         clear_btn = QPushButton("🔄 Clear Log")
         exit_btn = QPushButton("❌ Exit")
         
-        excel_btn.setStyleSheet("background-color: #007bff; color: white;")
-        word_btn.setStyleSheet("background-color: #6f42c1; color: white;")
-        clear_btn.setStyleSheet("background-color: #ffc107; color: black;")
-        exit_btn.setStyleSheet("background-color: #dc3545; color: white;")
+        excel_btn.setObjectName("excelBtn")
+        word_btn.setObjectName("wordBtn")
+        clear_btn.setObjectName("clearBtn")
+        exit_btn.setObjectName("exitBtn")
         
         excel_btn.clicked.connect(self.open_excel_folder)
         word_btn.clicked.connect(self.open_word_folder)
@@ -513,45 +525,70 @@ class ClaimGUI(QMainWindow):
         central_widget.setLayout(main_layout)
     
     def log_welcome(self):
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                font-family: 'Consolas', monospace;
-                font-size: 9pt;
-            }
-        """)
-        self.log_text.append("<span style='color: #4a90e2; font-weight: bold;'>╔" + "═" * 78 + "╗</span>")
-        self.log_text.append("<span style='color: #4a90e2; font-weight: bold;'>║" + " " * 22 + "🎯 CLAIM PROCESSOR READY" + " " * 33 + "║</span>")
-        self.log_text.append("<span style='color: #4a90e2; font-weight: bold;'>╚" + "═" * 78 + "╝</span>\n")
-        self.log_text.append("<span style='color: #28a745;'>📌 STEPS:</span>")
-        self.log_text.append("<span style='color: #d4d4d4;'>   1️⃣  Select counselor</span>")
-        self.log_text.append("<span style='color: #d4d4d4;'>   2️⃣  Drop or browse ERA screenshot</span>")
-        self.log_text.append("<span style='color: #d4d4d4;'>   3️⃣  Click Process Claim</span>")
-        self.log_text.append("<span style='color: #d4d4d4;'>   4️⃣  Review results & open Excel\n</span>")
-        self.log_text.append("<span style='color: #6c757d;'>" + "─" * 80 + "</span>\n")
+        self.log_text.setHtml(_WELCOME_HTML)
+        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+    
+    def _log(self, html):
+        """Queue one log line; lines arriving within a frame are inserted together."""
+        self._log_buffer.append(html)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(16, self._flush_log)
+    
+    def _flush_log(self):
+        """Insert all queued log lines in one edit (one layout pass)."""
+        self._log_flush_pending = False
+        if not self._log_buffer:
+            return
+        
+        cursor = self.log_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        # One block per line, so setMaximumBlockCount() caps lines, not flushes
+        cursor.beginEditBlock()
+        empty = self.log_text.document().isEmpty()
+        for html in self._log_buffer:
+            if not empty:
+                cursor.insertBlock()
+            empty = False
+            cursor.insertHtml(html)
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+        self.log_text.setTextCursor(cursor)
+        self.log_text.ensureCursorVisible()
     
     def browse_files(self):
+        patterns = " ".join(f"*{ext}" for ext in sorted(DropZone._ALLOWED_EXT))
         files, _ = QFileDialog.getOpenFileNames(
             self,
             "Select ERA Screenshot",
             "",
-            "Image Files (*.png *.jpg *.jpeg);;All Files (*.*)"
+            f"Image Files ({patterns});;All Files (*.*)"
         )
         
         if files:
             self.handle_dropped_files(files)
     
-    def handle_dropped_files(self, files):
-        if not files:
+    def handle_dropped_files(self, paths):
+        # A file can be locked, unreadable or gone by the time it's hashed;
+        # skip it rather than let the OSError escape the Qt handler
+        entries = []
+        for path in paths:
+            try:
+                entries.append(make_file_entry(path))
+            except OSError as e:
+                self._log(f"<span style='color: #dc3545;'>⚠️ Could not read {os.path.basename(path)}: {e.strerror or e}</span>")
+        if not entries:
             return
         
-        self.current_file = files[0]
-        self.log_text.append(f"<span style='color: #28a745;'>✓ Loaded: {os.path.basename(self.current_file)}</span>")
+        self.pending_files = entries
+        for entry in self.pending_files:
+            self._log(f"<span style='color: #28a745;'>✓ Loaded: {entry.basename}</span>")
+        if len(self.pending_files) > 1:
+            self._log(f"<span style='color: #4a90e2;'>   📥 {len(self.pending_files)} files queued</span>")
         self.process_btn.setEnabled(True)
     
     def process_current_file(self):
-        if not hasattr(self, 'current_file'):
+        if not self.pending_files:
             QMessageBox.warning(self, "No File", "Please select a file to process.")
             return
         
@@ -564,23 +601,46 @@ class ClaimGUI(QMainWindow):
         self.process_btn.setEnabled(False)
         self.process_btn.setText("⏳ Processing...")
         
-        # Start processing thread
-        self.processing_thread = ProcessingThread(
-            self.current_file,
-            counselor,
-            self.counselors
-        )
-        self.processing_thread.log_message.connect(lambda msg: self.log_text.append(f"<span style='color: #d4d4d4;'>{msg}</span>"))
-        self.processing_thread.finished.connect(self.handle_processing_result)
-        self.processing_thread.start()
+        # One task per file on the shared pool; the button comes back when
+        # the last one reports in
+        self._jobs_total = len(self.pending_files)
+        self._jobs_succeeded = 0
+        self._batch_counselor = counselor
+        for entry in self.pending_files:
+            task = ProcessingTask(entry, counselor, self.counselors)
+            task.signals.log_message.connect(lambda msg: self._log(f"<span style='color: #d4d4d4;'>{msg}</span>"))
+            task.signals.finished.connect(lambda result, task=task: self._task_finished(task, result))
+            self._active_tasks.add(task)
+            self.pool.start(task)
+    
+    def _task_finished(self, task, result):
+        """Collect one claim's result; re-enable processing after the last one."""
+        # Drop every reference to the finished task: the pool already deleted
+        # the C++ runnable (autoDelete), and deleting its signals object also
+        # disconnects the slots that captured it
+        self._active_tasks.discard(task)
+        task.signals.deleteLater()
+        if result.get("success"):
+            self._jobs_succeeded += 1
+        
+        done = not self._active_tasks
+        if done:
+            self.process_btn.setEnabled(True)
+            self.process_btn.setText("▶️ Process Claim")
+        
+        self.handle_processing_result(result)
+        
+        # Single claims get the per-claim dialogs; batches one summary
+        if done and self._jobs_total > 1:
+            self._log(f"\n<span style='color: #4a90e2; font-weight: bold;'>📦 {self._jobs_succeeded}/{self._jobs_total} claims processed</span>")
+            QMessageBox.information(self, "Batch Complete", f"{self._jobs_succeeded} of {self._jobs_total} claims processed successfully.\n\nFiles saved for {self._batch_counselor}")
     
     def handle_processing_result(self, result):
-        self.process_btn.setEnabled(True)
-        self.process_btn.setText("▶️ Process Claim")
+        single = self._jobs_total <= 1
         
         if result.get("success"):
             data = result.get("data", {})
-            calc = result.get("calculations", {})
+            calc = result.get("calculations")
             
             # Update extracted fields
             self.client_field.setText(data.get('Client', 'N/A'))
@@ -589,51 +649,62 @@ class ClaimGUI(QMainWindow):
             
             # Update summary fields
             if calc:
-                self.contracted_rate_field.setText(f"${calc.get('contracted_rate', 0):.2f}")
-                self.counselor_65_field.setText(f"${calc.get('counselor_65_percent', 0):.2f}")
-                self.total_payout_field.setText(f"${calc.get('total_payout', 0):.2f}")
-                self.gwc_35_field.setText(f"${calc.get('gwc_35_percent', 0):.2f}")
+                money = self._locale.toCurrencyString
+                self.contracted_rate_field.setText(money(float(calc.contracted_rate), "$"))
+                self.counselor_65_field.setText(money(float(calc.counselor_65_percent), "$"))
+                self.total_payout_field.setText(money(float(calc.total_payout), "$"))
+                self.gwc_35_field.setText(money(float(calc.gwc_35_percent), "$"))
             
-            self.log_text.append("\n<span style='color: #28a745; font-weight: bold;'>✅ SUCCESS!</span>")
-            self.log_text.append(f"<span style='color: #4a90e2;'>   📊 Files saved to: {self.counselor_combo.currentText()}.xlsx & .docx</span>")
+            self._log("\n<span style='color: #28a745; font-weight: bold;'>✅ SUCCESS!</span>")
+            self._log(f"<span style='color: #4a90e2;'>   📊 Files saved to: {self._batch_counselor}.xlsx & .docx</span>")
             
-            QMessageBox.information(self, "✅ Success", f"Claim processed successfully!\n\nFiles saved for {self.counselor_combo.currentText()}")
+            if single:
+                QMessageBox.information(self, "✅ Success", f"Claim processed successfully!\n\nFiles saved for {self._batch_counselor}")
         else:
-            self.log_text.append(f"\n<span style='color: #dc3545; font-weight: bold;'>❌ ERROR: {result.get('message', 'Unknown error')}</span>")
-            QMessageBox.critical(self, "Processing Error", result.get('message', 'Unknown error'))
+            self._log(f"\n<span style='color: #dc3545; font-weight: bold;'>❌ ERROR: {result.get('message', 'Unknown error')}</span>")
+            if single:
+                QMessageBox.critical(self, "Processing Error", result.get('message', 'Unknown error'))
     
     def manage_counselors(self):
         dialog = CounselorDialog(self.counselors, self)
         if dialog.exec():
+            # One model reset refreshes the combo; keep the selection if
+            # that counselor still exists. The intermediate index changes
+            # emit no signals and the combo repaints once at the end.
             current = self.counselor_combo.currentText()
-            self.counselor_combo.clear()
-            self.counselor_combo.addItems(self.counselors)
-            
-            index = self.counselor_combo.findText(current)
-            if index >= 0:
-                self.counselor_combo.setCurrentIndex(index)
+            self.counselor_combo.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(self.counselor_combo):
+                    self.counselor_model.setStringList(self.counselors)
+                    self._counselor_index = {name: i for i, name in enumerate(self.counselors)}
+                    
+                    index = self._counselor_index.get(current, -1)
+                    if index >= 0:
+                        self.counselor_combo.setCurrentIndex(index)
+            finally:
+                self.counselor_combo.setUpdatesEnabled(True)
             
-            self.log_text.append("<span style='color: #28a745;'>✓ Counselor list updated</span>")
+            self._log("<span style='color: #28a745;'>✓ Counselor list updated</span>")
     
     def open_excel_folder(self):
         path = config.EXCEL_DIR
         if os.path.exists(path):
-            if os.name == 'nt':
-                os.startfile(path)
-            else:
-                os.system(f'open "{path}"')
-            self.log_text.append(f"<span style='color: #4a90e2;'>📊 Opened Excel folder</span>")
+            # Native file manager on every platform, no shell involved
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+            self._log(f"<span style='color: #4a90e2;'>📊 Opened Excel folder</span>")
         else:
             QMessageBox.information(self, "Folder Not Found", "No Excel files have been created yet.")
     
     def open_word_folder(self):
         path = config.WORD_DIR
+        if config.WORD_RENDER_ON_DEMAND:
+            # Write the queued claims into the .docx files before showing them
+            import word_module
+            word_module.flush()
         if os.path.exists(path):
-            if os.name == 'nt':
-                os.startfile(path)
-            else:
-                os.system(f'open "{path}"')
-            self.log_text.append(f"<span style='color: #6f42c1;'>📄 Opened Word folder</span>")
+            # Native file manager on every platform, no shell involved
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+            self._log(f"<span style='color: #6f42c1;'>📄 Opened Word folder</span>")
         else:
             QMessageBox.information(self, "Folder Not Found", "No Word files have been created yet.")
     
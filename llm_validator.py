@@ -14,49 +14,377 @@ Version: 2.0 - Improved OCR Artifact Handling
 """
 
 import logging
+import hashlib
 import json
+import os
 import re
-from typing import Dict, Optional, Tuple
-import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+import http.client
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Ollama HTTP API (the server behind the `ollama` CLI)
+OLLAMA_HOST = "localhost"
+OLLAMA_PORT = 11434
+OLLAMA_MODEL = "llama3.2:3b"
 
-def is_ollama_available() -> bool:
+# Requests validate_with_llm_batch() keeps in flight - match the server's
+# OLLAMA_NUM_PARALLEL so they are decoded together in one batch
+# (batch_process_claims() splits it between its worker processes)
+try:
+    OLLAMA_NUM_PARALLEL = max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")))
+except ValueError:
+    OLLAMA_NUM_PARALLEL = 4
+
+# One keep-alive connection per thread - http.client connections can't be
+# shared, and claims may be processed on several worker threads
+_local = threading.local()
+
+# Last _probe_ollama() result, re-probed after _AVAILABLE_TTL seconds
+_AVAILABLE_TTL = 300
+_available_cache = {"time": 0.0, "status": None}
+
+# extract_patient_name() answers keyed by a hash of the OCR text ("" = the
+# model found no name). LRU-bounded; main.py persists it between runs with
+# load_name_cache()/save_name_cache(), and batch_process_claims() merges in
+# and saves what its worker processes learn
+_NAME_CACHE_SIZE = 1024
+_name_cache = OrderedDict()
+_name_cache_lock = threading.Lock()
+_name_cache_dirty = False
+_name_cache_loaded = False
+
+# Answers added since the last take_new_names() - a batch worker process
+# hands these back to the parent, whose cache is the one that gets saved
+_name_cache_new = OrderedDict()
+
+# Patterns used to clean up the model's answer (_parse_name_from_response)
+_PREFIX_RE = re.compile(r'^(The patient name is|Patient name:|Patient:)\s*', re.IGNORECASE)
+_NAME_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\b')
+_DOTS_RE = re.compile(r'[\._]+')
+_SPECIAL_RE = re.compile(r'[^\w\s\-]')
+_WS_RE = re.compile(r'\s+')
+_TAIL_RE = re.compile(r'\s+[-\d]+$')
+# 2-4 words starting with a letter (any script - "Ángel Pérez"), checked in
+# one pass on the cleaned name; _clean_name() checks each is capitalized
+_FULL_NAME_RE = re.compile(r'[^\W\d_][\w\-]*(?: [^\W\d_][\w\-]*){1,3}')
+
+# "Patient. George.Orwell" / "Patient: John_Doe" - a name OCR only mangled
+# with dots/underscores, which validate_with_llm() fixes without the LLM
+_PATIENT_LINE_RE = re.compile(r'Patient[.:][ \t]*([A-Za-z][A-Za-z._]+[._ \t]+[A-Za-z][A-Za-z._]+)')
+
+# Name-extraction prompt: constant instructions, then the ERA text as the
+# very last thing, so every call shares the same byte-identical prefix and
+# Ollama can reuse its prefill. Answered as {"name": ...}
+_NAME_PROMPT_PREFIX = (
+    "Extract the patient's full name from the ERA insurance text below and "
+    "answer in JSON. OCR may join words with dots or underscores "
+    "(George.Orwell is George Orwell). Give only First Last, or NOTFOUND if "
+    "there is no name.\nERA TEXT:\n"
+)
+# Identifies the prompt in name-cache keys - answers cached under an older
+# prompt are not reused
+_NAME_PROMPT_ID = hashlib.blake2b(_NAME_PROMPT_PREFIX.encode("utf-8"), digest_size=4).hexdigest()
+_NAME_FORMAT = {
+    "type": "object",
+    "properties": {"name": {"type": "string"}},
+    "required": ["name"],
+}
+
+# Garbled-OCR gate (_looks_garbled): a window that is mostly non-letters
+# and has no "First Last" pair can't yield a name, so the LLM isn't asked
+_MIN_ALPHA_RATIO = 0.5
+_CAP_BIGRAM_RE = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+')
+
+# The prompt only carries the text around the first "Patient" (prefill cost
+# grows with every input token)
+_PATIENT_WORD_RE = re.compile(r'patient', re.IGNORECASE)
+
+
+def _ollama_send(method: str, path: str, payload: Optional[Dict] = None, timeout: float = 30) -> http.client.HTTPResponse:
     """
-    Check if Ollama service is running and accessible.
+    Send one request to the Ollama API and return the response with its
+    body still unread.
     
-    Returns:
-        bool: True if Ollama is available, False otherwise
+    Reuses this thread's persistent connection; a connection the server has
+    since closed is reopened once. Raises OSError/HTTPException on transport
+    errors (TimeoutError if the server doesn't answer in time) or non-200
+    replies.
+    """
+    body = json.dumps(payload).encode("utf-8") if payload is not None else None
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    
+    for attempt in (1, 2):
+        conn = getattr(_local, "conn", None)
+        if conn is None:
+            conn = _local.conn = http.client.HTTPConnection(OLLAMA_HOST, OLLAMA_PORT, timeout=timeout)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+        except (ConnectionError, http.client.HTTPException):
+            # Stale keep-alive socket (or server down): retry on a fresh one
+            _drop_connection()
+            if attempt == 2:
+                raise
+            continue
+        except OSError:
+            _drop_connection()
+            raise
+        
+        if response.status != 200:
+            data = response.read()
+            raise http.client.HTTPException(
+                f"HTTP {response.status}: {data[:200].decode('utf-8', 'ignore')}"
+            )
+        return response
+
+
+def _drop_connection():
+    """Close this thread's connection; the next request opens a new one."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _local.conn = None
+
+
+def _ollama_request(method: str, path: str, payload: Optional[Dict] = None, timeout: float = 30) -> Dict:
+    """Send one request to the Ollama API and return the decoded JSON reply."""
+    response = _ollama_send(method, path, payload, timeout)
+    try:
+        data = response.read()
+    except OSError:
+        _drop_connection()
+        raise
+    return json.loads(data)
+
+
+def _ollama_generate_until(payload: Dict, end: str, timeout: float = 30) -> str:
+    """
+    Run a streaming /api/generate and return the text up to and including
+    the first `end` character.
+    
+    Text after `end` is discarded, but the stream is still read to its
+    "done" chunk (Ollama sends that separately, and num_predict bounds what
+    comes before it) so this thread's connection stays reusable. The
+    connection is only dropped when the read times out or fails.
+    """
+    response = _ollama_send("POST", "/api/generate", dict(payload, stream=True), timeout)
+    pieces = []
+    complete = False
+    finished = False
+    try:
+        for line in response:
+            if not line.strip():
+                continue
+            chunk = json.loads(line)
+            if not complete:
+                piece = chunk.get("response", "")
+                if end in piece:
+                    piece = piece[:piece.index(end) + 1]
+                    complete = True
+                pieces.append(piece)
+            if chunk.get("done"):
+                response.read()  # chunked-encoding trailer; keeps the connection reusable
+                finished = True
+                break
+    finally:
+        if not finished:
+            _drop_connection()
+    
+    return "".join(pieces)
+
+
+def _text_key(raw_text: str) -> str:
+    """Cache key for an OCR text blob (under the current prompt)."""
+    digest = hashlib.blake2b(raw_text.encode("utf-8", "replace"), digest_size=16).hexdigest()
+    return f"{_NAME_PROMPT_ID}:{digest}"
+
+
+def _cached_name(key: str) -> Optional[str]:
+    """Return the cached answer for key ("" = no name), or None on a miss."""
+    with _name_cache_lock:
+        name = _name_cache.get(key)
+        if name is not None:
+            _name_cache.move_to_end(key)
+        return name
+
+
+def _remember_name(key: str, name: str):
+    with _name_cache_lock:
+        _store_name(key, name)
+        _name_cache_new[key] = name
+        _name_cache_new.move_to_end(key)
+        while len(_name_cache_new) > _NAME_CACHE_SIZE:
+            _name_cache_new.popitem(last=False)
+
+
+def _store_name(key: str, name: str):
+    # Caller holds _name_cache_lock
+    global _name_cache_dirty
+    _name_cache[key] = name
+    _name_cache.move_to_end(key)
+    while len(_name_cache) > _NAME_CACHE_SIZE:
+        _name_cache.popitem(last=False)
+    _name_cache_dirty = True
+
+
+def take_new_names() -> Dict[str, str]:
+    """Return the names added since the last call, and forget them."""
+    with _name_cache_lock:
+        names = dict(_name_cache_new)
+        _name_cache_new.clear()
+    return names
+
+
+def merge_names(names: Dict[str, str]):
+    """Add names another process learned (see take_new_names())."""
+    with _name_cache_lock:
+        for key, name in names.items():
+            _store_name(key, name)
+
+
+def load_name_cache(path: str):
     """
+    Load names saved by a previous run (a missing/corrupt file is ignored).
+    Only the first call in a process reads the file.
+    """
+    global _name_cache_loaded
+    with _name_cache_lock:
+        if _name_cache_loaded:
+            return
+        _name_cache_loaded = True
+    
     try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            encoding='utf-8',
-            errors='ignore'  # Handle Unicode errors gracefully
-        )
+        with open(path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load LLM name cache: {e}")
+        return
+    
+    with _name_cache_lock:
+        for key, name in list(saved.items())[-_NAME_CACHE_SIZE:]:
+            if isinstance(name, str):
+                _name_cache[key] = name
+    logger.info(f"Loaded {len(_name_cache)} cached LLM name(s)")
+
+
+def save_name_cache(path: str):
+    """Write the name cache to path if anything was added since the last save."""
+    global _name_cache_dirty
+    with _name_cache_lock:
+        if not _name_cache_dirty:
+            return
+        snapshot = dict(_name_cache)
+        _name_cache_dirty = False
+    
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not save LLM name cache: {e}")
+
+
+@dataclass
+class OllamaStatus:
+    """What the last Ollama probe found (see get_llm_status())."""
+    available: bool
+    model: str
+    message: str
+
+
+def _probe_ollama(refresh: bool = False) -> OllamaStatus:
+    """
+    Ask the Ollama server whether llama3.2 is installed.
+    
+    Shared by is_ollama_available() and get_llm_status(). The answer is
+    cached for _AVAILABLE_TTL seconds; refresh=True probes again.
+    """
+    now = time.monotonic()
+    status = _available_cache["status"]
+    if not refresh and status is not None and now - _available_cache["time"] < _AVAILABLE_TTL:
+        return status
+    
+    status = _query_ollama()
+    _available_cache["time"] = now
+    _available_cache["status"] = status
+    return status
+
+
+def _query_ollama() -> OllamaStatus:
+    """Uncached probe behind _probe_ollama()."""
+    try:
+        # Installed models (same list as `ollama list`)
+        tags = _ollama_request("GET", "/api/tags", timeout=5)
         
         # Check if llama3.2:3b is in the list
-        if "llama3.2:3b" in result.stdout or "llama3.2" in result.stdout:
+        if any("llama3.2" in model.get("name", "") for model in tags.get("models", [])):
             logger.info("✅ Ollama is available with llama3.2:3b model")
-            return True
+            return OllamaStatus(True, OLLAMA_MODEL, "Ollama running with llama3.2:3b")
         else:
             logger.warning("⚠️  Ollama is running but llama3.2:3b not found")
-            return False
+            return OllamaStatus(False, OLLAMA_MODEL, "Ollama running but model not found")
             
-    except FileNotFoundError:
-        logger.warning("⚠️  Ollama not installed")
-        return False
-    except subprocess.TimeoutExpired:
+    except ConnectionRefusedError:
+        logger.warning("⚠️  Ollama not running (is it installed?)")
+        return OllamaStatus(False, OLLAMA_MODEL, "Ollama not running")
+    except TimeoutError:
         logger.warning("⚠️  Ollama service not responding")
-        return False
+        return OllamaStatus(False, OLLAMA_MODEL, "Ollama timeout")
     except Exception as e:
         logger.warning(f"⚠️  Could not check Ollama: {e}")
-        return False
+        return OllamaStatus(False, OLLAMA_MODEL, f"Error: {str(e)}")
+
+
+def is_ollama_available(refresh: bool = False) -> bool:
+    """
+    Check if Ollama service is running and accessible.
+    
+    The answer is cached for _AVAILABLE_TTL seconds, so checking once per
+    claim doesn't probe the server every time.
+    
+    Args:
+        refresh: Probe the server even if a cached answer exists
+    
+    Returns:
+        bool: True if Ollama is available, False otherwise
+    """
+    return _probe_ollama(refresh).available
+
+
+def warm_up():
+    """
+    Probe Ollama and load the model into memory ahead of the first claim.
+    
+    Meant to run in the background at startup (see main.py); the first
+    extract_patient_name() call then skips both the probe and the
+    cold model load.
+    """
+    if not is_ollama_available():
+        return
+    
+    try:
+        _ollama_request("POST", "/api/generate", {
+            "model": OLLAMA_MODEL,
+            "prompt": "Hi",
+            "stream": False,
+            "keep_alive": -1,
+            "options": {"num_predict": 1},
+        }, timeout=120)  # a cold model load can take a while
+        logger.info("LLM model loaded")
+    except Exception as e:
+        logger.warning(f"LLM warm-up failed: {e}")
 
 
 def extract_patient_name(raw_text: str, ocr_name: str = "NOTFOUND") -> Optional[str]:
@@ -85,59 +413,54 @@ def extract_patient_name(raw_text: str, ocr_name: str = "NOTFOUND") -> Optional[
         logger.info(f"OCR name looks valid: {ocr_name}, skipping LLM")
         return ocr_name
     
+    # Same screenshot seen before (re-run, duplicate drop) - reuse the answer
+    key = _text_key(raw_text)
+    cached = _cached_name(key)
+    if cached is not None:
+        logger.info(f"LLM name cache hit: '{cached or 'NOTFOUND'}'")
+        return cached or None
+    
     logger.info("🤖 Using LLM to extract patient name...")
-    start_time = time.time()
+    # Timing is only worth taking when the INFO lines reporting it are shown
+    timed = logger.isEnabledFor(logging.INFO)
+    start_time = time.perf_counter() if timed else 0.0
+    
+    prompt = _NAME_PROMPT_PREFIX + _crop_patient_window(raw_text)
     
-    # CRITICAL FIX v2: Improved prompt with explicit OCR artifact handling
-    prompt = f"""You are a medical billing data extractor. Extract the patient's full name from this ERA insurance document.
-
-CRITICAL RULES:
-1. Return ONLY the patient's name in format: "FirstName LastName"
-2. Remove OCR errors like dots, underscores, or special characters between words
-3. Fix common OCR mistakes (e.g., "George.Orwell" → "George Orwell")
-4. Do NOT include explanations, patient IDs, claim numbers, or extra text
-5. If no valid patient name found, return exactly: "NOTFOUND"
-
-EXAMPLES OF CORRECT EXTRACTION:
-- Input: "Patient. George.Orwell" → Output: "George Orwell"
-- Input: "Patient: John_Doe - 12345" → Output: "John Doe"
-- Input: "Patient: LLOYD DOBLER - ZAQ123456789" → Output: "Lloyd Dobler"
-- Input: "cen) rastf tite. + ited" → Output: "NOTFOUND"
-
-ERA TEXT:
-{raw_text[:1000]}
-
-EXTRACT PATIENT NAME (FirstName LastName only):"""
-
     try:
-        # Call Ollama with Unicode error handling
-        result = subprocess.run(
-            ["ollama", "run", "llama3.2:3b", prompt],
-            capture_output=True,
-            text=True,
-            timeout=30,  # 30 second timeout
-            encoding='utf-8',
-            errors='ignore'  # CRITICAL: Handle Unicode decode errors
-        )
+        # Call the Ollama server directly; keep_alive -1 keeps the model
+        # loaded between claims instead of reloading it per call. The answer
+        # is a tiny JSON object: greedy decode, streamed and cut off at its
+        # closing brace
+        response = _ollama_generate_until({
+            "model": OLLAMA_MODEL,
+            "prompt": prompt,
+            "format": _NAME_FORMAT,
+            "keep_alive": -1,
+            "options": {
+                "num_predict": 24,
+                "temperature": 0,
+                "top_k": 1,
+                "num_ctx": 512,
+            },
+        }, "}", timeout=30)  # 30 second timeout
         
-        elapsed = time.time() - start_time
+        took = f" (took {time.perf_counter() - start_time:.1f}s)" if timed else ""
         
-        if result.returncode == 0:
-            # Extract name from response
-            response = result.stdout.strip()
-            name = _parse_name_from_response(response)
-            
-            if name and name != "NOTFOUND":
-                logger.info(f"✅ LLM extracted name: '{name}' (took {elapsed:.1f}s)")
-                return name
-            else:
-                logger.warning(f"⚠️  LLM could not find patient name (took {elapsed:.1f}s)")
-                return None
+        # Extract name from response
+        name = _name_from_json(response)
+        
+        if name and name != "NOTFOUND":
+            if timed:
+                logger.info(f"✅ LLM extracted name: '{name}'{took}")
+            _remember_name(key, name)
+            return name
         else:
-            logger.error(f"❌ Ollama error: {result.stderr}")
+            logger.warning(f"⚠️  LLM could not find patient name{took}")
+            _remember_name(key, "")
             return None
             
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         logger.error("❌ LLM timeout (>30s) - skipping")
         return None
     except Exception as e:
@@ -145,6 +468,31 @@ EXTRACT PATIENT NAME (FirstName LastName only):"""
         return None
 
 
+def _crop_patient_window(raw_text: str) -> str:
+    """Return the ~260 chars around the first "Patient" (first 400 if none)."""
+    match = _PATIENT_WORD_RE.search(raw_text)
+    if not match:
+        return raw_text[:400]
+    return raw_text[max(0, match.start() - 60):match.start() + 200]
+
+
+def _looks_garbled(raw_text: str) -> bool:
+    """True if the text the LLM would see ("cen) rastf tite. + ited") holds no usable name."""
+    window = _crop_patient_window(raw_text)
+    alpha_ratio = sum(map(str.isalpha, window)) / max(1, len(window))
+    return alpha_ratio < _MIN_ALPHA_RATIO and not _CAP_BIGRAM_RE.search(window)
+
+
+def _name_from_json(response: str) -> Optional[str]:
+    """Read the {"name": ...} answer and clean it like a free-text one."""
+    try:
+        name = json.loads(response)["name"]
+    except (ValueError, KeyError, TypeError):
+        # Truncated/off-schema output - fall back to scrubbing the raw text
+        return _parse_name_from_response(response)
+    return _parse_name_from_response(name) if isinstance(name, str) else None
+
+
 def _parse_name_from_response(response: str) -> Optional[str]:
     """
     Parse patient name from LLM response.
@@ -167,36 +515,48 @@ def _parse_name_from_response(response: str) -> Optional[str]:
     
     # Remove common prefixes
     response = response.strip()
-    response = re.sub(r'^(The patient name is|Patient name:|Patient:)\s*', '', response, flags=re.IGNORECASE)
+    response = _PREFIX_RE.sub('', response)
     response = response.strip()
     
     # If response is too long, it's probably an explanation, not a name
     if len(response) > 100:
         # Try to extract name pattern: "FirstName LastName"
-        name_match = re.search(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\b', response)
+        name_match = _NAME_RE.search(response)
         if name_match:
             response = name_match.group(1)
         else:
             return None
     
+    return _clean_name(response)
+
+
+def _clean_name(name: str) -> Optional[str]:
+    """
+    Strip OCR artifacts from a candidate name and check it looks like one.
+    
+    Returns the cleaned name ("George.Orwell" → "George Orwell"), or None
+    if it isn't 2-4 capitalized words.
+    """
     # CRITICAL FIX v2: Clean OCR artifacts
     # Replace dots, underscores, and multiple spaces with single space
-    response = re.sub(r'[\._]+', ' ', response)  # George.Orwell → George Orwell
-    response = re.sub(r'[^\w\s\-]', '', response)  # Remove special chars except hyphens
-    response = re.sub(r'\s+', ' ', response)  # Normalize spaces
-    response = response.strip()
+    name = _DOTS_RE.sub(' ', name)  # George.Orwell → George Orwell
+    name = _SPECIAL_RE.sub('', name)  # Remove special chars except hyphens
+    name = _WS_RE.sub(' ', name)  # Normalize spaces
+    name = name.strip()
     
     # Remove trailing numbers/IDs (e.g., "John Doe 12345" → "John Doe")
-    response = re.sub(r'\s+[-\d]+$', '', response)
+    name = _TAIL_RE.sub('', name)
     
     # Validate: Should be 2-4 words, each capitalized
-    words = response.split()
-    if 2 <= len(words) <= 4:
-        # Check if looks like a name (capitalized words)
-        if all(word[0].isupper() if word else False for word in words):
-            return response
-    
-    return None
+    if not _FULL_NAME_RE.fullmatch(name):
+        return None
+    return name if all(word[0].isupper() for word in name.split(' ')) else None
+
+
+def _regex_patient_name(raw_text: str) -> Optional[str]:
+    """Patient name straight from a "Patient: First.Last" line, or None."""
+    match = _PATIENT_LINE_RE.search(raw_text)
+    return _clean_name(match.group(1)) if match else None
 
 
 def validate_with_llm(ocr_data: Dict[str, str], raw_text: str) -> Dict[str, str]:
@@ -206,82 +566,89 @@ def validate_with_llm(ocr_data: Dict[str, str], raw_text: str) -> Dict[str, str]
     Currently focuses on patient name extraction.
     Can be expanded to validate amounts, dates, etc.
     
+    Names that OCR only mangled with dots/underscores ("Patient.
+    George.Orwell") are fixed with a regex first; the LLM is only
+    asked when that fails.
+    
     Args:
         ocr_data: Dictionary of extracted claim data
         raw_text: Raw OCR text from image
     
     Returns:
-        Enhanced data dictionary
+        Enhanced data dictionary (ocr_data itself if nothing changed; a
+        changed result is a copy, the original is never modified)
     """
     
+    # Extract patient name if OCR failed
+    current_name = ocr_data.get("Client", "NOTFOUND")
+    
+    if current_name != "NOTFOUND" and len(current_name.strip()) >= 3:
+        return ocr_data
+    
+    # Fast path: no model needed for a "Patient: First.Last" line
+    quick_name = _regex_patient_name(raw_text)
+    if quick_name:
+        enhanced_data = dict(ocr_data)
+        enhanced_data["Client"] = quick_name
+        logger.info(f"✅ Patient name recovered without LLM: {quick_name}")
+        return enhanced_data
+    
+    if _looks_garbled(raw_text):
+        logger.info("OCR text too garbled for a name - skipping LLM")
+        return ocr_data
+    
     if not is_ollama_available():
         logger.info("Ollama not available - returning original OCR data")
         return ocr_data
     
-    # Make a copy so we don't modify original
-    enhanced_data = ocr_data.copy()
+    logger.info("Patient name missing or invalid, trying LLM extraction...")
     
-    # Extract patient name if OCR failed
-    current_name = ocr_data.get("Client", "NOTFOUND")
+    llm_name = extract_patient_name(raw_text, current_name)
     
-    if current_name == "NOTFOUND" or len(current_name.strip()) < 3:
-        logger.info("Patient name missing or invalid, trying LLM extraction...")
-        
-        llm_name = extract_patient_name(raw_text, current_name)
-        
-        if llm_name:
-            enhanced_data["Client"] = llm_name
-            enhanced_data["_llm_enhanced"] = True
-            enhanced_data["_llm_fields"] = "Client"
-            logger.info(f"✅ LLM enhanced patient name: {llm_name}")
-        else:
-            logger.warning("⚠️  LLM could not improve patient name")
+    if not llm_name:
+        logger.warning("⚠️  LLM could not improve patient name")
+        return ocr_data
     
+    enhanced_data = dict(ocr_data)
+    enhanced_data["Client"] = llm_name
+    enhanced_data["_llm_enhanced"] = True
+    enhanced_data["_llm_fields"] = "Client"
+    logger.info(f"✅ LLM enhanced patient name: {llm_name}")
     return enhanced_data
 
 
-def get_llm_status() -> Dict[str, any]:
+def validate_with_llm_batch(items: List[Tuple[Dict[str, str], str]]) -> List[Dict[str, str]]:
     """
-    Get status information about LLM availability.
+    validate_with_llm() for several ERAs at once.
     
-    Useful for GUI display or debugging.
+    The LLM prompts go out concurrently (up to OLLAMA_NUM_PARALLEL in
+    flight, each worker thread on its own keep-alive connection), so
+    Ollama can decode them together instead of N round-trips in a row.
+    
+    Args:
+        items: (ocr_data, raw_text) pairs
     
     Returns:
-        Dictionary with status information
+        Enhanced data dictionaries, in the same order as items
     """
-    status = {
-        "available": False,
-        "model": "llama3.2:3b",
-        "message": ""
-    }
+    if len(items) <= 1:
+        return [validate_with_llm(ocr_data, raw_text) for ocr_data, raw_text in items]
     
-    try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            encoding='utf-8',
-            errors='ignore'
-        )
-        
-        if result.returncode == 0:
-            if "llama3.2:3b" in result.stdout or "llama3.2" in result.stdout:
-                status["available"] = True
-                status["message"] = "Ollama running with llama3.2:3b"
-            else:
-                status["message"] = "Ollama running but model not found"
-        else:
-            status["message"] = "Ollama service not responding"
-            
-    except FileNotFoundError:
-        status["message"] = "Ollama not installed"
-    except subprocess.TimeoutExpired:
-        status["message"] = "Ollama timeout"
-    except Exception as e:
-        status["message"] = f"Error: {str(e)}"
+    with ThreadPoolExecutor(max_workers=min(OLLAMA_NUM_PARALLEL, len(items))) as executor:
+        return list(executor.map(lambda item: validate_with_llm(*item), items))
+
+
+def get_llm_status(refresh: bool = False) -> Dict[str, any]:
+    """
+    Get status information about LLM availability.
     
-    return status
+    Useful for GUI display or debugging. Shares the cached probe with
+    is_ollama_available().
+    
+    Returns:
+        Dictionary with status information
+    """
+    return asdict(_probe_ollama(refresh))
 
 
 # ============================================================================
@@ -6,19 +6,30 @@ Launches the offline insurance claim automation GUI.
 from debugger import setup_debugger
 setup_debugger()  # initializes logging early
 import sys
+import threading
 from PyQt6.QtWidgets import QApplication
 from gui import ClaimGUI
+import config
+import llm_validator
 
 
 def main():
     """Initialize and launch the Claim Processor GUI."""
     app = QApplication(sys.argv)
     app.setApplicationName("Claim Processor")
+    llm_validator.load_name_cache(config.LLM_CACHE_JSON)
 
     window = ClaimGUI()
     window.show()
 
-    sys.exit(app.exec())
+    # Probe Ollama and load the model while the user picks files - on its
+    # own thread: a cold load can take minutes, and the global pool's few
+    # threads are the GUI's claim workers
+    threading.Thread(target=llm_validator.warm_up, name="llm-warm-up", daemon=True).start()
+
+    exit_code = app.exec()
+    llm_validator.save_name_cache(config.LLM_CACHE_JSON)
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
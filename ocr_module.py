@@ -27,16 +27,116 @@ Version: 10.0 - Patient Name Validation Fixed
 import os
 import re
 import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Dict, List, Tuple, Optional
+
+# One Tesseract thread per process - the three passes already run side by
+# side, and Tesseract's own OpenMP threading is slower than that. Set before
+# any native library loads: OpenMP reads it once, when libtesseract (via
+# tesserocr below) or another OpenMP user is loaded
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
 import cv2
 import numpy as np
+import config
+
+# tesserocr is optional - it keeps Tesseract loaded in-process instead of
+# starting the tesseract executable (and reloading its model) per image
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Runs the OCR passes concurrently (Tesseract and OpenCV release the GIL).
+# Sized for several images in flight at once, as the GUI does
+_PASS_WORKERS = max(3, os.cpu_count() or 1)
+_PASS_POOL = ThreadPoolExecutor(max_workers=_PASS_WORKERS, thread_name_prefix="ocr-pass")
+
+
+def _reset_pass_pool():
+    """Give a forked child its own pool (the parent's threads don't survive fork)."""
+    global _PASS_POOL
+    _PASS_POOL = ThreadPoolExecutor(max_workers=_PASS_WORKERS, thread_name_prefix="ocr-pass")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pass_pool)
+
+# Tesseract settings: pass 1 is restricted to the characters of amounts and
+# codes, passes 2 and 3 read everything
+_TEXT_CONFIG = r'--oem 3 --psm 6'
+_PASS_1_WHITELIST = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz$.,()-/:#'
+
+# One tesserocr API per thread (an API object isn't thread-safe, and the
+# passes run on several threads); cleared if tesserocr can't initialize
+_tess_local = threading.local()
+_tesserocr_ok = tesserocr is not None
+
+# Opening kernel for config.OCR_MORPH_CLEANUP
+_SPECK_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+
+# Height (px) small screenshots are upscaled towards before OCR
+_OCR_TARGET_HEIGHT = 1600
+
+# PIL's ImageFilter.SHARPEN kernel, for the OpenCV version of Pass 1
+_SHARPEN_KERNEL = np.array([[-2, -2, -2], [-2, 32, -2], [-2, -2, -2]], dtype=np.float32) / 16
+
+# Most images one Tesseract run reads from a list file (longer lists have
+# been known to hang)
+_IMAGE_LIST_MAX = 50
+
+# Field patterns for _parse_era_text() and its helpers
+_CLAIM_PATTERNS = (
+    re.compile(r'CLAIM\s*#?\s*(\d{6,})'),
+    re.compile(r'CLAIM\s*NO\.?\s*(\d{6,})'),
+    re.compile(r'CLM\s*#?\s*(\d{6,})'),
+)
+_PATIENT_PATTERNS = (
+    re.compile(r'PATIENT[:\s]+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})(?=\s*[-\d]|\s*$)', re.IGNORECASE),
+    re.compile(r'PATIENT[:\s]+([A-Z][a-zA-Z\s]{4,40})(?=\s+\d)', re.IGNORECASE),
+    re.compile(r'PT[:\s]+([A-Z][a-zA-Z\s]{4,40})(?=\s+\d)', re.IGNORECASE),
+)
+_DATE_PATTERNS = (
+    re.compile(r'(\d{1,2}/\d{1,2}/\d{4})'),
+    re.compile(r'(\d{1,2}-\d{1,2}-\d{4})'),
+    re.compile(r'(\d{4}-\d{1,2}-\d{1,2})'),
+)
+_WS_RE = re.compile(r'\s+')
+_CPT_RE = re.compile(r'\b(9\d{4})\b')  # CPT codes: 90xxx for therapy
+_LINE_DATE_RE = re.compile(r'\d{1,2}[/\-]\d{1,2}[/\-]\d{4}')
+# "$1,234.56" (group 1) or "(1,234.56)"/"($1,234.56)" (group 2)
+_AMOUNT_RE = re.compile(r'\$\s*(\d{1,3}(?:,\d{3})*\.\d{2})|\(\$?\s*(\d{1,3}(?:,\d{3})*\.\d{2})\)')
+# Header and remark-code lines, which never hold the data row
+_SKIP_LINE_RE = re.compile(r'CHARGED RATE|PATIENT AMOUNT|PR-|CO-|OA-|PI-|CLAIM TOTAL')
+_CO_MISREAD_RE = re.compile(r'\b60-')
+_GLUED_CODE_RE = re.compile(r'\b(PR|CO|OA|PI)(\d)')
+# Words that mean the "name" OCR found is really a table header - whole
+# words, singular or plural ("Remark Codes", "Claims"), but not as part of
+# a longer word ("Amounting Doe" is a name)
+_TABLE_HEADER_RE = re.compile(
+    r'\b(?:amount|adjustment|paid|rate|charged|charge|patient|service|date|code'
+    r'|claim|total|detail|remark|primary|processed)s?\b',
+    re.IGNORECASE
+)
+_REMARK_RE = re.compile(r'(PR|CO|OA|PI)-?\s?(\d+)[:\s]*([^$\n]{0,60})')
+
+# Dollar-amount fields checked by _validate_and_cross_check
+_AMOUNT_FIELDS = (
+    "Charged Rate", "Patient Amount", "Client Responsibility",
+    "Adjustments Amount", "Adjustments", "Insurance Payment",
+    "Paid Amount", "Contracted Rate", "Copay", "Deductible"
+)
+_STRIP_TABLE = str.maketrans("", "", "$,()")
+
 
 def extract_claim(image_path: str, lang: str = 'eng') -> Dict[str, str]:
     """
@@ -66,24 +166,40 @@ def extract_claim(image_path: str, lang: str = 'eng') -> Dict[str, str]:
         # Load image
         img = Image.open(image_path)
         
-        # === MULTI-PASS OCR STRATEGY ===
-        # We run OCR 3 times with different preprocessing to catch everything
-        
-        # Pass 1: High contrast (best for amounts and codes)
-        text1 = _ocr_pass_1_high_contrast(img)
-        
-        # Pass 2: Grayscale with denoising (best for text)
-        text2 = _ocr_pass_2_denoised(img)
-        
-        # Pass 3: Adaptive threshold (best for varied lighting)
-        text3 = _ocr_pass_3_adaptive(img)
+        # Grayscale upscale every pass starts from - computed once and
+        # shared read-only by the passes
+        gray_up, scale = _gray_upscaled(img)
         
-        # Combine all passes (longest text usually best)
-        all_texts = [text1, text2, text3]
-        raw_text = max(all_texts, key=len)
-        
-        # Also keep all texts for cross-validation
-        combined_text = "\n".join(all_texts)
+        # === MULTI-PASS OCR STRATEGY ===
+        # Pass 2: Grayscale with denoising (best for text). On a clean
+        # screenshot it already finds every field, and the other passes
+        # are skipped
+        text2 = _ocr_pass_2_denoised(gray_up, scale)
+        parsed_data = _parse_era_text(text2, text2)
+        
+        if _is_complete(parsed_data):
+            logger.info("✅ Pass 2 found every field - skipping passes 1 and 3")
+            raw_text = combined_text = text2
+        else:
+            # We run OCR 2 more times with different preprocessing to catch
+            # everything. These passes run concurrently
+            futures = [
+                # Pass 1: High contrast (best for amounts and codes)
+                _PASS_POOL.submit(_ocr_pass_1_high_contrast, gray_up),
+                # Pass 3: Adaptive threshold (best for varied lighting)
+                _PASS_POOL.submit(_ocr_pass_3_adaptive, gray_up),
+            ]
+            text1, text3 = (future.result() for future in futures)
+            
+            # Combine all passes (longest text usually best)
+            all_texts = [text1, text2, text3]
+            raw_text = max(all_texts, key=len)
+            
+            # Also keep all texts for cross-validation
+            combined_text = "\n".join(all_texts)
+            
+            # === PARSE AND STRUCTURE DATA ===
+            parsed_data = _parse_era_text(raw_text, combined_text)
         
         logger.info(f"✅ OCR extracted {len(raw_text)} characters (best pass)")
         logger.info(f"   Total from all passes: {len(combined_text)} characters")
@@ -93,9 +209,6 @@ def extract_claim(image_path: str, lang: str = 'eng') -> Dict[str, str]:
         logger.info(raw_text[:500])
         logger.info(f"--- END RAW TEXT ---\n")
         
-        # === PARSE AND STRUCTURE DATA ===
-        parsed_data = _parse_era_text(raw_text, combined_text)
-        
         # === SELF-VALIDATION ===
         parsed_data = _validate_and_cross_check(parsed_data)
         
@@ -106,37 +219,10 @@ def extract_claim(image_path: str, lang: str = 'eng') -> Dict[str, str]:
             # Check if patient name extraction failed or is suspicious
             client_name = parsed_data.get("Client", "NOTFOUND")
             
-            # CRITICAL FIX: Detect if OCR extracted table headers instead of a real name
-            suspicious_keywords = [
-                'amount', 'adjustments', 'paid', 'rate', 'charged', 
-                'patient amount', 'service', 'date', 'code', 'claim',
-                'totals', 'details', 'remarks', 'primary', 'processed'
-            ]
-            
-            is_table_header = any(keyword in client_name.lower() for keyword in suspicious_keywords)
-            
-            needs_llm = (
-                client_name == "NOTFOUND" or 
-                not client_name or 
-                len(client_name.strip()) < 3 or
-                len(client_name.split()) < 2 or  # Need at least first + last name
-                is_table_header  # FIXED: Reject table headers as names
-            )
-            
-            if is_table_header:
-                logger.warning(f"⚠️  OCR extracted table header as name: '{client_name}' - using LLM")
-            
-            if needs_llm:
+            if _name_needs_llm(client_name):
                 logger.info("🤖 Patient name not found or invalid, attempting LLM extraction...")
                 enhanced_data = llm_validator.validate_with_llm(parsed_data, combined_text)
-                
-                # Check if LLM improved the result
-                llm_name = enhanced_data.get("Client")
-                if llm_name and llm_name != client_name and llm_name != "NOTFOUND":
-                    logger.info(f"✅ LLM enhanced patient name: '{llm_name}'")
-                    parsed_data = enhanced_data
-                else:
-                    logger.warning("⚠️  LLM could not improve patient name extraction")
+                parsed_data = _merge_llm_result(parsed_data, enhanced_data)
             else:
                 logger.info(f"✅ OCR found valid patient name: '{client_name}' - skipping LLM")
         
@@ -156,26 +242,115 @@ def extract_claim(image_path: str, lang: str = 'eng') -> Dict[str, str]:
         return _empty_data()
 
 
-def _ocr_pass_1_high_contrast(img: Image.Image) -> str:
-    """OCR Pass 1: High contrast enhancement (best for numbers and dollar amounts)."""
-    try:
-        # Convert to grayscale
-        img_gray = img.convert('L')
-        
-        # Upscale 2x for better OCR
-        width, height = img_gray.size
-        img_gray = img_gray.resize((width * 2, height * 2), Image.Resampling.LANCZOS)
-        
-        # Enhance contrast heavily
-        enhancer = ImageEnhance.Contrast(img_gray)
-        img_enhanced = enhancer.enhance(3.0)
+def extract_claims_batch(image_paths: List[str], lang: str = 'eng') -> List[Dict[str, str]]:
+    """
+    Extract structured claim data from several ERA screenshots at once.
+    
+    Same passes and parsing as extract_claim(), but each OCR pass is run
+    once per chunk of _IMAGE_LIST_MAX images (a single Tesseract run over
+    an image-list file) instead of once per image, and the LLM name fixes
+    for the chunk are sent together.
+    
+    Args:
+        image_paths: Paths to ERA screenshot image files
+        lang: Language for OCR (default: 'eng')
         
-        # Sharpen
-        img_enhanced = img_enhanced.filter(ImageFilter.SHARPEN)
+    Returns:
+        One claim dictionary per path, in the same order
+    """
+    results = []
+    for start in range(0, len(image_paths), _IMAGE_LIST_MAX):
+        results.extend(_extract_chunk(image_paths[start:start + _IMAGE_LIST_MAX]))
+    return results
+
+
+def _extract_chunk(image_paths: List[str]) -> List[Dict[str, str]]:
+    """extract_claims_batch() for at most _IMAGE_LIST_MAX images."""
+    logger.info(f"Running batch Tesseract OCR on {len(image_paths)} image(s)...")
+    
+    # Grayscale upscales, prepared side by side; None if unreadable
+    grays = list(_PASS_POOL.map(_load_gray, image_paths))
+    loaded = [i for i, gray in enumerate(grays) if gray is not None]
+    
+    # Pass 2 for every image first, as in extract_claim()
+    denoised = list(_PASS_POOL.map(lambda i: _prep_denoised(*grays[i]), loaded))
+    text2 = dict(zip(loaded, _ocr_many(denoised)))
+    parsed = {i: _parse_era_text(text2[i], text2[i]) for i in loaded}
+    combined = dict(text2)
+    
+    # Passes 1 and 3 only for the images pass 2 didn't fully read
+    retry = [i for i in loaded if not _is_complete(parsed[i])]
+    if retry:
+        high_contrast = list(_PASS_POOL.map(lambda i: _prep_high_contrast(grays[i][0]), retry))
+        adaptive = list(_PASS_POOL.map(lambda i: _prep_adaptive(grays[i][0]), retry))
+        pass_1 = _PASS_POOL.submit(_ocr_many, high_contrast, _PASS_1_WHITELIST)
+        pass_3 = _PASS_POOL.submit(_ocr_many, adaptive)
+        
+        for i, text1, text3 in zip(retry, pass_1.result(), pass_3.result()):
+            all_texts = [text1, text2[i], text3]
+            combined[i] = "\n".join(all_texts)
+            parsed[i] = _parse_era_text(max(all_texts, key=len), combined[i])
+    
+    for i in loaded:
+        parsed[i] = _validate_and_cross_check(parsed[i])
+    
+    # LLM enhancement for every suspicious name in one concurrent batch
+    try:
+        import llm_validator
         
+        todo = [i for i in loaded if _name_needs_llm(parsed[i].get("Client", "NOTFOUND"))]
+        if todo:
+            logger.info(f"🤖 {len(todo)} patient name(s) not found or invalid, attempting LLM extraction...")
+            enhanced = llm_validator.validate_with_llm_batch([(parsed[i], combined[i]) for i in todo])
+            for i, enhanced_data in zip(todo, enhanced):
+                parsed[i] = _merge_llm_result(parsed[i], enhanced_data)
+    
+    except ImportError:
+        logger.info("ℹ️  llm_validator not available - continuing with OCR-only results")
+    except Exception as e:
+        logger.warning(f"⚠️  LLM validation failed: {e} - continuing with OCR results")
+    
+    return [parsed.get(i) or _empty_data() for i in range(len(image_paths))]
+
+
+def _load_gray(image_path: str) -> Optional[Tuple[np.ndarray, float]]:
+    """_gray_upscaled() of an image file, or None if it can't be read."""
+    try:
+        return _gray_upscaled(Image.open(image_path))
+    except Exception as e:
+        logger.error(f"⚠️ Could not load {image_path}: {e}")
+        return None
+
+
+def _name_needs_llm(client_name: str) -> bool:
+    """True if the OCR patient name is missing, too short, or really a table header."""
+    # CRITICAL FIX: Detect if OCR extracted table headers instead of a real name
+    is_table_header = _TABLE_HEADER_RE.search(client_name) is not None
+    
+    if is_table_header:
+        logger.warning(f"⚠️  OCR extracted table header as name: '{client_name}' - using LLM")
+    
+    # Need at least first + last name; this also covers "NOTFOUND", empty
+    # and shorter-than-3-character names, which are all under two words
+    return len(client_name.split()) < 2 or is_table_header  # FIXED: Reject table headers as names
+
+
+def _merge_llm_result(parsed_data: Dict, enhanced_data: Dict) -> Dict:
+    """Keep the LLM's version of a claim only if it actually improved the name."""
+    llm_name = enhanced_data.get("Client")
+    if llm_name and llm_name != parsed_data.get("Client") and llm_name != "NOTFOUND":
+        logger.info(f"✅ LLM enhanced patient name: '{llm_name}'")
+        return enhanced_data
+    
+    logger.warning("⚠️  LLM could not improve patient name extraction")
+    return parsed_data
+
+
+def _ocr_pass_1_high_contrast(gray_up: np.ndarray) -> str:
+    """OCR Pass 1: High contrast enhancement (best for numbers and dollar amounts)."""
+    try:
         # OCR with numeric focus
-        custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz$.,()-/:#'
-        text = pytesseract.image_to_string(img_enhanced, lang='eng', config=custom_config)
+        text = _ocr_text(_prep_high_contrast(gray_up), whitelist=_PASS_1_WHITELIST)
         
         return text.strip()
     except Exception as e:
@@ -183,31 +358,11 @@ def _ocr_pass_1_high_contrast(img: Image.Image) -> str:
         return ""
 
 
-def _ocr_pass_2_denoised(img: Image.Image) -> str:
+def _ocr_pass_2_denoised(gray_up: np.ndarray, scale: float = 2.0) -> str:
     """OCR Pass 2: Denoised grayscale (best for general text extraction)."""
     try:
-        # Convert PIL to OpenCV
-        img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-        
-        # Upscale 2x
-        gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
-        
-        # Denoise
-        denoised = cv2.fastNlMeansDenoising(gray, None, h=10, templateWindowSize=7, searchWindowSize=21)
-        
-        # Enhance contrast with CLAHE
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(denoised)
-        
-        # Convert back to PIL
-        img_pil = Image.fromarray(enhanced)
-        
         # OCR with default config
-        custom_config = r'--oem 3 --psm 6'
-        text = pytesseract.image_to_string(img_pil, lang='eng', config=custom_config)
+        text = _ocr_text(_prep_denoised(gray_up, scale))
         
         return text.strip()
     except Exception as e:
@@ -215,33 +370,11 @@ def _ocr_pass_2_denoised(img: Image.Image) -> str:
         return ""
 
 
-def _ocr_pass_3_adaptive(img: Image.Image) -> str:
+def _ocr_pass_3_adaptive(gray_up: np.ndarray) -> str:
     """OCR Pass 3: Adaptive thresholding (best for varied lighting/background)."""
     try:
-        # Convert PIL to OpenCV
-        img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-        
-        # Upscale 2x
-        gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
-        
-        # Adaptive threshold
-        thresh = cv2.adaptiveThreshold(
-            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-        )
-        
-        # Morphological operations to clean up
-        kernel = np.ones((1, 1), np.uint8)
-        opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
-        
-        # Convert back to PIL
-        img_pil = Image.fromarray(opening)
-        
         # OCR
-        custom_config = r'--oem 3 --psm 6'
-        text = pytesseract.image_to_string(img_pil, lang='eng', config=custom_config)
+        text = _ocr_text(_prep_adaptive(gray_up))
         
         return text.strip()
     except Exception as e:
@@ -249,29 +382,190 @@ def _ocr_pass_3_adaptive(img: Image.Image) -> str:
         return ""
 
 
+def _ocr_text(image, whitelist: str = "") -> str:
+    """
+    Run Tesseract (--oem 3 --psm 6, English) on a grayscale image.
+    
+    Uses this thread's in-process tesserocr API when available, otherwise
+    the tesseract executable through pytesseract.
+    """
+    api = _tess_api()
+    if api is None:
+        return pytesseract.image_to_string(image, lang='eng', config=_tess_config(whitelist))
+    
+    api.SetVariable("tessedit_char_whitelist", whitelist)
+    if isinstance(image, np.ndarray):
+        height, width = image.shape
+        api.SetImageBytes(np.ascontiguousarray(image).tobytes(), width, height, 1, width)
+    else:
+        api.SetImage(image)
+    return api.GetUTF8Text()
+
+
+def _tess_config(whitelist: str = "") -> str:
+    """pytesseract config string for _ocr_text()'s settings."""
+    return f"{_TEXT_CONFIG} -c tessedit_char_whitelist={whitelist}" if whitelist else _TEXT_CONFIG
+
+
+def _ocr_many(images: List[np.ndarray], whitelist: str = "") -> List[str]:
+    """
+    _ocr_text() for a list of images, stripped - with the tesseract
+    executable, one run per _IMAGE_LIST_MAX images. A failure leaves every
+    text empty, as a failed pass does.
+    """
+    try:
+        if _tess_api() is not None:
+            return [_ocr_text(image, whitelist).strip() for image in images]
+        return _ocr_image_list([Image.fromarray(image) for image in images], _tess_config(whitelist))
+    except Exception as e:
+        logger.warning(f"Batch OCR failed: {e}")
+        return [""] * len(images)
+
+
+def _tess_api():
+    """This thread's tesserocr API (created on first use), or None."""
+    global _tesserocr_ok
+    if not _tesserocr_ok:
+        return None
+    
+    api = getattr(_tess_local, "api", None)
+    if api is None:
+        try:
+            api = _tess_local.api = tesserocr.PyTessBaseAPI(
+                lang='eng', psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.DEFAULT
+            )
+        except RuntimeError as e:
+            logger.warning(f"tesserocr could not start ({e}) - using pytesseract")
+            _tesserocr_ok = False
+            return None
+    return api
+
+
+def _ocr_image_list(images: List[Image.Image], config: str, lang: str = 'eng') -> List[str]:
+    """
+    OCR several images with a single Tesseract run (per _IMAGE_LIST_MAX).
+    
+    The images are saved as temp PNGs named in a list file, which Tesseract
+    reads as one multi-page input, so its start-up and model load are paid
+    once. Returns one text per image, in order.
+    """
+    texts = []
+    with tempfile.TemporaryDirectory(prefix="ocr_") as tmp_dir:
+        for start in range(0, len(images), _IMAGE_LIST_MAX):
+            chunk = images[start:start + _IMAGE_LIST_MAX]
+            paths = []
+            for i, image in enumerate(chunk):
+                path = os.path.join(tmp_dir, f"{start + i}.png")
+                image.save(path)
+                paths.append(path)
+            
+            list_path = os.path.join(tmp_dir, f"list_{start}.txt")
+            with open(list_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(paths) + "\n")
+            
+            # Tesseract ends every page with a form feed
+            pages = pytesseract.image_to_string(list_path, lang=lang, config=config).split("\f")
+            pages += [""] * (len(chunk) - len(pages))
+            texts.extend(page.strip() for page in pages[:len(chunk)])
+    
+    return texts
+
+
+def _gray_upscaled(img: Image.Image) -> Tuple[np.ndarray, float]:
+    """
+    Grayscale image the passes start from (read-only), and its scale factor.
+    
+    Small screenshots are upscaled (for better OCR) towards _OCR_TARGET_HEIGHT,
+    by at most 2x; ones already that tall are used as they are.
+    """
+    # Convert to grayscale (via RGB, so palette/RGBA screenshots work too)
+    gray = cv2.cvtColor(np.asarray(img.convert('RGB')), cv2.COLOR_RGB2GRAY)
+    
+    # Upscale
+    scale = min(2.0, max(1.0, _OCR_TARGET_HEIGHT / gray.shape[0]))
+    if scale > 1.0:
+        gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+    gray.flags.writeable = False
+    return gray, scale
+
+
+def _prep_high_contrast(gray_up: np.ndarray) -> np.ndarray:
+    """Pass 1 preprocessing: heavy contrast, sharpened."""
+    # Enhance contrast heavily (as ImageEnhance.Contrast(3.0): stretch
+    # 3x around the mean, saturating at 0/255)
+    mean = int(gray_up.mean() + 0.5)
+    enhanced = cv2.addWeighted(gray_up, 3.0, gray_up, 0.0, -2.0 * mean)
+    
+    # Sharpen
+    return cv2.filter2D(enhanced, -1, _SHARPEN_KERNEL)
+
+
+def _prep_denoised(gray_up: np.ndarray, scale: float = 2.0) -> np.ndarray:
+    """Pass 2 preprocessing: denoised, CLAHE contrast."""
+    # Denoise
+    if config.OCR_AGGRESSIVE_DENOISE:
+        # Non-local means (search window sized for the text: 21 px at 2x, kept odd)
+        search_window = max(7, int(21 * scale / 2) | 1)
+        denoised = cv2.fastNlMeansDenoising(gray_up, None, h=10, templateWindowSize=7, searchWindowSize=search_window)
+    else:
+        denoised = cv2.bilateralFilter(gray_up, 5, 50, 50)
+    
+    # Enhance contrast with CLAHE
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    return clahe.apply(denoised)
+
+
+def _prep_adaptive(gray_up: np.ndarray) -> np.ndarray:
+    """Pass 3 preprocessing: adaptive threshold."""
+    # Adaptive threshold
+    thresh = cv2.adaptiveThreshold(
+        gray_up, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+    )
+    
+    # Morphological operations to clean up (a 1x1 opening would be a no-op)
+    if config.OCR_MORPH_CLEANUP:
+        return cv2.morphologyEx(thresh, cv2.MORPH_OPEN, _SPECK_KERNEL)
+    return thresh
+
+
+# Fields a single OCR pass must find for the other passes to be skipped
+_REQUIRED_FIELDS = (
+    "Client", "Service Code", "Charged Rate", "Patient Amount",
+    "Adjustments Amount", "Paid Amount"
+)
+
+# Field set of a claim with nothing extracted (copied by _empty_data())
+_EMPTY_DATA = {
+    "Client": "NOTFOUND",
+    "Insurance": "NOTFOUND",
+    "Date": "NOTFOUND",
+    "Service Date": "NOTFOUND",
+    "Service Code": "NOTFOUND",
+    "Copay": "0",
+    "Deductible": "0",
+    "Insurance Payment": "NOTFOUND",
+    "Paid Amount": "NOTFOUND",
+    "Client Responsibility": "NOTFOUND",
+    "Patient Amount": "NOTFOUND",
+    "Adjustments": "NOTFOUND",
+    "Adjustments Amount": "NOTFOUND",
+    "Charged Rate": "NOTFOUND",
+    "Contracted Rate": "NOTFOUND",
+    "Remarks": "",
+    "Claim Number": "NOTFOUND",
+    "ERA Number": "NOTFOUND",
+    "RawText": ""
+}
+
+
+def _is_complete(data: Dict[str, str]) -> bool:
+    """True if a parse has the patient, service code and all four row amounts."""
+    return all(data[field] != "NOTFOUND" for field in _REQUIRED_FIELDS)
+
+
 def _empty_data() -> Dict[str, str]:
     """Return empty data structure for failed extractions."""
-    return {
-        "Client": "NOTFOUND",
-        "Insurance": "NOTFOUND",
-        "Date": "NOTFOUND",
-        "Service Date": "NOTFOUND",
-        "Service Code": "NOTFOUND",
-        "Copay": "0",
-        "Deductible": "0",
-        "Insurance Payment": "NOTFOUND",
-        "Paid Amount": "NOTFOUND",
-        "Client Responsibility": "NOTFOUND",
-        "Patient Amount": "NOTFOUND",
-        "Adjustments": "NOTFOUND",
-        "Adjustments Amount": "NOTFOUND",
-        "Charged Rate": "NOTFOUND",
-        "Contracted Rate": "NOTFOUND",
-        "Remarks": "",
-        "Claim Number": "NOTFOUND",
-        "ERA Number": "NOTFOUND",
-        "RawText": ""
-    }
+    return _EMPTY_DATA.copy()
 
 
 def _parse_era_text(raw_text: str, combined_text: str = "") -> Dict[str, str]:
@@ -291,55 +585,41 @@ def _parse_era_text(raw_text: str, combined_text: str = "") -> Dict[str, str]:
     text_upper = search_text.upper()
     
     # === EXTRACT CLAIM NUMBER ===
-    claim_patterns = [
-        r'CLAIM\s*#?\s*(\d{6,})',
-        r'CLAIM\s*NO\.?\s*(\d{6,})',
-        r'CLM\s*#?\s*(\d{6,})'
-    ]
-    for pattern in claim_patterns:
-        match = re.search(pattern, text_upper)
+    for pattern in _CLAIM_PATTERNS:
+        match = pattern.search(text_upper)
         if match:
             data["Claim Number"] = match.group(1)
             break
     
     # === EXTRACT PATIENT NAME ===
-    patient_patterns = [
-        r'PATIENT[:\s]+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})(?=\s*[-\d]|\s*$)',
-        r'PATIENT[:\s]+([A-Z][a-zA-Z\s]{4,40})(?=\s+\d)',
-        r'PT[:\s]+([A-Z][a-zA-Z\s]{4,40})(?=\s+\d)',
-    ]
-    for pattern in patient_patterns:
-        match = re.search(pattern, search_text, re.IGNORECASE)
+    for pattern in _PATIENT_PATTERNS:
+        match = pattern.search(search_text)
         if match:
             name = match.group(1).strip()
-            name = re.sub(r'\s+', ' ', name)
+            name = _WS_RE.sub(' ', name)
             # Validate: must have at least first and last name
             if len(name.split()) >= 2 and len(name) >= 4:
                 data["Client"] = name
                 break
     
     # === EXTRACT DATE ===
-    date_patterns = [
-        r'(\d{1,2}/\d{1,2}/\d{4})',
-        r'(\d{1,2}-\d{1,2}-\d{4})',
-        r'(\d{4}-\d{1,2}-\d{1,2})'
-    ]
-    for pattern in date_patterns:
-        matches = re.findall(pattern, search_text)
-        if matches:
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(search_text)
+        if match:
             # Prefer dates that look like service dates (recent)
-            data["Date"] = matches[0]
-            data["Service Date"] = matches[0]
+            data["Date"] = match.group(1)
+            data["Service Date"] = match.group(1)
             break
     
     # === EXTRACT SERVICE CODE ===
     # CPT codes: 90xxx for therapy
-    code_match = re.search(r'\b(9\d{4})\b', search_text)
+    code_match = _CPT_RE.search(search_text)
     if code_match:
         data["Service Code"] = code_match.group(1)
     
     # === EXTRACT AMOUNTS (CRITICAL SECTION) ===
-    data = _extract_amounts_advanced(search_text, data)
+    # Split once; the upper-cased lines line up with the originals
+    data = _extract_amounts_advanced(search_text.split('\n'), text_upper.split('\n'), data)
     
     # === EXTRACT REMARK CODES ===
     data["Remarks"] = _extract_remark_codes(text_upper)
@@ -347,44 +627,27 @@ def _parse_era_text(raw_text: str, combined_text: str = "") -> Dict[str, str]:
     return data
 
 
-def _extract_amounts_advanced(text: str, data: Dict) -> Dict:
+def _extract_amounts_advanced(lines: List[str], lines_upper: List[str], data: Dict) -> Dict:
     """
     Advanced amount extraction with context awareness.
     Focuses on the data row with amounts, not random numbers in the text.
     """
     
-    lines = text.split('\n')
-    
     # === STRATEGY: Find the line with Service Date/Code + 4 dollar amounts ===
     # This is the actual data row, not headers or remarks
     
-    for i, line in enumerate(lines):
-        line_upper = line.upper()
-        
-        # Skip header lines
-        if 'CHARGED RATE' in line_upper or 'PATIENT AMOUNT' in line_upper:
-            continue
-        
-        # Skip remark code lines
-        if any(x in line_upper for x in ['PR-', 'CO-', 'OA-', 'PI-', 'CLAIM TOTAL']):
+    for line, line_upper in zip(lines, lines_upper):
+        # Skip header and remark code lines
+        if _SKIP_LINE_RE.search(line_upper):
             continue
         
         # Look for data lines: has date AND service code AND multiple amounts
-        has_date = bool(re.search(r'\d{1,2}[/\-]\d{1,2}[/\-]\d{4}', line))
-        has_service_code = bool(re.search(r'\b9\d{4}\b', line))
-        
-        # Find all amounts on this line (with $)
-        dollar_matches = re.findall(r'\$\s*(\d{1,3}(?:,\d{3})*\.\d{2})', line)
-        paren_matches = re.findall(r'\(\$?\s*(\d{1,3}(?:,\d{3})*\.\d{2})\)', line)
-        
-        # Combine: first all dollar amounts, then parenthetical amounts
-        all_amounts = dollar_matches + paren_matches
+        if not (_LINE_DATE_RE.search(line) or _CPT_RE.search(line)):
+            continue
         
         # If this line has date + service code + 4 amounts, it's the data row
-        if (has_date or has_service_code) and len(all_amounts) >= 4:
-            # Clean amounts
-            amounts_clean = [a.replace(',', '').strip() for a in all_amounts[:4]]
-            
+        amounts_clean = _line_amounts(line)
+        if len(amounts_clean) == 4:
             try:
                 # Validate they're valid numbers
                 vals = [float(a) for a in amounts_clean]
@@ -404,15 +667,11 @@ def _extract_amounts_advanced(text: str, data: Dict) -> Dict:
                 continue
     
     # Fallback: Look for "Claim Totals" line (summary row)
-    for line in lines:
-        if 'CLAIM TOTAL' in line.upper():
-            dollar_matches = re.findall(r'\$\s*(\d{1,3}(?:,\d{3})*\.\d{2})', line)
-            paren_matches = re.findall(r'\(\$?\s*(\d{1,3}(?:,\d{3})*\.\d{2})\)', line)
-            all_amounts = dollar_matches + paren_matches
+    for line, line_upper in zip(lines, lines_upper):
+        if 'CLAIM TOTAL' in line_upper:
+            amounts_clean = _line_amounts(line)
             
-            if len(all_amounts) >= 4:
-                amounts_clean = [a.replace(',', '').strip() for a in all_amounts[:4]]
-                
+            if len(amounts_clean) == 4:
                 try:
                     vals = [float(a) for a in amounts_clean]
                     
@@ -431,19 +690,23 @@ def _extract_amounts_advanced(text: str, data: Dict) -> Dict:
     return data
 
 
+def _line_amounts(line: str) -> List[str]:
+    """First 4 amounts on a line (with $ or in parentheses), in order, commas removed."""
+    return [
+        (match.group(1) or match.group(2)).replace(',', '')
+        for match in islice(_AMOUNT_RE.finditer(line), 4)
+    ]
+
+
 def _extract_remark_codes(text_upper: str) -> str:
     """Extract and format remark codes (PR, CO, OA, PI)."""
     
     # Fix common OCR errors
-    text_fixed = text_upper
-    text_fixed = re.sub(r'\b60-', 'CO-', text_fixed)  # 60 misread as CO
-    text_fixed = re.sub(r'\bPR(\d)', r'PR-\1', text_fixed)
-    text_fixed = re.sub(r'\bCO(\d)', r'CO-\1', text_fixed)
-    text_fixed = re.sub(r'\bOA(\d)', r'OA-\1', text_fixed)
-    text_fixed = re.sub(r'\bPI(\d)', r'PI-\1', text_fixed)
+    text_fixed = _CO_MISREAD_RE.sub('CO-', text_upper)  # 60 misread as CO
+    text_fixed = _GLUED_CODE_RE.sub(r'\1-\2', text_fixed)  # PR3 -> PR-3
     
     # Extract remark codes with descriptions
-    remark_matches = re.findall(r'(PR|CO|OA|PI)-?\s?(\d+)[:\s]*([^$\n]{0,60})', text_fixed)
+    remark_matches = _REMARK_RE.findall(text_fixed)
     
     if remark_matches:
         remarks = []
@@ -466,16 +729,10 @@ def _validate_and_cross_check(data: Dict) -> Dict:
     """
     
     # Validate all dollar amounts are valid numbers
-    amount_fields = [
-        "Charged Rate", "Patient Amount", "Client Responsibility",
-        "Adjustments Amount", "Adjustments", "Insurance Payment",
-        "Paid Amount", "Contracted Rate", "Copay", "Deductible"
-    ]
-    
-    for field in amount_fields:
+    for field in _AMOUNT_FIELDS:
         value = data.get(field, "")
         if value and value != "NOTFOUND":
-            clean = value.replace('$', '').replace(',', '').replace('(', '').replace(')', '').strip()
+            clean = value.translate(_STRIP_TABLE).strip()
             try:
                 float(clean)
                 data[field] = clean
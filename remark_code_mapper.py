@@ -12,8 +12,36 @@ KEY RULES:
 """
 
 from typing import Dict, Optional
+from collections import defaultdict
 import re
 
+# Remark codes like "PR-3", "CO45", "OA-23" (family, number)
+_CODE_RE = re.compile(r'\b(PR|CO|OA|PI)-?(\d+)\b')
+
+# Characters dropped from ERA dollar amounts: "($1,015.00)" -> "1015.00"
+_STRIP_TABLE = str.maketrans("", "", "$,()")
+
+# PR codes with a fixed category: number -> (field, classification label).
+# All of them take the Patient Amount; PR-140 is a denial, where the patient
+# is responsible for the full amount (booked as deductible)
+_PR_CATEGORY = {
+    "3": ("copay", "Copay"),
+    "1": ("deductible", "Deductible"),
+    "2": ("coinsurance", "Coinsurance"),
+    "140": ("deductible", "Denial"),
+}
+
+# Result for a claim with no remark codes and no amounts (the common clean
+# claim); copied per call, with a fresh codes_found list
+_EMPTY_RESULT = {
+    "copay": "",
+    "deductible": "",
+    "coinsurance": "",
+    "provider_adjustment": "",
+    "classification": "No Adjustments",
+    "patient_owes": False,
+}
+
 
 def map_remark_codes(remarks: str, patient_amount: str, adjustment_amount: str = "") -> Dict:
     """
@@ -37,79 +65,72 @@ def map_remark_codes(remarks: str, patient_amount: str, adjustment_amount: str =
             - codes_found: list (all remark codes detected)
     """
     
+    # Nothing to classify
+    if not remarks and not patient_amount and not adjustment_amount:
+        return dict(_EMPTY_RESULT, codes_found=[])
+    
     # Normalize inputs
     remarks = (remarks or "").upper().strip()
     patient_clean = _clean_amount(patient_amount)
     adjustment_clean = _clean_amount(adjustment_amount)
     
+    # Extract all remark codes
+    all_codes = _CODE_RE.findall(remarks)
+    
+    # No codes and no usable amounts: nothing below would change the result
+    if not all_codes and not patient_clean and not adjustment_clean:
+        return dict(_EMPTY_RESULT, codes_found=[])
+    
+    codes_found = [f"{code}-{num}" for code, num in all_codes]
+    
     # Initialize return values
-    copay = ""
-    deductible = ""
-    coinsurance = ""
+    pr_amounts = {"copay": "", "deductible": "", "coinsurance": ""}
     provider_adjustment = ""
     classification = []
     patient_owes = False
     
-    # Extract all remark codes
-    all_codes = re.findall(r'\b(PR|CO|OA|PI)-?(\d+)\b', remarks)
-    codes_found = [f"{code}-{num}" for code, num in all_codes]
-    
-    # Separate PR and CO codes
-    pr_codes = [num for code, num in all_codes if code == "PR"]
-    co_codes = [num for code, num in all_codes if code == "CO"]
-    oa_codes = [num for code, num in all_codes if code == "OA"]
-    pi_codes = [num for code, num in all_codes if code == "PI"]
+    # Separate PR, CO, OA and PI codes in one pass, with leading zeros
+    # stripped once so "03" and "3" compare equal
+    buckets = defaultdict(list)
+    for code, num in all_codes:
+        buckets[code].append(num.lstrip("0") or "0")
+    pr_codes = buckets["PR"]
+    co_codes = buckets["CO"]
+    oa_codes = buckets["OA"]
+    pi_codes = buckets["PI"]
     
     # === CRITICAL FIX: Handle PR codes FIRST (they use Patient Amount) ===
     if pr_codes:
         patient_owes = True
         
         for pr_num in pr_codes:
-            if pr_num in ["3", "03"]:
-                # PR-3: Copayment - uses Patient Amount
-                if patient_clean:
-                    copay = patient_clean
-                    classification.append("Copay (PR-3)")
+            category = _PR_CATEGORY.get(pr_num)
             
-            elif pr_num in ["1", "01"]:
-                # PR-1: Deductible - uses Patient Amount
+            if category:
+                # PR-3/1/2/140 - uses Patient Amount
                 if patient_clean:
-                    deductible = patient_clean
-                    classification.append("Deductible (PR-1)")
-            
-            elif pr_num in ["2", "02"]:
-                # PR-2: Coinsurance - uses Patient Amount
-                if patient_clean:
-                    coinsurance = patient_clean
-                    classification.append("Coinsurance (PR-2)")
-            
-            elif pr_num == "140":
-                # PR-140: Denial - patient responsible for full amount (goes to deductible)
-                if patient_clean:
-                    deductible = patient_clean
-                    classification.append("Denial (PR-140)")
+                    field, label = category
+                    pr_amounts[field] = patient_clean
+                    classification.append(f"{label} (PR-{pr_num})")
             
             else:
                 # Other PR codes - uses Patient Amount
-                if patient_clean and not copay and not deductible:
-                    copay = patient_clean
+                if patient_clean and not pr_amounts["copay"] and not pr_amounts["deductible"]:
+                    pr_amounts["copay"] = patient_clean
                     classification.append(f"Patient Responsibility (PR-{pr_num})")
     
+    copay = pr_amounts["copay"]
+    deductible = pr_amounts["deductible"]
+    coinsurance = pr_amounts["coinsurance"]
+    
     # === CRITICAL FIX: Handle CO codes SEPARATELY (they use Adjustments Amount) ===
     if co_codes:
         # CO adjustments ALWAYS use Adjustments Amount, NOT Patient Amount
         if adjustment_clean:
             provider_adjustment = adjustment_clean
             
-            for co_num in co_codes:
-                if co_num == "45":
-                    classification.append("Provider Write-Off (CO-45)")
-                elif co_num == "38":
-                    classification.append("Provider Write-Off (CO-38)")
-                elif co_num == "11":
-                    classification.append("Provider Write-Off (CO-11)")
-                else:
-                    classification.append(f"Provider Write-Off (CO-{co_num})")
+            # CO-45, CO-38, CO-11 and the rest are all contractual write-offs
+            classification.extend(f"Provider Write-Off (CO-{co_num})" for co_num in co_codes)
         else:
             # Edge case: CO code exists but no adjustment amount found
             classification.append("Provider Write-Off (CO - amount missing)")
@@ -170,7 +191,7 @@ def _clean_amount(amount: str) -> str:
         return ""
     
     # Remove $, commas, parentheses, and whitespace
-    cleaned = amount.replace("$", "").replace(",", "").replace("(", "").replace(")", "").strip()
+    cleaned = amount.translate(_STRIP_TABLE).strip()
     
     # Validate it's a number
     try:
@@ -1,16 +1,86 @@
-import re
+import hashlib
+
+# pyahocorasick is optional - detect_counselor falls back to a substring scan
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Automaton over the last counselor list seen: (tuple of names, automaton,
+# index of the first name that matches any text, or None)
+_COUNSELOR_AC = (None, None, None)
+
+# (tuple of names, [(name, lower-cased, "dr"-stripped)]) for the last list seen
+_COUNSELOR_FORMS = (None, None)
 
 def clean_text(t: str) -> str:
-    t = t.replace("\n", " ")
-    t = re.sub(r"\s+", " ", t)
-    return t.strip()
+    # split() drops every whitespace run (newlines included) and the ends
+    return " ".join(t.split())
 
 def detect_counselor(data: dict, counselor_list):
     """Find counselor name inside extracted data text. Returns name or None."""
-    blob = " ".join(str(v) for v in data.values()).lower()
-    for name in counselor_list:
-        n = name.lower()
-        short = n.replace("dr", "").strip()
-        if n in blob or short in blob:
+    # Each value lower-cased once and scanned on its own - no joined copy
+    # of the whole OCR payload
+    values = [str(v).lower() for v in data.values()]
+
+    if ahocorasick is not None:
+        names = tuple(counselor_list)
+        automaton, always = _counselor_automaton(names)
+        # One pass per value; the earliest name in the list wins, as below
+        hits = [index for v in values for _, index in automaton.iter(v)] if automaton else []
+        if always is not None:
+            hits.append(always)
+        return names[min(hits)] if hits else None
+
+    for name, n, short in _counselor_forms(tuple(counselor_list)):
+        # An empty short form matches anything
+        if not short or any(n in v or short in v for v in values):
             return name
     return None
+
+def _counselor_forms(names: tuple):
+    """Lower-cased and "dr"-stripped form of each name, computed once per list."""
+    global _COUNSELOR_FORMS
+
+    if _COUNSELOR_FORMS[0] != names:
+        forms = []
+        for name in names:
+            n = name.lower()
+            forms.append((name, n, n.replace("dr", "").strip()))
+        _COUNSELOR_FORMS = (names, forms)
+    return _COUNSELOR_FORMS[1]
+
+def _counselor_automaton(names: tuple):
+    """Aho-Corasick automaton over the names and their "dr"-less forms, built once per list."""
+    global _COUNSELOR_AC
+
+    if _COUNSELOR_AC[0] == names:
+        return _COUNSELOR_AC[1], _COUNSELOR_AC[2]
+
+    automaton = ahocorasick.Automaton()
+    always = None
+    for index, name in enumerate(names):
+        n = name.lower()
+        for word in (n, n.replace("dr", "").strip()):
+            if not word:
+                # "" is in every blob
+                always = index if always is None else always
+            elif word not in automaton:
+                # Keep the earliest name for a shared spelling
+                automaton.add_word(word, index)
+
+    if len(automaton):
+        automaton.make_automaton()
+    else:
+        automaton = None
+
+    _COUNSELOR_AC = (names, automaton, always)
+    return automaton, always
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """BLAKE2b hex digest of a file's contents (used as a cache key)."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
@@ -1,34 +1,277 @@
+import docx
 from docx import Document
 from docx.shared import Inches
-import os, datetime, config
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.opc.exceptions import PackageNotFoundError
+from docx.image.exceptions import (
+    InvalidImageStreamError, UnexpectedEndOfFileError, UnrecognizedImageError
+)
+from lxml.etree import XMLSyntaxError
+from zipfile import BadZipFile
+from xml.sax.saxutils import escape
+from PIL import Image
+from io import BytesIO
+from functools import lru_cache
+from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import os, glob, json, datetime, threading, atexit, config
 
-def append_to_word(counselor: str, data: dict, image_path: str = None):
-    """Append claim info to counselor's Word document (one doc per counselor)."""
+# Open counselor documents by path, most recently used last, so appending
+# many claims to the same counselor doesn't re-parse the .docx every time.
+# Each entry is [doc, stamp]; stamp is the file's (mtime, size) as of our
+# last load/save - a file edited elsewhere since is reloaded.
+_DOC_CACHE = OrderedDict()
+_MAX_OPEN = 16
+_DOC_LOCK = threading.Lock()  # guards the module's dicts
+
+# What a failed Word write can raise: file access (OSError), an unreadable
+# or corrupt .docx (BadZipFile/KeyError/PackageNotFoundError), text XML
+# can't hold (ValueError/XMLSyntaxError) - anything else is a bug
+_WRITE_ERRORS = (OSError, ValueError, KeyError, BadZipFile, PackageNotFoundError, XMLSyntaxError)
+
+# ...and what embedding a screenshot can raise (PIL's UnidentifiedImageError
+# is an OSError)
+_PICTURE_ERRORS = (
+    OSError, ValueError, Image.DecompressionBombError,
+    InvalidImageStreamError, UnexpectedEndOfFileError, UnrecognizedImageError,
+)
+
+# One lock per counselor around its queue, journal and document, so
+# different counselors' documents can be written at the same time
+_COUNSELOR_LOCKS = {}
+
+# Claims appended with save=False, by counselor: (data, image_path, added).
+# Each is also journaled to WordFiles/<counselor>.pending.jsonl until it's
+# saved, so a crash doesn't lose it - the next flush() replays the journal.
+_PENDING = {}
+_PENDING_SUFFIX = ".pending.jsonl"
+
+# python-docx's blank template, read once; new counselor documents are
+# opened from these bytes instead of re-reading the file each time
+_TEMPLATE = Path(docx.__file__).parent.joinpath("templates", "default.docx").read_bytes()
+
+# Screenshots are embedded 6" wide; 1200px gives 200 dpi there
+_PICTURE_MAX_WIDTH = 1200
+_PNG_MODES = frozenset({"1", "L", "LA", "I", "P", "RGB", "RGBA"})
+
+# Tabs and line breaks inside a run, as Run.text writes them
+_RUN_BREAKS = str.maketrans({
+    "\t": '</w:t><w:tab/><w:t xml:space="preserve">',
+    "\n": '</w:t><w:br/><w:t xml:space="preserve">',
+    "\r": '</w:t><w:br/><w:t xml:space="preserve">',
+})
+
+def append_to_word(counselor: str, data: dict, image_path: str = None, save: bool = True):
+    """
+    Append claim info to counselor's Word document (one doc per counselor).
+
+    With save=False (or config.WORD_RENDER_ON_DEMAND) the claim is only
+    queued; flush() writes all queued claims for a document with one load
+    and one save (also run at exit).
+    """
+    save = save and not config.WORD_RENDER_ON_DEMAND
+    try:
+        n = datetime.datetime.now()
+        added = f"{n.year:04d}-{n.month:02d}-{n.day:02d} {n.hour:02d}:{n.minute:02d}"
+        with _lock_for(counselor):
+            if save:
+                _pending(counselor).append((data, image_path, added))
+                _flush_one(counselor)
+            else:
+                _queue(counselor, data, image_path, added)
+    except _WRITE_ERRORS as e:
+        print(f"Word write error: {e}")
+
+def flush(counselor: str = None, parallel: bool = True):
+    """
+    Write queued claims for one counselor, or for all (including journals
+    left by a crash). Each counselor's document is independent, so several
+    are loaded/saved side by side unless parallel=False.
+    """
+    if counselor is not None:
+        counselors = [counselor]
+    else:
+        journals = glob.glob(os.path.join(glob.escape(config.WORD_DIR), "*" + _PENDING_SUFFIX))
+        with _DOC_LOCK:
+            counselors = set(_PENDING)
+        counselors |= {os.path.basename(p)[:-len(_PENDING_SUFFIX)] for p in journals}
+
+    if parallel and len(counselors) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(counselors))) as executor:
+            list(executor.map(_flush_safe, counselors))
+    else:
+        for name in counselors:
+            _flush_safe(name)
+
+# No new threads can start once the interpreter is exiting
+atexit.register(flush, parallel=False)
+
+def _lock_for(counselor):
+    with _DOC_LOCK:
+        return _COUNSELOR_LOCKS.setdefault(counselor, threading.Lock())
+
+def _flush_safe(counselor):
     try:
-        folder = config.WORD_DIR
-        os.makedirs(folder, exist_ok=True)
-        path = os.path.join(folder, f"{counselor}.docx")
-        doc = Document(path) if os.path.exists(path) else Document()
-        if not os.path.exists(path):
-            doc.add_heading(f"{counselor} — Claims", level=1)
-        _entry(doc, data, image_path)
-        doc.save(path)
-    except Exception as e:
+        with _lock_for(counselor):
+            _flush_one(counselor)
+    except _WRITE_ERRORS as e:
         print(f"Word write error: {e}")
 
-def _entry(doc, d, image_path):
-    doc.add_paragraph("")
-    doc.add_paragraph(f"Client: {d.get('Client','Unknown')}")
-    doc.add_paragraph(f"Insurance: {d.get('Insurance','N/A')}")
-    doc.add_paragraph(f"Date of Service: {d.get('Date','N/A')}")
-    doc.add_paragraph(f"Client Responsibility: ${d.get('Client Responsibility','0.00')}")
-    doc.add_paragraph(f"Insurance Payment: ${d.get('Insurance Payment','0.00')}")
-    doc.add_paragraph(f"Added: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}")
+def _queue(counselor, data, image_path, added):
+    entries = _pending(counselor)
+    entries.append((data, image_path, added))
+    os.makedirs(config.WORD_DIR, exist_ok=True)
+    with open(_journal_path(counselor), "a", encoding="utf-8") as f:
+        f.write(json.dumps([data, image_path, added], ensure_ascii=False, default=str) + "\n")
+        # The journal is the only copy until the next flush()
+        f.flush()
+        os.fsync(f.fileno())
+
+def _pending(counselor):
+    # First use in this process: pick up claims journaled by an earlier run
+    entries = _PENDING.get(counselor)
+    if entries is None:
+        entries = _PENDING[counselor] = []
+        try:
+            with open(_journal_path(counselor), "r", encoding="utf-8") as f:
+                entries.extend(tuple(json.loads(line)) for line in f if line.strip())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Word journal read error: {e}")
+    return entries
+
+def _flush_one(counselor):
+    entries = _pending(counselor)
+    if not entries:
+        return
+    folder = config.WORD_DIR
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"{counselor}.docx")
+    entry = _get_doc(path, counselor)
+    try:
+        for data, image_path, added in entries:
+            try:
+                _entry(entry[0], data, image_path, added)
+            except (ValueError, XMLSyntaxError) as e:
+                # Text XML can't hold: this claim can never be written, so it
+                # mustn't hold up the rest of the queue
+                print(f"Word write error: {e}")
+        _save(path, entry)
+    except Exception:
+        # The in-memory doc may have entries the file doesn't (and they're
+        # all still queued); reload next time so none is written twice
+        with _DOC_LOCK:
+            _DOC_CACHE.pop(path, None)
+        raise
+    entries.clear()
+    if os.path.exists(_journal_path(counselor)):
+        os.remove(_journal_path(counselor))
+
+def _journal_path(counselor):
+    return os.path.join(config.WORD_DIR, counselor + _PENDING_SUFFIX)
+
+def _get_doc(path, counselor):
+    # One stat() answers both "is the cached copy current?" and "does it exist?"
+    stamp = _stamp(path)
+    with _DOC_LOCK:
+        entry = _DOC_CACHE.get(path)
+        if entry is not None:
+            _DOC_CACHE.move_to_end(path)
+    if entry is not None and entry[1] == stamp:
+        return entry
+
+    if stamp is not None:
+        doc = Document(path)
+    else:
+        doc = Document(BytesIO(_TEMPLATE))
+        doc.add_heading(f"{counselor} — Claims", level=1)
+    entry = [doc, stamp]
+    with _DOC_LOCK:
+        _DOC_CACHE[path] = entry
+        while len(_DOC_CACHE) > _MAX_OPEN:
+            _DOC_CACHE.popitem(last=False)
+    return entry
+
+def _save(path, entry):
+    # Temp file + atomic replace, so an interrupted save never truncates the doc
+    tmp_path = path + ".tmp"
+    try:
+        entry[0].save(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    entry[1] = _stamp(path)
+
+def _stamp(path):
+    st = _stat(path)
+    return (st.st_mtime_ns, st.st_size) if st is not None else None
+
+def _stat(path):
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+def _entry(doc, d, image_path, added):
+    get = d.get
+    client = get('Client', 'Unknown')
+    insurance = get('Insurance', 'N/A')
+    service_date = get('Date', 'N/A')
+    client_resp = get('Client Responsibility', '0.00')
+    insurance_paid = get('Insurance Payment', '0.00')
+    _add_paragraphs(doc, (
+        "",
+        f"Client: {client}",
+        f"Insurance: {insurance}",
+        f"Date of Service: {service_date}",
+        f"Client Responsibility: ${client_resp}",
+        f"Insurance Payment: ${insurance_paid}",
+        f"Added: {added}",
+    ))
     
-    # Add screenshot if provided
-    if image_path and os.path.exists(image_path):
+    # Add screenshot if provided (one stat: existence check and cache key)
+    st = _stat(image_path) if image_path else None
+    if st is not None:
         try:
             doc.add_paragraph("Screenshot:")
-            doc.add_picture(image_path, width=Inches(6.0))
-        except Exception as e:
+            picture = _picture_bytes(image_path, st.st_mtime_ns)
+            doc.add_picture(BytesIO(picture), width=Inches(6.0))
+        except _PICTURE_ERRORS as e:
             doc.add_paragraph(f"(Could not embed image: {e})")
+
+def _add_paragraphs(doc, lines):
+    # Same <w:p> elements doc.add_paragraph() builds, parsed from one XML
+    # string instead of going through the Paragraph/Run API line by line,
+    # and placed before the section properties as add_paragraph() does
+    xml = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(str(line)).translate(_RUN_BREAKS)}</w:t></w:r></w:p>'
+        if line else "<w:p/>"
+        for line in lines
+    )
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for p in list(parse_xml(f"<w:body {nsdecls('w')}>{xml}</w:body>")):
+        if sect_pr is not None:
+            sect_pr.addprevious(p)
+        else:
+            body.append(p)
+
+@lru_cache(maxsize=64)
+def _picture_bytes(image_path, mtime_ns):
+    # Decoded and downscaled once per screenshot version (mtime_ns is part
+    # of the key), however many counselors/claims embed it. PNG keeps
+    # the ERA text sharp; small PNG/JPEG files are embedded as they are
+    with Image.open(image_path) as img:
+        if img.width <= _PICTURE_MAX_WIDTH and img.format in ("PNG", "JPEG"):
+            with open(image_path, "rb") as f:
+                return f.read()
+        if img.mode not in _PNG_MODES:
+            img = img.convert("RGB")
+        img.thumbnail((_PICTURE_MAX_WIDTH, img.height))
+        out = BytesIO()
+        img.save(out, "PNG", optimize=True)
+        return out.getvalue()